@@ -5,6 +5,8 @@ Calculadoras para Reynolds, Darcy-Weisbach e Manning
 
 import streamlit as st
 import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
 import sys
 import os
 
@@ -14,10 +16,16 @@ sys.path.insert(0, base_dir)
 
 from utils.calculations import (
     calcular_reynolds,
+    calcular_reynolds_array,
+    rotulos_regime,
+    REGIMES_ESCOAMENTO,
     calcular_fator_atrito_colebrook,
     calcular_perda_carga_darcy_weisbach,
     calcular_manning_canal
 )
+from utils.drenagem import dimensionar_rede_pluvial, IDF_PADRAO
+from utils.propriedades_fluidos import TABELAS_FLUIDOS, propriedades_fluido, calcular_reynolds_temperatura
+from utils.bombas import curva_sistema, expandir_rotores, selecionar_bombas, avaliar_polinomios
 
 def show_teoria():
     """Aba de teoria expandida do módulo de Fluidos"""
@@ -356,21 +364,48 @@ def show_teoria():
             **✅ Resultado:** Altura da lâmina d'água = 1.85 m
             """)
 
+def _entrada_propriedades_fluido(chave):
+    """Entrada de ρ e μ: manual ou interpolada da tabela do fluido pela temperatura (fluido None se manual)"""
+    origem = st.radio("Propriedades do Fluido", ["Pela Temperatura", "Manual"], horizontal=True, key=f"origem_{chave}")
+    
+    if origem == "Pela Temperatura":
+        col1, col2 = st.columns(2)
+        with col1:
+            fluido = st.selectbox("Fluido", list(TABELAS_FLUIDOS),
+                                  format_func=lambda f: TABELAS_FLUIDOS[f]['nome'], key=f"fluido_{chave}")
+        tabela = TABELAS_FLUIDOS[fluido]
+        with col2:
+            temperatura = st.number_input("Temperatura T (°C)",
+                                          min_value=float(tabela['temperatura'][0]),
+                                          max_value=float(tabela['temperatura'][-1]),
+                                          value=20.0, step=1.0, key=f"temperatura_{chave}")
+        prop = propriedades_fluido(temperatura, fluido)
+        densidade = float(prop['densidade'])
+        viscosidade = float(prop['viscosidade'])
+        st.caption(f"ρ = {densidade:.2f} kg/m³ | μ = {viscosidade:.4e} Pa.s")
+    else:
+        fluido = None
+        col1, col2 = st.columns(2)
+        with col1:
+            densidade = st.number_input("Densidade ρ (kg/m³)", min_value=0.1, value=1000.0, step=10.0,
+                                        help="Água: 1000 kg/m³", key=f"densidade_{chave}")
+        with col2:
+            viscosidade = st.number_input("Viscosidade Dinâmica μ (Pa.s)", min_value=1e-6, value=0.001, step=0.0001,
+                                          format="%.6f", help="Água a 20°C: 0.001 Pa.s", key=f"viscosidade_{chave}")
+    
+    return densidade, viscosidade, fluido
+
 def show_calculadora_reynolds():
     """Calculadora de Reynolds"""
     st.subheader("🌊 Calculadora de Reynolds & Regime")
     
-    col1, col2 = st.columns(2)
-    with col1:
-        densidade = st.number_input("Densidade ρ (kg/m³)", min_value=1.0, value=1000.0, step=10.0, help="Água: 1000 kg/m³")
-    with col2:
-        velocidade = st.number_input("Velocidade V (m/s)", min_value=0.01, value=1.0, step=0.1)
+    densidade, viscosidade, fluido = _entrada_propriedades_fluido("reynolds")
     
     col1, col2 = st.columns(2)
     with col1:
-        diametro = st.number_input("Diâmetro D (m)", min_value=0.001, value=0.1, step=0.01)
+        velocidade = st.number_input("Velocidade V (m/s)", min_value=0.01, value=1.0, step=0.1)
     with col2:
-        viscosidade = st.number_input("Viscosidade Dinâmica μ (Pa.s)", min_value=1e-6, value=0.001, step=0.0001, format="%.6f", help="Água a 20°C: 0.001 Pa.s")
+        diametro = st.number_input("Diâmetro D (m)", min_value=0.001, value=0.1, step=0.01)
     
     if st.button("Calcular Reynolds", type="primary"):
         resultado = calcular_reynolds(densidade, velocidade, diametro, viscosidade)
@@ -395,6 +430,42 @@ def show_calculadora_reynolds():
         viscosidade_cinematica = viscosidade / densidade
         st.write(f"**Viscosidade Cinemática:** $\\nu = {viscosidade_cinematica:.6f}$ m²/s")
         st.write(f"**Reynolds:** $Re = \\frac{{{densidade:.1f} \\times {velocidade:.2f} \\times {diametro:.3f}}}{{{viscosidade:.6f}}} = {resultado['Re']:.2f}$")
+    
+    st.markdown("---")
+    with st.expander("📂 Processamento em Lote (CSV)", expanded=False):
+        st.markdown("""
+        Arquivo com a coluna **V** (velocidade, m/s) e, opcionalmente, **D** (diâmetro, m) e 
+        **T** (temperatura, °C). Sem a coluna T, as propriedades do fluido são as definidas acima; 
+        com ela, ρ e μ são interpolados por leitura na tabela do fluido selecionado.
+        """)
+        arquivo = st.file_uploader("Leituras de vazão (CSV)", type=["csv"], key="lote_reynolds")
+        if arquivo is not None:
+            df = pd.read_csv(arquivo)
+            D = df['D'].to_numpy(float) if 'D' in df else diametro
+            try:
+                if 'T' in df:
+                    if fluido is None:
+                        raise ValueError("A coluna T exige as propriedades do fluido 'Pela Temperatura'")
+                    Re, codigo = calcular_reynolds_temperatura(df['V'].to_numpy(float), D, df['T'].to_numpy(float), fluido)
+                else:
+                    Re, codigo = calcular_reynolds_array(densidade, df['V'].to_numpy(float), D, viscosidade)
+            except ValueError as e:
+                st.error(f"Erro: {e}")
+                return
+            
+            contagem = np.bincount(codigo[codigo >= 0], minlength=len(REGIMES_ESCOAMENTO))
+            col1, col2, col3 = st.columns(3)
+            for col, rotulo, n in zip((col1, col2, col3), REGIMES_ESCOAMENTO, contagem):
+                with col:
+                    st.metric(rotulo, f"{n}", f"{100 * n / max(len(Re), 1):.1f}%")
+            invalidas = int((codigo < 0).sum())
+            if invalidas:
+                st.warning(f"⚠️ {invalidas} leitura(s) sem valor válido de Re (células em branco ou inválidas)")
+            
+            df['Re'] = Re
+            df['Regime'] = rotulos_regime(codigo)
+            st.dataframe(df.head(1000), use_container_width=True)
+            st.download_button("Baixar Resultados (CSV)", df.to_csv(index=False), file_name="reynolds_lote.csv")
 
 def show_calculadora_darcy_weisbach():
     """Calculadora de perda de carga Darcy-Weisbach"""
@@ -409,15 +480,11 @@ def show_calculadora_darcy_weisbach():
     col1, col2 = st.columns(2)
     with col1:
         velocidade = st.number_input("Velocidade V (m/s)", min_value=0.01, value=2.0, step=0.1)
-    with col2:
-        densidade = st.number_input("Densidade ρ (kg/m³)", min_value=1.0, value=1000.0, step=10.0)
-    
-    col1, col2 = st.columns(2)
-    with col1:
-        viscosidade = st.number_input("Viscosidade μ (Pa.s)", min_value=1e-6, value=0.001, step=0.0001, format="%.6f")
     with col2:
         rugosidade_abs = st.number_input("Rugosidade Absoluta ε (mm)", min_value=0.001, value=0.045, step=0.01, help="Aço comercial: 0.045 mm")
     
+    densidade, viscosidade, _ = _entrada_propriedades_fluido("darcy")
+    
     metodo = st.selectbox("Método para fator de atrito", ["Colebrook-White", "Haaland"])
     
     if st.button("Calcular Perda de Carga", type="primary"):
@@ -527,6 +594,205 @@ def show_calculadora_manning():
             elif resultado['velocidade'] < 0.3:
                 st.info("ℹ️ Velocidade baixa. Risco de assoreamento.")
 
+def show_calculadora_drenagem():
+    """Calculadora de rede de drenagem pluvial (Método Racional)"""
+    st.subheader("🌧️ Rede de Drenagem Pluvial - Método Racional")
+    
+    st.markdown("""
+    ### 🎯 Como Usar
+    
+    Cada linha é um trecho da rede. A coluna **Jusante** indica o número do trecho que recebe a vazão 
+    (0 ou vazio para o exutório). Carregue um CSV com as mesmas colunas para redes grandes.
+    """)
+    
+    arquivo = st.file_uploader("Arquivo CSV da rede (opcional)", type=["csv"])
+    if arquivo is not None:
+        df_rede = pd.read_csv(arquivo)
+    else:
+        df_rede = pd.DataFrame({
+            'Trecho': [1, 2, 3, 4, 5],
+            'Jusante': [3, 3, 5, 5, 0],
+            'Área (ha)': [1.2, 0.8, 1.5, 2.0, 0.6],
+            'C': [0.70, 0.70, 0.65, 0.60, 0.75],
+            'L (m)': [80.0, 65.0, 100.0, 120.0, 90.0],
+            'S (m/m)': [0.010, 0.012, 0.008, 0.006, 0.005]
+        })
+        df_rede = st.data_editor(df_rede, num_rows="dynamic", use_container_width=True)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        n_manning = st.number_input("Coeficiente de Manning n", min_value=0.009, value=0.013, step=0.001, format="%.3f")
+        tempo_entrada = st.number_input("Tempo de entrada (min)", min_value=1.0, value=10.0, step=1.0)
+    with col2:
+        periodo_retorno = st.number_input("Período de retorno T (anos)", min_value=1.0, value=10.0, step=1.0)
+        lamina_max = st.number_input("Lâmina máxima y/D", min_value=0.5, max_value=0.93, value=0.85, step=0.05)
+    with col3:
+        with st.expander("Equação IDF: i = K·T^a / (t + b)^c"):
+            idf = {
+                'K': st.number_input("K", value=IDF_PADRAO['K']),
+                'a': st.number_input("a", value=IDF_PADRAO['a'], format="%.3f"),
+                'b': st.number_input("b", value=IDF_PADRAO['b']),
+                'c': st.number_input("c", value=IDF_PADRAO['c'], format="%.3f")
+            }
+    
+    if st.button("Dimensionar Rede", type="primary"):
+        trechos = df_rede['Trecho'].to_numpy()
+        posicao = {t: i for i, t in enumerate(trechos)}
+        # Exutório apenas com 0 ou célula vazia; outros ids desconhecidos indicam erro de digitação
+        exutorio = [pd.isna(j) or str(j).strip() in ('', '0', '0.0') for j in df_rede['Jusante']]
+        desconhecidos = [j for j, saida in zip(df_rede['Jusante'], exutorio) if not saida and j not in posicao]
+        if desconhecidos:
+            st.error(f"Erro: trechos de jusante inexistentes: {', '.join(f'{j:g}' if isinstance(j, float) else str(j) for j in desconhecidos)}")
+            return
+        try:
+            pai = np.array([-1 if saida else posicao[j] for j, saida in zip(df_rede['Jusante'], exutorio)])
+            resultado = dimensionar_rede_pluvial(
+                pai,
+                df_rede['Área (ha)'].to_numpy(float),
+                df_rede['C'].to_numpy(float),
+                df_rede['L (m)'].to_numpy(float),
+                df_rede['S (m/m)'].to_numpy(float),
+                n_manning=n_manning,
+                tempo_entrada=tempo_entrada,
+                periodo_retorno=periodo_retorno,
+                idf=idf,
+                lamina_max=lamina_max
+            )
+        except ValueError as e:
+            st.error(f"Erro: {e}")
+            return
+        
+        st.markdown("### ✅ Resultados")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Trechos", f"{len(trechos)}")
+        with col2:
+            st.metric("Vazão no Exutório", f"{resultado['vazao'][pai < 0].sum():.3f} m³/s")
+        with col3:
+            st.metric("Maior Diâmetro", f"{resultado['diametro'].max():.2f} m")
+        
+        df_res = pd.DataFrame({
+            'Trecho': trechos,
+            'Área Acum. (ha)': resultado['area_acumulada'].round(2),
+            'tc (min)': resultado['tempo_concentracao'].round(2),
+            'i (mm/h)': resultado['intensidade'].round(1),
+            'Q (m³/s)': resultado['vazao'].round(3),
+            'D (m)': resultado['diametro'],
+            'y/D': resultado['lamina'].round(3),
+            'V (m/s)': resultado['velocidade'].round(2)
+        })
+        st.dataframe(df_res, use_container_width=True)
+        
+        if resultado['capacidade_insuficiente'].any():
+            st.error(f"❌ {resultado['capacidade_insuficiente'].sum()} trecho(s) excedem o maior diâmetro do catálogo.")
+        if (resultado['velocidade'] > 5.0).any():
+            st.warning("⚠️ Há trechos com velocidade acima de 5.0 m/s. Risco de erosão.")
+        if (resultado['velocidade'] < 0.6).any():
+            st.info("ℹ️ Há trechos com velocidade abaixo de 0.6 m/s. Risco de assoreamento.")
+
+def _catalogo_bombas_exemplo(n_modelos=400):
+    """Catálogo sintético para demonstração (curvas quadráticas em m³/s)"""
+    rng = np.random.default_rng(42)
+    H0 = rng.uniform(15, 90, n_modelos)
+    Q_max = rng.uniform(0.01, 0.25, n_modelos)
+    Q_bep = Q_max * rng.uniform(0.55, 0.7, n_modelos)
+    eta_bep = rng.uniform(0.60, 0.86, n_modelos)
+    return pd.DataFrame({
+        'Modelo': [f"ATL-{i:03d}" for i in range(n_modelos)],
+        'H0': H0,
+        'H1': np.zeros(n_modelos),
+        'H2': -0.6 * H0 / Q_max**2,
+        'E0': np.zeros(n_modelos),
+        'E1': 2 * eta_bep / Q_bep,
+        'E2': -eta_bep / Q_bep**2,
+        'Qmax': Q_max
+    })
+
+def show_calculadora_bombas():
+    """Seleção de bombas por interseção com a curva do sistema"""
+    st.subheader("⚙️ Seleção de Bombas Centrífugas")
+    
+    st.markdown("""
+    ### 🎯 Como Usar
+    
+    Defina a tubulação para gerar a curva do sistema. O catálogo (CSV) deve ter as colunas 
+    **Modelo, H0, H1, H2, E0, E1, E2, Qmax**, com $H(Q) = H_0 + H_1 Q + H_2 Q^2$ e 
+    $\\eta(Q) = E_0 + E_1 Q + E_2 Q^2$ (Q em m³/s, η em fração). Sem arquivo, um catálogo de exemplo é usado.
+    """)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        altura_estatica = st.number_input("Desnível Geométrico Hg (m)", min_value=0.0, value=25.0, step=1.0)
+        comprimento = st.number_input("Comprimento L (m)", min_value=1.0, value=500.0, step=10.0)
+    with col2:
+        diametro = st.number_input("Diâmetro D (m)", min_value=0.01, value=0.20, step=0.01)
+        rugosidade_abs = st.number_input("Rugosidade Absoluta ε (mm)", min_value=0.001, value=0.045, step=0.01)
+    with col3:
+        soma_k = st.number_input("Soma dos K localizados", min_value=0.0, value=5.0, step=0.5)
+        vazao_projeto = st.number_input("Vazão de Projeto (m³/h)", min_value=1.0, value=180.0, step=5.0)
+    
+    arquivo = st.file_uploader("Catálogo de bombas (CSV)", type=["csv"])
+    catalogo = pd.read_csv(arquivo) if arquivo is not None else _catalogo_bombas_exemplo()
+    razoes = st.multiselect("Razões de diâmetro do rotor D2/D1", [1.0, 0.95, 0.90, 0.85, 0.80], default=[1.0, 0.95, 0.90, 0.85])
+    
+    if st.button("Selecionar Bombas", type="primary"):
+        if not razoes:
+            st.error("Erro: selecione ao menos um diâmetro de rotor")
+            return
+        
+        Q_sis = np.linspace(0, 1.5 * catalogo['Qmax'].max(), 400)
+        H_sis = curva_sistema(Q_sis, altura_estatica, comprimento, diametro,
+                              (rugosidade_abs / 1000) / diametro, soma_k_localizadas=soma_k)
+        
+        cat = expandir_rotores(catalogo[['H0', 'H1', 'H2']].to_numpy(float),
+                               catalogo[['E0', 'E1', 'E2']].to_numpy(float),
+                               catalogo['Qmax'].to_numpy(float), razoes)
+        resultado = selecionar_bombas(cat['coef_altura'], cat['coef_rendimento'], cat['vazao_max'],
+                                      Q_sis, H_sis, vazao_minima=vazao_projeto / 3600)
+        
+        ranking = resultado['ranking']
+        st.markdown("### ✅ Resultados")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Curvas Avaliadas", f"{len(cat['modelo'])}")
+        with col2:
+            st.metric("Candidatas", f"{len(ranking)}")
+        
+        if len(ranking) == 0:
+            st.warning("⚠️ Nenhuma bomba do catálogo atende à vazão de projeto neste sistema.")
+            return
+        
+        top = ranking[:10]
+        df = pd.DataFrame({
+            'Modelo': catalogo['Modelo'].to_numpy()[cat['modelo'][top]],
+            'D2/D1': cat['razao'][top],
+            'Q (m³/h)': (resultado['vazao'][top] * 3600).round(1),
+            'H (m)': resultado['altura'][top].round(2),
+            'η (%)': (resultado['rendimento'][top] * 100).round(1),
+            'Potência (kW)': resultado['potencia'][top].round(2)
+        })
+        st.dataframe(df, use_container_width=True)
+        
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=Q_sis * 3600, y=H_sis, mode='lines', name='Sistema',
+                                 line=dict(color='black', width=3)))
+        for i in top[:3]:
+            Q = np.linspace(0, cat['vazao_max'][i], 100)
+            H = avaliar_polinomios(np.repeat(cat['coef_altura'][i:i + 1], Q.size, axis=0), Q)
+            fig.add_trace(go.Scatter(x=Q * 3600, y=H, mode='lines',
+                                     name=f"{catalogo['Modelo'].iloc[cat['modelo'][i]]} ({cat['razao'][i]:.2f})"))
+        fig.add_trace(go.Scatter(x=resultado['vazao'][top[:3]] * 3600, y=resultado['altura'][top[:3]],
+                                 mode='markers', name='Pontos de Operação',
+                                 marker=dict(size=10, color='red', symbol='diamond')))
+        fig.update_layout(
+            title="Curva do Sistema x Curvas das Bombas",
+            xaxis_title="Vazão Q (m³/h)",
+            yaxis_title="Altura Manométrica H (m)",
+            height=500,
+            yaxis=dict(range=[0, 1.2 * max(resultado['altura'][top[:3]].max(), altura_estatica)])
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
 def show():
     """Função principal do módulo de Fluidos"""
     st.title("💧 Módulo de Fluidos & Hidráulica")
@@ -545,7 +811,7 @@ def show():
     with tab_calc:
         calc_tab = st.radio(
             "Selecione a Calculadora:",
-            ["Reynolds & Regime", "Darcy-Weisbach", "Manning"],
+            ["Reynolds & Regime", "Darcy-Weisbach", "Manning", "Drenagem Pluvial", "Seleção de Bombas"],
             horizontal=True
         )
         
@@ -557,4 +823,8 @@ def show():
             show_calculadora_darcy_weisbach()
         elif calc_tab == "Manning":
             show_calculadora_manning()
+        elif calc_tab == "Drenagem Pluvial":
+            show_calculadora_drenagem()
+        elif calc_tab == "Seleção de Bombas":
+            show_calculadora_bombas()
 
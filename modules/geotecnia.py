@@ -5,6 +5,8 @@ Mecânica dos Solos e Fundações
 
 import streamlit as st
 import numpy as np
+import plotly.graph_objects as go
+import pandas as pd
 import sys
 import os
 
@@ -12,7 +14,17 @@ import os
 base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, base_dir)
 
-from utils.plotting import plot_circulo_mohr
+from utils.plotting import plot_circulo_mohr, plot_contorno_tensoes, plot_curvas_granulometricas, plot_envoltoria_mohr, plot_rede_fluxo
+from utils.calculations import calcular_capacidade_carga_terzaghi, FATORES_FORMA_TERZAGHI
+from utils.fundacoes import calcular_capacidade_carga_geral
+from utils.adensamento import simular_adensamento
+from utils.taludes import geometria_talude, buscar_circulo_critico, fator_seguranca_bishop
+from utils.tensoes import superpor_tensoes, recalque_edometrico
+from utils.solos import classificar_sucs, processar_granulometria, DESCRICOES_SUCS
+from utils.resistencia import ajustar_mohr_coulomb, ajustar_cisalhamento_direto
+from utils.percolacao import resolver_percolacao, modelo_fundacao, gradiente_saida, funcao_corrente
+from utils.muros import otimizar_muro
+from utils.estacas import SOLOS_SPT, TIPOS_ESTACA, sondagens_para_arrays, capacidade_estacas_spt
 
 def show_teoria():
     """Aba de teoria expandida do módulo de Geotecnia"""
@@ -564,6 +576,77 @@ def show_calculadora_mohr():
         **Raio:** $R = \\sqrt{{\\left(\\frac{{{sigma_x} - {sigma_y}}}{{2}}\\right)^2 + {tau_xy}^2}} = {np.sqrt(((sigma_x - sigma_y)/2)**2 + tau_xy**2):.2f}$ kPa
         """)
 
+def show_calculadora_envoltoria():
+    """Ajuste da envoltória de Mohr-Coulomb a partir de ensaios"""
+    st.subheader("📐 Envoltória de Resistência (Mohr-Coulomb)")
+    
+    st.markdown("""
+    ### 🎯 Como Usar
+    
+    Informe os resultados na ruptura de uma série de ensaios (ou carregue um CSV com as mesmas colunas).
+    Os intervalos de confiança de c e φ são obtidos por bootstrap (reamostragem dos ensaios).
+    """)
+    
+    tipo_ensaio = st.radio("Tipo de Ensaio", ["Triaxial", "Cisalhamento Direto"], horizontal=True)
+    colunas = ['σ3 (kPa)', 'σ1 (kPa)'] if tipo_ensaio == "Triaxial" else ['σn (kPa)', 'τ (kPa)']
+    
+    arquivo = st.file_uploader("Ensaios (CSV)", type=["csv"], key="ensaios_resistencia")
+    if arquivo is not None:
+        ensaios = pd.read_csv(arquivo)
+    else:
+        if tipo_ensaio == "Triaxial":
+            ensaios = pd.DataFrame({colunas[0]: [50.0, 100.0, 200.0, 400.0], colunas[1]: [205.0, 345.0, 650.0, 1240.0]})
+        else:
+            ensaios = pd.DataFrame({colunas[0]: [50.0, 100.0, 200.0, 400.0], colunas[1]: [45.0, 72.0, 128.0, 240.0]})
+        ensaios = st.data_editor(ensaios, num_rows="dynamic", use_container_width=True, key=f"ensaios_{tipo_ensaio}")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        n_bootstrap = st.number_input("Reamostragens Bootstrap", min_value=100, max_value=100000, value=5000, step=500)
+    with col2:
+        nivel = st.slider("Nível de Confiança (%)", min_value=80, max_value=99, value=95)
+    
+    if st.button("Ajustar Envoltória", type="primary"):
+        try:
+            dados = ensaios[colunas].dropna().to_numpy(float)
+            if tipo_ensaio == "Triaxial":
+                resultado = ajustar_mohr_coulomb(dados[:, 0], dados[:, 1], int(n_bootstrap), nivel / 100)
+            else:
+                resultado = ajustar_cisalhamento_direto(dados[:, 0], dados[:, 1], int(n_bootstrap), nivel / 100)
+        except (ValueError, KeyError) as e:
+            st.error(f"Erro: {e}")
+            return
+        
+        st.markdown("### ✅ Resultados")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Coesão c", f"{resultado['c']:.1f} kPa")
+            st.caption(f"IC {nivel}%: {resultado['ic_c'][0]:.1f} a {resultado['ic_c'][1]:.1f} kPa")
+        with col2:
+            st.metric("Ângulo de Atrito φ", f"{resultado['phi']:.1f}°")
+            st.caption(f"IC {nivel}%: {resultado['ic_phi'][0]:.1f}° a {resultado['ic_phi'][1]:.1f}°")
+        with col3:
+            st.metric("R²", f"{resultado['R2']:.4f}")
+        
+        if tipo_ensaio == "Triaxial":
+            fig = plot_envoltoria_mohr(dados[:, 0], dados[:, 1], resultado['c'], resultado['phi'])
+        else:
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(x=dados[:, 0], y=dados[:, 1], mode='markers', name='Ensaios',
+                                     marker=dict(size=10, color='blue')))
+            sigma_max = dados[:, 0].max() * 1.1
+            fig.add_trace(go.Scatter(x=[0, sigma_max], y=[resultado['c'], resultado['c'] + sigma_max * np.tan(np.radians(resultado['phi']))],
+                                     mode='lines', name='Envoltória', line=dict(color='red', width=3)))
+            fig.update_layout(title="Envoltória de Resistência", xaxis_title="Tensão Normal σn (kPa)",
+                              yaxis_title="Tensão de Cisalhamento τ (kPa)", height=500, template='plotly_white')
+        st.plotly_chart(fig, use_container_width=True)
+        
+        fig2 = go.Figure(go.Histogram2d(x=resultado['phi_bootstrap'], y=resultado['c_bootstrap'],
+                                        colorscale='Blues', nbinsx=40, nbinsy=40))
+        fig2.update_layout(title="Distribuição Bootstrap de (φ, c)", xaxis_title="φ (°)", yaxis_title="c (kPa)",
+                           height=450, template='plotly_white')
+        st.plotly_chart(fig2, use_container_width=True)
+
 def show_calculadora_classificacao():
     """Calculadora de classificação de solos"""
     st.subheader("🏔️ Classificação de Solos (SUCS)")
@@ -572,9 +655,10 @@ def show_calculadora_classificacao():
     ### 🎯 Como Usar
     
     Insira os dados do solo para obter a classificação segundo o Sistema Unificado de Classificação de Solos (SUCS).
+    Cu e Cc são necessários apenas para solos grossos com menos de 12% de finos.
     """)
     
-    col1, col2 = st.columns(2)
+    col1, col2, col3 = st.columns(3)
     
     with col1:
         LL = st.number_input("Limite de Liquidez LL (%)", min_value=0.0, value=40.0, step=1.0)
@@ -584,59 +668,14 @@ def show_calculadora_classificacao():
         p200 = st.number_input("Percentual passando na peneira #200 (%)", min_value=0.0, max_value=100.0, value=55.0, step=1.0)
         p4 = st.number_input("Percentual passando na peneira #4 (%)", min_value=0.0, max_value=100.0, value=80.0, step=1.0)
     
+    with col3:
+        Cu = st.number_input("Coeficiente de Uniformidade Cu", min_value=0.0, value=5.0, step=0.5)
+        Cc = st.number_input("Coeficiente de Curvatura Cc", min_value=0.0, value=1.0, step=0.1)
+    
     if st.button("Classificar Solo", type="primary"):
-        IP = LL - LP
-        
-        # Determinar se é grosso ou fino
-        if p200 < 50:
-            # Solo grosso
-            if p4 < 50:
-                simbolo_base = "G"  # Gravel
-            else:
-                simbolo_base = "S"  # Sand
-            
-            # Determinar modificador
-            if p200 < 5:
-                if p4 < 50:
-                    # Gravel bem ou mal graduado
-                    Cu = st.number_input("Coeficiente de Uniformidade Cu", value=5.0, key="Cu")
-                    Cc = st.number_input("Coeficiente de Curvatura Cc", value=1.0, key="Cc")
-                    if Cu > 4 and 1 <= Cc <= 3:
-                        modificador = "W"  # Well-graded
-                    else:
-                        modificador = "P"  # Poorly-graded
-                else:
-                    # Sand bem ou mal graduado
-                    if p200 < 5:
-                        modificador = "W" if p4 > 50 else "P"
-                    else:
-                        modificador = "P"
-            else:
-                # Com finos
-                if LL < 50 and IP < 4:
-                    modificador = "M"  # Silty
-                elif LL >= 50 or IP >= 7:
-                    modificador = "C"  # Clayey
-                else:
-                    modificador = "M"
-            
-            classificacao = f"{simbolo_base}{modificador}"
-        else:
-            # Solo fino
-            # Verificar na carta de plasticidade
-            linha_A = 0.73 * (LL - 20)
-            
-            if IP > linha_A:
-                simbolo_base = "C"  # Clay
-            else:
-                simbolo_base = "M"  # Silt
-            
-            if LL < 50:
-                modificador = "L"  # Low plasticity
-            else:
-                modificador = "H"  # High plasticity
-            
-            classificacao = f"{simbolo_base}{modificador}"
+        resultado = classificar_sucs(LL, LP, p200, p4, Cu, Cc)
+        classificacao = str(resultado['simbolo'])
+        IP = float(resultado['IP'])
         
         st.markdown("### ✅ Resultado da Classificação")
         st.success(f"**Classificação SUCS: {classificacao}**")
@@ -649,30 +688,142 @@ def show_calculadora_classificacao():
         with col2:
             st.metric("Percentual Fino", f"{p200:.1f}%")
         with col3:
-            if p200 >= 50:
-                linha_A = 0.73 * (LL - 20)
-                st.metric("Linha A (IP)", f"{linha_A:.1f}%")
-        
-        # Descrição
-        descricoes = {
-            "GW": "Pedregulho bem graduado",
-            "GP": "Pedregulho mal graduado",
-            "GM": "Pedregulho com finos siltosos",
-            "GC": "Pedregulho com finos argilosos",
-            "SW": "Areia bem graduada",
-            "SP": "Areia mal graduada",
-            "SM": "Areia com finos siltosos",
-            "SC": "Areia com finos argilosos",
-            "ML": "Silte de baixa plasticidade",
-            "MH": "Silte de alta plasticidade",
-            "CL": "Argila de baixa plasticidade",
-            "CH": "Argila de alta plasticidade",
-            "OL": "Solo orgânico de baixa plasticidade",
-            "OH": "Solo orgânico de alta plasticidade"
-        }
-        
-        if classificacao in descricoes:
-            st.info(f"**Descrição:** {descricoes[classificacao]}")
+            st.metric("Linha A (IP)", f"{float(resultado['linha_A']):.1f}%")
+        
+        if classificacao in DESCRICOES_SUCS:
+            st.info(f"**Descrição:** {DESCRICOES_SUCS[classificacao]}")
+    
+    with st.expander("📂 Classificação em Lote (CSV / Excel)", expanded=False):
+        st.markdown("""
+        Planilha com as colunas **LL**, **LP**, **P200** e **P4** e, opcionalmente, **Cu** e **Cc**.
+        Limites em branco são tratados como solo não plástico (NP).
+        """)
+        arquivo = st.file_uploader("Amostras de laboratório", type=["csv", "xlsx"], key="lote_sucs")
+        if arquivo is not None:
+            try:
+                df = pd.read_excel(arquivo) if arquivo.name.endswith(".xlsx") else pd.read_csv(arquivo)
+                faltando = [col for col in ("LL", "LP", "P200", "P4") if col not in df]
+                if faltando:
+                    raise ValueError(f"Colunas ausentes: {', '.join(faltando)}")
+                
+                resultado = classificar_sucs(
+                    df['LL'].to_numpy(float), df['LP'].to_numpy(float),
+                    df['P200'].to_numpy(float), df['P4'].to_numpy(float),
+                    df['Cu'].to_numpy(float) if 'Cu' in df else None,
+                    df['Cc'].to_numpy(float) if 'Cc' in df else None
+                )
+            except (ValueError, ImportError) as e:
+                st.error(f"Erro: {e}")
+                return
+            
+            df['IP'] = resultado['IP']
+            df['SUCS'] = resultado['simbolo']
+            
+            contagem = df['SUCS'].value_counts()
+            indeterminado = resultado['codigo'] < 0
+            com_fracoes = np.isfinite(df['P200'].to_numpy(float)) & np.isfinite(df['P4'].to_numpy(float))
+            sem_fracoes = int((indeterminado & ~com_fracoes).sum())
+            sem_graduacao = int((indeterminado & com_fracoes).sum())
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Amostras", f"{len(df)}")
+            with col2:
+                st.metric("Classe Predominante", contagem.index[0] if len(contagem) else "-")
+            with col3:
+                st.metric("Indeterminadas (?)", f"{sem_fracoes + sem_graduacao}",
+                          help=f"{sem_fracoes} sem P4/P200 e {sem_graduacao} sem Cu/Cc")
+            
+            fig = go.Figure(go.Bar(x=contagem.index, y=contagem.values, marker_color='steelblue'))
+            fig.update_layout(title="Distribuição das Classes SUCS", xaxis_title="Classe",
+                              yaxis_title="Número de Amostras", height=400, template='plotly_white')
+            st.plotly_chart(fig, use_container_width=True)
+            
+            st.dataframe(df.head(1000), use_container_width=True)
+            st.download_button("Baixar Resultados (CSV)", df.to_csv(index=False), file_name="sucs_lote.csv")
+
+def show_calculadora_granulometria():
+    """Processamento de ensaios de granulometria por peneiramento"""
+    st.subheader("📈 Análise Granulométrica")
+    
+    st.markdown("""
+    ### 🎯 Como Usar
+    
+    Cada linha é uma amostra e cada coluna numérica é uma peneira (abertura em mm) com o percentual
+    passante acumulado. Colunas **LL** e **LP**, quando presentes, permitem classificar as amostras
+    pelo SUCS com o Cu e o Cc calculados. Também é possível carregar uma planilha CSV/Excel no mesmo formato.
+    """)
+    
+    arquivo = st.file_uploader("Ensaios de granulometria", type=["csv", "xlsx"], key="granulometria")
+    if arquivo is not None:
+        try:
+            dados = pd.read_excel(arquivo) if arquivo.name.endswith(".xlsx") else pd.read_csv(arquivo)
+        except (ValueError, ImportError) as e:
+            st.error(f"Erro: {e}")
+            return
+    else:
+        dados = pd.DataFrame(
+            [['A-01', 100, 95, 90, 75, 60, 45, 32, 20, 12, 7, 3, np.nan, np.nan],
+             ['A-02', 100, 100, 100, 98, 92, 80, 62, 45, 30, 18, 9, 28.0, 22.0],
+             ['A-03', 100, 100, 100, 100, 99, 97, 94, 90, 85, 78, 65, 45.0, 22.0]],
+            columns=['Amostra', '50', '25', '19', '9.5', '4.75', '2.0', '0.85', '0.425', '0.25', '0.15', '0.075', 'LL', 'LP']
+        )
+        dados = st.data_editor(dados, num_rows="dynamic", use_container_width=True)
+    
+    colunas_peneiras = []
+    for coluna in dados.columns:
+        try:
+            float(coluna)
+            colunas_peneiras.append(coluna)
+        except ValueError:
+            pass
+    
+    if st.button("Processar Ensaios", type="primary"):
+        try:
+            resultado = processar_granulometria(
+                [float(coluna) for coluna in colunas_peneiras],
+                dados[colunas_peneiras].to_numpy(float)
+            )
+        except ValueError as e:
+            st.error(f"Erro: {e}")
+            return
+        
+        tabela = pd.DataFrame({
+            'D10 (mm)': resultado['D10'],
+            'D30 (mm)': resultado['D30'],
+            'D60 (mm)': resultado['D60'],
+            'Cu': resultado['Cu'],
+            'Cc': resultado['Cc'],
+            '% #4': resultado['P4'],
+            '% #200': resultado['P200']
+        }, index=dados.index)
+        if 'Amostra' in dados:
+            tabela.insert(0, 'Amostra', dados['Amostra'])
+        
+        if 'LL' in dados and 'LP' in dados:
+            sucs = classificar_sucs(dados['LL'].to_numpy(float), dados['LP'].to_numpy(float),
+                                    resultado['P200'], resultado['P4'], resultado['Cu'], resultado['Cc'])
+            tabela['SUCS'] = sucs['simbolo']
+        
+        sem_fracoes = ~(np.isfinite(resultado['P4']) & np.isfinite(resultado['P200']))
+        
+        st.markdown("### ✅ Resultados")
+        if sem_fracoes.any():
+            st.warning(f"⚠️ {int(sem_fracoes.sum())} amostra(s) sem % #4 ou % #200: as peneiras ensaiadas não "
+                       f"alcançam 4,75 mm ou 0,075 mm, e a classificação SUCS fica indeterminada (?)")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Amostras", f"{len(tabela)}")
+        with col2:
+            st.metric("Cu Mediano", f"{np.nanmedian(resultado['Cu']):.2f}" if np.isfinite(resultado['Cu']).any() else "-")
+        with col3:
+            st.metric("Sem D10 (finos > 10%)", f"{int(np.isnan(resultado['D10']).sum())}")
+        
+        nomes = dados['Amostra'] if 'Amostra' in dados else None
+        st.plotly_chart(plot_curvas_granulometricas(resultado['aberturas'], resultado['passante'], nomes),
+                        use_container_width=True)
+        
+        st.dataframe(tabela.head(1000), use_container_width=True)
+        st.download_button("Baixar Resultados (CSV)", tabela.to_csv(index=False), file_name="granulometria.csv")
 
 def show_calculadora_capacidade_carga():
     """Calculadora de capacidade de carga (Terzaghi)"""
@@ -705,21 +856,17 @@ def show_calculadora_capacidade_carga():
     FS = st.number_input("Fator de Segurança FS", min_value=1.5, max_value=5.0, value=3.0, step=0.5)
     
     if st.button("Calcular Capacidade de Carga", type="primary"):
-        # Calcular fatores de capacidade
-        phi_rad = np.radians(phi)
-        Nq = np.exp(np.pi * np.tan(phi_rad)) * (np.tan(np.radians(45 + phi/2)))**2
-        Nc = (Nq - 1) / np.tan(phi_rad) if phi > 0 else 5.7
-        Ngamma = 0.5 * (Nq - 1) * np.tan(np.radians(1.4 * phi)) if phi > 0 else 0
-        
-        # Calcular capacidade última
-        if tipo_fundacao == "Sapata Corrida":
-            q_ult = c * Nc + gamma * D * Nq + 0.5 * gamma * B * Ngamma
-        elif tipo_fundacao == "Sapata Quadrada":
-            q_ult = 1.3 * c * Nc + gamma * D * Nq + 0.4 * gamma * B * Ngamma
-        else:  # Circular
-            q_ult = 1.3 * c * Nc + gamma * D * Nq + 0.3 * gamma * B * Ngamma
-        
-        q_adm = q_ult / FS
+        tipo = {"Sapata Corrida": "corrida", "Sapata Quadrada": "quadrada", "Sapata Circular": "circular"}[tipo_fundacao]
+        resultado = calcular_capacidade_carga_terzaghi(c, phi, gamma, B, D, tipo, FS)
+        Nc = float(resultado['Nc'])
+        Nq = float(resultado['Nq'])
+        Ngamma = float(resultado['Ngamma'])
+        parcela_c = float(resultado['parcela_coesao'])
+        parcela_q = float(resultado['parcela_sobrecarga'])
+        parcela_g = float(resultado['parcela_peso'])
+        q_ult = float(resultado['q_ult'])
+        q_adm = float(resultado['q_adm'])
+        sc, sg = FATORES_FORMA_TERZAGHI[tipo]
         
         st.markdown("### ✅ Resultados")
         col1, col2, col3 = st.columns(3)
@@ -745,24 +892,673 @@ def show_calculadora_capacidade_carga():
         st.markdown(f"""
         **Contribuição da coesão:**
         $$
-        c \\cdot N_c = {c} \\times {Nc:.2f} = {c * Nc:.2f} \\text{{ kPa}}
+        {sc} \\cdot c \\cdot N_c = {sc} \\times {c} \\times {Nc:.2f} = {parcela_c:.2f} \\text{{ kPa}}
         $$
         
         **Contribuição da sobrecarga:**
         $$
-        \\gamma \\cdot D \\cdot N_q = {gamma} \\times {D} \\times {Nq:.2f} = {gamma * D * Nq:.2f} \\text{{ kPa}}
+        \\gamma \\cdot D \\cdot N_q = {gamma} \\times {D} \\times {Nq:.2f} = {parcela_q:.2f} \\text{{ kPa}}
         $$
         
         **Contribuição do peso próprio:**
         $$
-        \\frac{{1}}{{2}} \\gamma \\cdot B \\cdot N_\\gamma = \\frac{{1}}{{2}} \\times {gamma} \\times {B} \\times {Ngamma:.2f} = {0.5 * gamma * B * Ngamma:.2f} \\text{{ kPa}}
+        {sg} \\gamma \\cdot B \\cdot N_\\gamma = {sg} \\times {gamma} \\times {B} \\times {Ngamma:.2f} = {parcela_g:.2f} \\text{{ kPa}}
         $$
         
         **Capacidade última:**
         $$
-        q_{{ult}} = {c * Nc:.2f} + {gamma * D * Nq:.2f} + {0.5 * gamma * B * Ngamma:.2f} = {q_ult:.2f} \\text{{ kPa}}
+        q_{{ult}} = {parcela_c:.2f} + {parcela_q:.2f} + {parcela_g:.2f} = {q_ult:.2f} \\text{{ kPa}}
         $$
         """)
+        
+        # Ábaco: q_adm em função de B e D para o solo informado
+        st.markdown("---")
+        st.markdown("### 📈 Ábaco de Projeto")
+        larguras = np.linspace(0.5, max(5.0, 2 * B), 60)
+        profundidades = np.array([0.5, 1.0, 1.5, 2.0, 3.0])
+        abaco = calcular_capacidade_carga_terzaghi(c, phi, gamma, larguras[None, :], profundidades[:, None], tipo, FS)
+        fig = go.Figure()
+        for Dk, q in zip(profundidades, abaco['q_adm']):
+            fig.add_trace(go.Scatter(x=larguras, y=q, mode='lines', name=f"D = {Dk:.1f} m"))
+        fig.update_layout(
+            title="Capacidade Admissível x Largura da Fundação",
+            xaxis_title="Largura B (m)",
+            yaxis_title="q_adm (kPa)",
+            height=450,
+            template='plotly_white'
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+def show_calculadora_capacidade_geral():
+    """Verificação de capacidade de carga de várias sapatas (Meyerhof/Vesic/Hansen)"""
+    st.subheader("🏢 Capacidade de Carga - Equação Geral")
+    
+    st.markdown("""
+    ### 🎯 Como Usar
+    
+    Cada linha é uma sapata. Carregue um CSV com as mesmas colunas para verificar todas as sapatas 
+    de uma edificação de uma só vez. Cargas V e H em kN; H atua na direção de B.
+    """)
+    
+    metodo = st.selectbox("Método", ["Vesic", "Hansen", "Meyerhof"])
+    
+    st.markdown("### Propriedades do Solo")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        c = st.number_input("Coesão c (kPa)", min_value=0.0, value=10.0, step=1.0, key="c_geral")
+    with col2:
+        phi = st.number_input("Ângulo de Atrito φ (graus)", min_value=0.0, max_value=45.0, value=28.0, step=1.0, key="phi_geral")
+    with col3:
+        gamma = st.number_input("Peso Específico γ (kN/m³)", min_value=10.0, value=18.0, step=0.5, key="gamma_geral")
+    with col4:
+        gamma_sat = st.number_input("Peso Específico Saturado γsat (kN/m³)", min_value=10.0, value=20.0, step=0.5)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        usar_na = st.checkbox("Considerar nível d'água", value=False)
+        nivel_agua = st.number_input("Profundidade do N.A. (m)", min_value=0.0, value=2.0, step=0.1) if usar_na else None
+    with col2:
+        inclinacao_terreno = st.number_input("Inclinação do Terreno β (graus)", min_value=0.0, max_value=30.0, value=0.0, step=1.0)
+    with col3:
+        inclinacao_base = st.number_input("Inclinação da Base η (graus)", min_value=0.0, max_value=30.0, value=0.0, step=1.0)
+    with col4:
+        FS = st.number_input("Fator de Segurança FS", min_value=1.5, max_value=5.0, value=3.0, step=0.5, key="FS_geral")
+    
+    arquivo = st.file_uploader("Sapatas (CSV com colunas Sapata, B, L, D, V, H)", type=["csv"])
+    if arquivo is not None:
+        df = pd.read_csv(arquivo)
+    else:
+        df = pd.DataFrame({
+            'Sapata': ['S1', 'S2', 'S3', 'S4'],
+            'B': [1.5, 2.0, 2.5, 1.2],
+            'L': [1.5, 2.0, 3.0, 4.0],
+            'D': [1.0, 1.2, 1.5, 1.0],
+            'V': [450.0, 900.0, 1500.0, 500.0],
+            'H': [0.0, 40.0, 80.0, 20.0]
+        })
+        df = st.data_editor(df, num_rows="dynamic", use_container_width=True)
+    
+    if st.button("Verificar Sapatas", type="primary"):
+        B = df['B'].to_numpy(float)
+        L = df['L'].to_numpy(float)
+        V = df['V'].to_numpy(float)
+        try:
+            resultado = calcular_capacidade_carga_geral(
+                c, phi, gamma, B, df['D'].to_numpy(float), L=L, metodo=metodo.lower(),
+                V=V, H=df['H'].to_numpy(float), inclinacao_base=inclinacao_base,
+                inclinacao_terreno=inclinacao_terreno, nivel_agua=nivel_agua,
+                gamma_sat=gamma_sat, FS=FS
+            )
+        except ValueError as e:
+            st.error(f"Erro: {e}")
+            return
+        
+        tensao = V / (B * L)
+        aprovada = tensao <= resultado['q_adm']
+        
+        st.markdown("### ✅ Resultados")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Sapatas Verificadas", f"{len(df)}")
+        with col2:
+            st.metric("Aprovadas", f"{aprovada.sum()}")
+        with col3:
+            st.metric("Nc / Nq / Nγ", f"{float(resultado['Nc']):.1f} / {float(resultado['Nq']):.1f} / {float(resultado['Ngamma']):.1f}")
+        
+        df_res = pd.DataFrame({
+            'Sapata': df['Sapata'],
+            'σ aplicada (kPa)': tensao.round(1),
+            'q_ult (kPa)': np.round(resultado['q_ult'], 1),
+            'q_adm (kPa)': np.round(resultado['q_adm'], 1),
+            'Aproveitamento (%)': np.round(100 * tensao / resultado['q_adm'], 1),
+            'Situação': np.where(aprovada, "✅ OK", "❌ Não atende")
+        })
+        st.dataframe(df_res, use_container_width=True)
+        
+        if not aprovada.all():
+            st.error(f"❌ {(~aprovada).sum()} sapata(s) com tensão aplicada acima da admissível.")
+        
+        with st.expander("📊 Fatores de Correção", expanded=False):
+            fatores = {k: np.broadcast_to(v, tensao.shape).round(3) for k, v in resultado['fatores'].items()}
+            st.dataframe(pd.DataFrame({'Sapata': df['Sapata'], **fatores}), use_container_width=True)
+
+def show_calculadora_taludes():
+    """Estabilidade de taludes - busca do círculo crítico (Bishop simplificado)"""
+    st.subheader("⛰️ Estabilidade de Taludes - Bishop Simplificado")
+    
+    st.markdown("""
+    ### 🎯 Como Usar
+    
+    Defina a geometria e os parâmetros do solo. A busca avalia todos os círculos de uma grade de 
+    centros × raios e indica a superfície com menor fator de segurança.
+    """)
+    
+    st.markdown("### Geometria e Solo")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        altura = st.number_input("Altura do Talude H (m)", min_value=1.0, value=10.0, step=0.5)
+        inclinacao = st.number_input("Inclinação do Talude (graus)", min_value=10.0, max_value=80.0, value=45.0, step=1.0)
+    with col2:
+        c = st.number_input("Coesão Efetiva c' (kPa)", min_value=0.0, value=10.0, step=1.0, key="c_talude")
+        phi = st.number_input("Ângulo de Atrito φ' (graus)", min_value=0.0, max_value=45.0, value=20.0, step=1.0, key="phi_talude")
+    with col3:
+        gamma = st.number_input("Peso Específico γ (kN/m³)", min_value=10.0, value=20.0, step=0.5, key="gamma_talude")
+        ru = st.number_input("Coeficiente de Poropressão ru", min_value=0.0, max_value=0.8, value=0.0, step=0.05)
+    
+    st.markdown("### Grade de Busca")
+    col1, col2 = st.columns(2)
+    with col1:
+        n_centros = st.slider("Centros por direção", min_value=10, max_value=100, value=40, step=5)
+    with col2:
+        n_raios = st.slider("Raios por centro", min_value=5, max_value=60, value=30, step=5)
+    
+    if st.button("Buscar Círculo Crítico", type="primary"):
+        sx, sy = geometria_talude(altura, inclinacao)
+        x_crista = sx[2]
+        centros_x = np.linspace(-altura, x_crista + altura, n_centros)
+        centros_y = np.linspace(0.75 * altura, 3 * altura, n_centros)
+        raios = np.linspace(0.5 * altura, 4 * altura, n_raios)
+        
+        busca = buscar_circulo_critico(sx, sy, c, phi, gamma, centros_x, centros_y, raios, ru=ru)
+        critico = fator_seguranca_bishop([busca['xc']], [busca['yc']], [busca['R']], sx, sy, c, phi, gamma, ru=ru)
+        FS_min = busca['FS_min']
+        
+        if not np.isfinite(FS_min):
+            st.error("Erro: nenhum círculo válido na grade de busca")
+            return
+        
+        st.markdown("### ✅ Resultados")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("FS Mínimo (Bishop)", f"{FS_min:.3f}")
+        with col2:
+            st.metric("FS Fellenius (mesmo círculo)", f"{critico['FS_fellenius'][0]:.3f}")
+        with col3:
+            st.metric("Círculos Avaliados", f"{busca['FS'].size:,}".replace(",", "."))
+        
+        st.write(f"**Círculo crítico:** centro ({busca['xc']:.2f}; {busca['yc']:.2f}) m, raio {busca['R']:.2f} m")
+        
+        if FS_min < 1.0:
+            st.error("❌ Talude instável (FS < 1.0)")
+        elif FS_min < 1.5:
+            st.warning("⚠️ FS abaixo de 1.5 - verificar requisitos de projeto")
+        else:
+            st.success("✅ FS ≥ 1.5")
+        
+        theta = np.linspace(0, 2 * np.pi, 400)
+        x_circ = busca['xc'] + busca['R'] * np.cos(theta)
+        y_circ = busca['yc'] + busca['R'] * np.sin(theta)
+        abaixo = y_circ <= np.interp(x_circ, sx, sy)
+        x_circ = np.where(abaixo, x_circ, np.nan)
+        y_circ = np.where(abaixo, y_circ, np.nan)
+        
+        fig = go.Figure()
+        fig.add_trace(go.Contour(
+            x=centros_x, y=centros_y, z=np.min(busca['FS'], axis=2).T,
+            contours=dict(coloring='heatmap', showlabels=True),
+            colorscale='RdYlGn', zmin=max(FS_min, 0), zmax=FS_min * 2,
+            name='FS mínimo por centro', opacity=0.6, colorbar=dict(title='FS')
+        ))
+        fig.add_trace(go.Scatter(x=sx, y=sy, mode='lines', name='Terreno', line=dict(color='saddlebrown', width=3)))
+        fig.add_trace(go.Scatter(x=x_circ, y=y_circ, mode='lines', name='Superfície Crítica', line=dict(color='red', width=3)))
+        fig.add_trace(go.Scatter(x=[busca['xc']], y=[busca['yc']], mode='markers', name='Centro Crítico',
+                                 marker=dict(size=10, color='black', symbol='x')))
+        fig.update_layout(
+            title="Talude, Superfície Crítica e Mapa de FS dos Centros",
+            xaxis_title="x (m)",
+            yaxis_title="y (m)",
+            height=550,
+            xaxis=dict(scaleanchor="y", scaleratio=1)
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+def show_calculadora_adensamento():
+    """Adensamento 1D em perfil estratificado (diferenças finitas)"""
+    st.subheader("⏳ Adensamento Unidimensional")
+    
+    st.markdown("""
+    ### 🎯 Como Usar
+    
+    Descreva as camadas compressíveis do topo para a base. A carga é aplicada em rampa durante o 
+    tempo de construção e mantida constante depois.
+    """)
+    
+    camadas = pd.DataFrame({
+        'Espessura (m)': [4.0, 6.0],
+        'cv (m²/ano)': [2.0, 0.8],
+        'mv (1/kPa)': [3e-4, 5e-4]
+    })
+    camadas = st.data_editor(camadas, num_rows="dynamic", use_container_width=True)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        carga = st.number_input("Acréscimo de Tensão Δσ (kPa)", min_value=1.0, value=100.0, step=10.0)
+        tempo_construcao = st.number_input("Tempo de Construção (anos)", min_value=0.0, value=0.5, step=0.1)
+    with col2:
+        drenagem_topo = st.checkbox("Topo drenante", value=True)
+        drenagem_base = st.checkbox("Base drenante", value=True)
+    with col3:
+        t_final = st.number_input("Tempo Final (anos)", min_value=0.1, value=50.0, step=5.0)
+    
+    if st.button("Simular Adensamento", type="primary"):
+        if tempo_construcao > 0:
+            tempos_carga, cargas = [0.0, tempo_construcao], [0.0, carga]
+        else:
+            tempos_carga, cargas = [0.0], [carga]
+        
+        try:
+            resultado = simular_adensamento(
+                camadas['Espessura (m)'].to_numpy(float),
+                camadas['cv (m²/ano)'].to_numpy(float),
+                camadas['mv (1/kPa)'].to_numpy(float),
+                tempos_carga, cargas, t_final,
+                drenagem_topo=drenagem_topo, drenagem_base=drenagem_base
+            )
+        except ValueError as e:
+            st.error(f"Erro: {e}")
+            return
+        
+        t = resultado['t']
+        U = resultado['grau_adensamento']
+        st.markdown("### ✅ Resultados")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Recalque Final", f"{resultado['recalque_final'] * 100:.1f} cm")
+        with col2:
+            st.metric(f"Recalque em {t_final:g} anos", f"{resultado['recalque'][-1] * 100:.1f} cm")
+        with col3:
+            t90 = np.interp(0.9, U, t) if U[-1] >= 0.9 else None
+            st.metric("Tempo para U = 90%", f"{t90:.2f} anos" if t90 is not None else f"> {t_final:g} anos")
+        
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=t[1:], y=resultado['recalque'][1:] * 100, mode='lines', name='Recalque',
+                                 line=dict(color='blue', width=3)))
+        fig.update_layout(
+            title="Curva Recalque x Tempo",
+            xaxis_title="Tempo (anos)",
+            yaxis_title="Recalque (cm)",
+            xaxis_type="log",
+            yaxis=dict(autorange="reversed"),
+            height=450,
+            template='plotly_white'
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        
+        fig2 = go.Figure()
+        for ti in np.geomspace(t[1], t_final, 6):
+            k = np.searchsorted(t, ti)
+            fig2.add_trace(go.Scatter(x=resultado['u'][k], y=resultado['z'], mode='lines', name=f"t = {t[k]:.3g} anos"))
+        fig2.update_layout(
+            title="Isócronas de Excesso de Poropressão",
+            xaxis_title="u (kPa)",
+            yaxis_title="Profundidade z (m)",
+            yaxis=dict(autorange="reversed"),
+            height=500,
+            template='plotly_white'
+        )
+        st.plotly_chart(fig2, use_container_width=True)
+
+def show_calculadora_tensoes():
+    """Acréscimo de tensão sob conjuntos de cargas (Boussinesq / Newmark)"""
+    st.subheader("🎯 Distribuição de Tensões")
+    
+    st.markdown("""
+    ### 🎯 Como Usar
+    
+    Informe as sapatas retangulares (coordenadas do centro e dimensões) e, se houver, cargas
+    pontuais e áreas circulares. O acréscimo Δσz é obtido por superposição em uma seção vertical,
+    e o recalque edométrico é integrado até a profundidade máxima.
+    """)
+    
+    st.markdown("**Sapatas / Áreas Retangulares**")
+    retangulos = pd.DataFrame({
+        'x centro (m)': [0.0, 4.0, 8.0],
+        'y centro (m)': [0.0, 0.0, 0.0],
+        'B (m)': [2.0, 2.0, 2.0],
+        'L (m)': [2.0, 2.0, 2.0],
+        'q (kPa)': [200.0, 250.0, 200.0]
+    })
+    retangulos = st.data_editor(retangulos, num_rows="dynamic", use_container_width=True, key="tensoes_ret")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("**Cargas Pontuais**")
+        pontuais = pd.DataFrame({'P (kN)': [0.0], 'x (m)': [0.0], 'y (m)': [0.0]})
+        pontuais = st.data_editor(pontuais, num_rows="dynamic", use_container_width=True, key="tensoes_pont")
+    with col2:
+        st.markdown("**Áreas Circulares**")
+        circulos = pd.DataFrame({'q (kPa)': [0.0], 'x centro (m)': [0.0], 'y centro (m)': [0.0], 'Raio (m)': [1.0]})
+        circulos = st.data_editor(circulos, num_rows="dynamic", use_container_width=True, key="tensoes_circ")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        y_secao = st.number_input("Seção em y (m)", value=0.0, step=0.5)
+        profundidade = st.number_input("Profundidade Máxima (m)", min_value=1.0, value=12.0, step=1.0)
+    with col2:
+        x_min = st.number_input("x mínimo (m)", value=-6.0, step=1.0)
+        x_max = st.number_input("x máximo (m)", value=14.0, step=1.0)
+    with col3:
+        resolucao = st.slider("Pontos por Eixo", min_value=20, max_value=200, value=80)
+        mv = st.number_input("mv (1/kPa)", min_value=0.0, value=1e-4, format="%.2e")
+    
+    if st.button("Calcular Tensões", type="primary"):
+        if x_max <= x_min:
+            st.error("Erro: x máximo deve ser maior que x mínimo")
+            return
+        
+        r = retangulos.dropna().to_numpy(float)
+        ret = np.column_stack([r[:, 4], r[:, 0] - r[:, 2] / 2, r[:, 0] + r[:, 2] / 2,
+                               r[:, 1] - r[:, 3] / 2, r[:, 1] + r[:, 3] / 2]) if len(r) else None
+        pont = pontuais.dropna().to_numpy(float)
+        pont = pont[pont[:, 0] != 0] if len(pont) else None
+        circ = circulos.dropna().to_numpy(float)
+        circ = circ[(circ[:, 0] != 0) & (circ[:, 3] > 0)] if len(circ) else None
+        
+        x = np.linspace(x_min, x_max, resolucao)
+        z = np.linspace(profundidade / resolucao, profundidade, resolucao)
+        
+        try:
+            delta_sigma = superpor_tensoes(x[:, None], y_secao, z[None, :],
+                                           retangulos=ret, pontuais=pont, circulos=circ)
+        except ValueError as e:
+            st.error(f"Erro: {e}")
+            return
+        
+        recalque = recalque_edometrico(delta_sigma, z, mv)
+        i_max = int(np.argmax(recalque))
+        
+        st.markdown("### ✅ Resultados")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Δσz Máximo", f"{delta_sigma.max():.1f} kPa")
+        with col2:
+            st.metric("Recalque Máximo", f"{recalque[i_max] * 1000:.1f} mm")
+        with col3:
+            st.metric("Posição do Recalque Máximo", f"x = {x[i_max]:.2f} m")
+        
+        st.plotly_chart(plot_contorno_tensoes(x, z, delta_sigma, titulo=f"Δσz na Seção y = {y_secao:g} m"),
+                        use_container_width=True)
+        
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=x, y=recalque * 1000, mode='lines', name='Recalque',
+                                 line=dict(color='blue', width=3)))
+        fig.update_layout(
+            title="Recalque Edométrico ao Longo da Seção",
+            xaxis_title="x (m)",
+            yaxis_title="Recalque (mm)",
+            yaxis=dict(autorange="reversed"),
+            height=400,
+            template='plotly_white'
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+def show_calculadora_estacas():
+    """Capacidade de carga de estacas a partir de sondagens SPT"""
+    st.subheader("🏗️ Capacidade de Carga de Estacas (SPT)")
+    
+    st.markdown(f"""
+    ### 🎯 Como Usar
+    
+    Informe as sondagens com um registro por metro: **Furo**, **Profundidade** (m), **N** e **Solo**.
+    Todos os furos são avaliados para os tipos e diâmetros selecionados, em todos os comprimentos.
+    
+    Solos aceitos: {', '.join(SOLOS_SPT)}
+    """)
+    
+    arquivo = st.file_uploader("Sondagens SPT (CSV / Excel)", type=["csv", "xlsx"], key="sondagens_spt")
+    if arquivo is not None:
+        try:
+            registros = pd.read_excel(arquivo) if arquivo.name.endswith(".xlsx") else pd.read_csv(arquivo)
+        except (ValueError, ImportError) as e:
+            st.error(f"Erro: {e}")
+            return
+    else:
+        N_exemplo = [3, 4, 4, 6, 8, 10, 12, 15, 18, 22, 26, 30, 35, 40, 45]
+        solos_exemplo = ['argila_siltosa'] * 5 + ['silte_arenoso'] * 5 + ['areia_siltosa'] * 5
+        registros = pd.DataFrame({
+            'Furo': ['SP-01'] * 15,
+            'Profundidade': np.arange(1, 16),
+            'N': N_exemplo,
+            'Solo': solos_exemplo
+        })
+        registros = st.data_editor(registros, num_rows="dynamic", use_container_width=True)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        tipos = st.multiselect("Tipos de Estaca", list(TIPOS_ESTACA), default=['pre_moldada', 'helice_continua'],
+                               format_func=lambda t: TIPOS_ESTACA[t]['nome'])
+        metodo = st.selectbox("Método", ["Aoki-Velloso", "Décourt-Quaresma"])
+    with col2:
+        diametros_texto = st.text_input("Diâmetros (m, separados por vírgula)", value="0.30, 0.40, 0.50")
+        carga = st.number_input("Carga de Projeto (kN)", min_value=0.0, value=600.0, step=50.0)
+    
+    if st.button("Calcular Capacidade", type="primary"):
+        try:
+            diametros = np.array([float(d) for d in diametros_texto.replace(';', ',').split(',') if d.strip()])
+            if not tipos or diametros.size == 0:
+                raise ValueError("Selecione ao menos um tipo de estaca e um diâmetro")
+            sondagens = sondagens_para_arrays(registros['Furo'].astype(str).to_numpy(), registros['Profundidade'].to_numpy(float),
+                                              registros['N'].to_numpy(float), registros['Solo'].astype(str).to_numpy())
+            resultado = capacidade_estacas_spt(sondagens['N'], sondagens['solo'], tipos, diametros)
+        except (ValueError, KeyError) as e:
+            st.error(f"Erro: {e}")
+            return
+        
+        chave = 'aoki_velloso' if metodo == "Aoki-Velloso" else 'decourt_quaresma'
+        P_adm = resultado[chave]['P_adm']
+        L = resultado['comprimento']
+        
+        # Menor comprimento que atende à carga em cada combinação furo × tipo × diâmetro
+        atende = np.nan_to_num(P_adm) >= carga
+        i_min = np.argmax(atende, axis=-1)
+        L_min = np.where(atende.any(axis=-1), L[i_min], np.nan)
+        
+        furos, tipos_idx, diam_idx = np.meshgrid(np.arange(len(sondagens['furos'])), np.arange(len(tipos)),
+                                                 np.arange(diametros.size), indexing='ij')
+        tabela = pd.DataFrame({
+            'Furo': sondagens['furos'][furos.ravel()],
+            'Tipo': [TIPOS_ESTACA[tipos[i]]['nome'] for i in tipos_idx.ravel()],
+            'Diâmetro (m)': diametros[diam_idx.ravel()],
+            'Comprimento Mínimo (m)': L_min.ravel()
+        })
+        
+        st.markdown("### ✅ Resultados")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Furos", f"{len(sondagens['furos'])}")
+        with col2:
+            st.metric("Combinações Avaliadas", f"{P_adm.size}")
+        with col3:
+            st.metric("Combinações que Atendem", f"{int(np.isfinite(L_min).sum())} / {L_min.size}")
+        
+        st.dataframe(tabela, use_container_width=True)
+        st.download_button("Baixar Resultados (CSV)", tabela.to_csv(index=False), file_name="estacas_spt.csv")
+        
+        fig = go.Figure()
+        for i, tipo in enumerate(tipos):
+            for j, d in enumerate(diametros):
+                fig.add_trace(go.Scatter(x=P_adm[0, i, j], y=L, mode='lines+markers',
+                                         name=f"{TIPOS_ESTACA[tipo]['nome']} Ø{d:.2f} m"))
+        fig.add_vline(x=carga, line_dash="dash", line_color="red", annotation_text="Carga de projeto")
+        fig.update_layout(
+            title=f"Carga Admissível x Comprimento - {sondagens['furos'][0]} ({metodo})",
+            xaxis_title="Carga Admissível (kN)",
+            yaxis_title="Comprimento (m)",
+            yaxis=dict(autorange="reversed"),
+            height=550,
+            template='plotly_white'
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+def show_calculadora_percolacao():
+    """Percolação bidimensional sob barragens e cortinas"""
+    st.subheader("💧 Percolação e Rede de Fluxo")
+    
+    st.markdown("""
+    ### 🎯 Como Usar
+    
+    Defina a camada permeável (base impermeável), a extensão da estrutura na superfície e as cargas
+    de montante e jusante. Para uma cortina isolada, use o mesmo x para montante e jusante.
+    """)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        comprimento = st.number_input("Comprimento do Domínio (m)", min_value=5.0, value=60.0, step=5.0)
+        espessura = st.number_input("Espessura da Camada (m)", min_value=1.0, value=12.0, step=1.0)
+        dx = st.number_input("Espaçamento da Malha (m)", min_value=0.02, value=0.25, step=0.05)
+    with col2:
+        x_montante = st.number_input("x Montante da Estrutura (m)", min_value=0.0, value=25.0, step=1.0)
+        x_jusante = st.number_input("x Jusante da Estrutura (m)", min_value=0.0, value=35.0, step=1.0)
+        carga_montante = st.number_input("Carga a Montante h₁ (m)", value=8.0, step=0.5)
+        carga_jusante = st.number_input("Carga a Jusante h₂ (m)", value=1.0, step=0.5)
+    with col3:
+        kx = st.number_input("kx (m/s)", min_value=1e-12, value=1e-5, format="%.2e")
+        ky = st.number_input("ky (m/s)", min_value=1e-12, value=1e-5, format="%.2e")
+        usar_cortina = st.checkbox("Cortina de estacas-prancha", value=True)
+        x_cortina = st.number_input("x da Cortina (m)", min_value=0.0, value=25.0, step=1.0, disabled=not usar_cortina)
+        prof_cortina = st.number_input("Profundidade da Cortina (m)", min_value=0.0, value=6.0, step=0.5, disabled=not usar_cortina)
+    
+    gamma_sat = st.number_input("Peso Específico Saturado γsat (kN/m³)", min_value=10.0, value=19.0, step=0.5)
+    
+    if st.button("Resolver Percolação", type="primary"):
+        try:
+            if x_jusante < x_montante or x_jusante > comprimento:
+                raise ValueError("Limites da estrutura inválidos")
+            modelo = modelo_fundacao(comprimento, espessura, x_montante, x_jusante, carga_montante, carga_jusante,
+                                     cortinas=[(x_cortina, prof_cortina)] if usar_cortina else None, dx=dx)
+            impermeavel = modelo['impermeavel']
+            resultado = resolver_percolacao(modelo['carga_imposta'], np.where(impermeavel, 0.0, kx),
+                                            np.where(impermeavel, 0.0, ky), dx, dx)
+        except ValueError as e:
+            st.error(f"Erro: {e}")
+            return
+        
+        i_saida = gradiente_saida(resultado, dx)
+        i_critico = (gamma_sat - 9.81) / 9.81
+        
+        st.markdown("### ✅ Resultados")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Vazão Q", f"{resultado['Q'] * 86400:.3f} m³/dia/m")
+        with col2:
+            st.metric("Gradiente de Saída", f"{i_saida:.3f}")
+        with col3:
+            FS_piping = i_critico / i_saida if i_saida > 0 else np.inf
+            st.metric("FS contra Piping", f"{FS_piping:.2f}")
+        
+        if FS_piping < 3:
+            st.warning("⚠️ FS contra piping abaixo de 3 - avaliar aumento da cortina ou filtro invertido")
+        
+        st.caption(f"Malha: {modelo['carga_imposta'].size} nós")
+        st.plotly_chart(plot_rede_fluxo(modelo['x'], modelo['y'], resultado['h'],
+                                        funcao_corrente(resultado, dx), impermeavel),
+                        use_container_width=True)
+
+def show_calculadora_muros():
+    """Dimensionamento de muros de arrimo por varredura de geometrias"""
+    st.subheader("🧱 Muros de Arrimo")
+    
+    st.markdown("""
+    ### 🎯 Como Usar
+    
+    Defina o aterro, o solo de fundação e as faixas de dimensões a investigar. Todas as combinações
+    são verificadas quanto a tombamento, deslizamento, excentricidade e capacidade de carga, e a de
+    menor volume de concreto é apresentada. Para muros de gravidade, use ponta e sapata nulas e
+    espessuras de fuste maiores.
+    """)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown("**Aterro**")
+        altura = st.number_input("Altura Total H (m)", min_value=1.0, value=5.0, step=0.5)
+        gamma = st.number_input("γ do Aterro (kN/m³)", min_value=10.0, value=18.0, step=0.5)
+        phi = st.number_input("φ do Aterro (°)", min_value=10.0, max_value=45.0, value=30.0, step=1.0)
+        beta = st.number_input("Inclinação do Terrapleno β (°)", min_value=0.0, max_value=40.0, value=0.0, step=1.0)
+        sobrecarga = st.number_input("Sobrecarga q (kPa)", min_value=0.0, value=10.0, step=5.0)
+    with col2:
+        st.markdown("**Empuxo e Água**")
+        metodo_empuxo = st.selectbox("Teoria de Empuxo", ["Rankine", "Coulomb"])
+        com_agua = st.checkbox("Nível d'água no aterro", value=False)
+        prof_agua = st.number_input("Profundidade do N.A. (m)", min_value=0.0, value=3.0, step=0.5, disabled=not com_agua)
+        gamma_sat = st.number_input("γsat do Aterro (kN/m³)", min_value=10.0, value=20.0, step=0.5, disabled=not com_agua)
+    with col3:
+        st.markdown("**Fundação**")
+        c_fundacao = st.number_input("c da Fundação (kPa)", min_value=0.0, value=0.0, step=5.0)
+        phi_fundacao = st.number_input("φ da Fundação (°)", min_value=0.0, max_value=45.0, value=30.0, step=1.0)
+        gamma_fundacao = st.number_input("γ da Fundação (kN/m³)", min_value=10.0, value=18.0, step=0.5)
+        embutimento = st.number_input("Embutimento (m)", min_value=0.0, value=0.5, step=0.1)
+    
+    st.markdown("**Faixas de Dimensões**")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        bases = st.slider("Largura da Sapata B (m)", 0.5, 15.0, (1.5, 8.0), step=0.5)
+        passo = st.number_input("Passo de B (m)", min_value=0.01, value=0.05, step=0.01)
+    with col2:
+        pontas = st.slider("Ponta (fração de B)", 0.0, 0.8, (0.0, 0.5), step=0.05)
+    with col3:
+        esp_base = st.slider("Espessura da Sapata (m)", 0.0, 2.0, (0.3, 1.0), step=0.05)
+    with col4:
+        esp_fuste = st.slider("Espessura do Fuste na Base (m)", 0.2, 4.0, (0.3, 1.0), step=0.05)
+        esp_topo = st.number_input("Espessura no Topo (m)", min_value=0.1, value=0.25, step=0.05)
+    
+    if st.button("Otimizar Muro", type="primary"):
+        try:
+            resultado = otimizar_muro(
+                altura,
+                np.arange(bases[0], bases[1] + 1e-9, passo),
+                np.arange(pontas[0], pontas[1] + 1e-9, 0.05),
+                np.arange(esp_base[0], esp_base[1] + 1e-9, 0.05),
+                np.arange(max(esp_fuste[0], esp_topo), esp_fuste[1] + 1e-9, 0.05),
+                espessura_topo=esp_topo, gamma=gamma, phi=phi, beta=beta, sobrecarga=sobrecarga,
+                prof_agua=prof_agua if com_agua else None, gamma_sat=gamma_sat if com_agua else None,
+                metodo_empuxo=metodo_empuxo.lower(), c_fundacao=c_fundacao, phi_fundacao=phi_fundacao,
+                gamma_fundacao=gamma_fundacao, embutimento=embutimento
+            )
+        except ValueError as e:
+            st.error(f"Erro: {e}")
+            return
+        
+        st.markdown("### ✅ Resultados")
+        st.caption(f"{resultado['grade']['atende'].size} geometrias avaliadas, {resultado['n_atende']} atendem a todas as verificações")
+        if not resultado['encontrado']:
+            st.error("❌ Nenhuma geometria da faixa atende às verificações - amplie as dimensões")
+            return
+        
+        g = resultado['geometria']
+        v = resultado['verificacoes']
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Largura da Sapata", f"{g['base']:.2f} m")
+        with col2:
+            st.metric("Ponta", f"{g['ponta']:.2f} m")
+        with col3:
+            st.metric("Espessura da Sapata", f"{g['espessura_base']:.2f} m")
+        with col4:
+            st.metric("Fuste (base)", f"{g['espessura_fuste']:.2f} m")
+        
+        verificacoes = pd.DataFrame({
+            'Verificação': ['Tombamento', 'Deslizamento', 'Capacidade de Carga', 'Excentricidade (m)', 'q máx (kPa)', 'Volume de Concreto (m³/m)'],
+            'Valor': [v['FS_tombamento'], v['FS_deslizamento'], v['FS_capacidade'], v['excentricidade'], v['q_max'], v['volume_concreto']],
+            'Limite': ['≥ 2.0', '≥ 1.5', '≥ 3.0', f"≤ {g['base'] / 6:.2f}", '-', 'mínimo']
+        })
+        st.dataframe(verificacoes, use_container_width=True)
+        
+        # Seção transversal
+        B, p, tb, tf = g['base'], g['ponta'], g['espessura_base'], g['espessura_fuste']
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(
+            x=[0, B, B, p + tf, p + esp_topo, p, p, 0, 0],
+            y=[0, 0, tb, tb, altura, altura, tb, tb, 0],
+            fill='toself', fillcolor='rgba(128,128,128,0.5)', line=dict(color='black', width=2), name='Concreto'
+        ))
+        fig.add_trace(go.Scatter(
+            x=[p + esp_topo, B + 1.0, B + 1.0, p + tf, p + esp_topo],
+            y=[altura, altura + (B + 1.0 - p - esp_topo) * np.tan(np.radians(beta)), tb, tb, altura],
+            fill='toself', fillcolor='rgba(160,120,60,0.3)', line=dict(color='saddlebrown', width=1), name='Aterro'
+        ))
+        fig.update_layout(title="Seção do Muro Otimizado", xaxis_title="x (m)", yaxis_title="y (m)",
+                          yaxis=dict(scaleanchor="x", scaleratio=1), height=500, template='plotly_white')
+        st.plotly_chart(fig, use_container_width=True)
 
 def show():
     """Função principal do módulo de Geotecnia"""
@@ -777,7 +1573,7 @@ def show():
     with tab_calc:
         calc_tab = st.radio(
             "Selecione a Calculadora:",
-            ["Círculo de Mohr", "Classificação de Solos", "Capacidade de Carga"],
+            ["Círculo de Mohr", "Envoltória de Resistência", "Classificação de Solos", "Granulometria", "Capacidade de Carga", "Capacidade de Carga (Geral)", "Estabilidade de Taludes", "Adensamento 1D", "Distribuição de Tensões", "Estacas (SPT)", "Percolação", "Muros de Arrimo"],
             horizontal=True
         )
         
@@ -785,8 +1581,26 @@ def show():
         
         if calc_tab == "Círculo de Mohr":
             show_calculadora_mohr()
+        elif calc_tab == "Envoltória de Resistência":
+            show_calculadora_envoltoria()
         elif calc_tab == "Classificação de Solos":
             show_calculadora_classificacao()
+        elif calc_tab == "Granulometria":
+            show_calculadora_granulometria()
         elif calc_tab == "Capacidade de Carga":
             show_calculadora_capacidade_carga()
+        elif calc_tab == "Capacidade de Carga (Geral)":
+            show_calculadora_capacidade_geral()
+        elif calc_tab == "Estabilidade de Taludes":
+            show_calculadora_taludes()
+        elif calc_tab == "Adensamento 1D":
+            show_calculadora_adensamento()
+        elif calc_tab == "Distribuição de Tensões":
+            show_calculadora_tensoes()
+        elif calc_tab == "Estacas (SPT)":
+            show_calculadora_estacas()
+        elif calc_tab == "Percolação":
+            show_calculadora_percolacao()
+        elif calc_tab == "Muros de Arrimo":
+            show_calculadora_muros()
 
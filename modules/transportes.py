@@ -7,6 +7,21 @@ import streamlit as st
 import numpy as np
 import plotly.graph_objects as go
 import pandas as pd
+import sys
+import os
+import tempfile
+from scipy.spatial import Delaunay, QhullError
+
+# Adicionar path para imports
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, base_dir)
+
+from utils.alinhamento import criar_alinhamento, avaliar_alinhamento, elementos_espiral
+from utils.topografia import ajustar_poligonal, ajustar_rede, propriedades_poligonos
+from utils.geodesia import DATUMS, fuso_utm, geograficas_para_utm, utm_para_geograficas, transformar_datum
+from utils.perfil import criar_perfil, cotas_greide, areas_secoes, volumes_terraplenagem, linha_compensacao
+from utils.projeto_geometrico import verificar_curvas, distancia_visibilidade_ultrapassagem
+from utils.terreno import converter_xyz, volumes_terreno, criar_tin, cotas_tin, perfil_tin, curvas_nivel
 
 def show_teoria():
     """Aba de teoria expandida do módulo de Transportes"""
@@ -447,6 +462,16 @@ def show_calculadora_curvas():
         Delta = st.number_input("Ângulo Central Δ (graus)", min_value=1.0, max_value=180.0, value=45.0, step=1.0)
         R = (D * 180) / (np.pi * Delta)
     
+    Ls = st.number_input("Comprimento da Espiral de Transição Ls (m)", min_value=0.0, value=0.0, step=10.0,
+                         help="0 para curva circular simples")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        velocidade = st.number_input("Velocidade de Projeto (km/h)", min_value=30.0, max_value=120.0,
+                                     value=60.0, step=10.0, key="velocidade_curva")
+    with col2:
+        e_max = st.selectbox("Superelevação Máxima (%)", [4, 6, 8, 10, 12], index=2, key="emax_curva")
+    
     if st.button("Calcular", type="primary"):
         Delta_rad = np.radians(Delta)
         
@@ -474,6 +499,43 @@ def show_calculadora_curvas():
         with col2:
             st.metric("Corda C", f"{C:.2f} m")
         
+        verificacao = verificar_curvas(R, velocidade, e_max / 100, Ls)
+        st.markdown(f"**Verificação DNIT (V = {velocidade:.0f} km/h, e_max = {e_max}%)**")
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Raio Mínimo", f"{verificacao['raio_minimo'][0]:.1f} m")
+        with col2:
+            st.metric("Superelevação", f"{verificacao['superelevacao'][0] * 100:.2f} %")
+        with col3:
+            st.metric("Visibilidade de Parada", f"{verificacao['distancia_parada'][0]:.0f} m")
+        with col4:
+            ultrapassagem = distancia_visibilidade_ultrapassagem(velocidade)
+            st.metric("Visibilidade de Ultrapassagem", f"{ultrapassagem:.0f} m" if np.isfinite(ultrapassagem) else "-")
+        if not verificacao['atende_raio'][0]:
+            st.warning("⚠️ Raio inferior ao mínimo do DNIT para a velocidade de projeto")
+        if not verificacao['atende_espiral'][0]:
+            st.warning(f"⚠️ Transição recomendada com Ls ≥ {verificacao['comprimento_minimo_espiral'][0]:.1f} m")
+        
+        if Ls > 0:
+            espiral = elementos_espiral(R, Ls, Delta)
+            if espiral['deflexao_circular'] < 0:
+                st.error("Erro: as espirais excedem a deflexão da curva (2θs > Δ)")
+                return
+            st.markdown("**Curva com Transição em Clotoide**")
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("θs", f"{espiral['theta_s']:.4f}°")
+                st.metric("Ts", f"{espiral['tangente']:.2f} m")
+            with col2:
+                st.metric("Xs", f"{espiral['Xs']:.3f} m")
+                st.metric("Ys", f"{espiral['Ys']:.3f} m")
+            with col3:
+                st.metric("p", f"{espiral['p']:.3f} m")
+                st.metric("k", f"{espiral['k']:.3f} m")
+            with col4:
+                st.metric("Δc", f"{espiral['deflexao_circular']:.4f}°")
+                st.metric("Dc", f"{espiral['desenvolvimento_circular']:.2f} m")
+        
         # Visualização
         st.markdown("---")
         st.markdown("### 📐 Visualização da Curva")
@@ -528,6 +590,294 @@ def show_calculadora_curvas():
         
         st.plotly_chart(fig, use_container_width=True)
 
+def show_calculadora_alinhamento():
+    """Alinhamento horizontal com curvas encadeadas e estaqueamento"""
+    st.subheader("🗺️ Alinhamento Horizontal")
+    
+    st.markdown("""
+    ### 🎯 Como Usar
+    
+    Informe os PIs do traçado (o primeiro e o último são o início e o fim), o raio da curva em cada
+    PI interno e, opcionalmente, o comprimento **Ls** das espirais de transição (clotoides). O eixo é
+    estaqueado no intervalo escolhido; também é possível carregar os PIs de um CSV com as colunas
+    **X**, **Y**, **R** e **Ls**.
+    """)
+    
+    arquivo = st.file_uploader("PIs do traçado (CSV)", type=["csv"], key="pis_alinhamento")
+    if arquivo is not None:
+        pis = pd.read_csv(arquivo)
+    else:
+        pis = pd.DataFrame({
+            'X': [0.0, 150.0, 900.0, 1400.0, 2300.0],
+            'Y': [0.0, 800.0, 1300.0, 2400.0, 2700.0],
+            'R': [np.nan, 400.0, 350.0, 500.0, np.nan],
+            'Ls': [np.nan, 60.0, 0.0, 80.0, np.nan]
+        })
+        pis = st.data_editor(pis, num_rows="dynamic", use_container_width=True)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        intervalo = st.number_input("Intervalo de Estaqueamento (m)", min_value=0.1, value=20.0, step=5.0)
+    with col2:
+        estaca_inicial = st.number_input("Estaca Inicial (m)", min_value=0.0, value=0.0, step=20.0)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        velocidade = st.number_input("Velocidade de Projeto (km/h)", min_value=30.0, max_value=120.0,
+                                     value=80.0, step=10.0, key="velocidade_alinhamento")
+    with col2:
+        e_max = st.selectbox("Superelevação Máxima (%)", [4, 6, 8, 10, 12], index=2, key="emax_alinhamento")
+    
+    if st.button("Calcular Alinhamento", type="primary"):
+        try:
+            Ls = np.nan_to_num(pis['Ls'].to_numpy(float)[1:-1]) if 'Ls' in pis else None
+            alinhamento = criar_alinhamento(pis['X'].to_numpy(float), pis['Y'].to_numpy(float),
+                                            pis['R'].to_numpy(float)[1:-1], Ls, estaca_inicial)
+            verificacao = verificar_curvas(alinhamento['curvas']['raio'], velocidade, e_max / 100,
+                                           alinhamento['curvas']['Ls'])
+        except (ValueError, KeyError) as e:
+            st.error(f"Erro: {e}")
+            return
+        
+        curvas = alinhamento['curvas']
+        estacas = np.append(np.arange(estaca_inicial, estaca_inicial + alinhamento['comprimento'], intervalo),
+                            estaca_inicial + alinhamento['comprimento'])
+        pontos = avaliar_alinhamento(alinhamento, estacas)
+        
+        st.markdown("### ✅ Resultados")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Extensão", f"{alinhamento['comprimento']:.2f} m")
+        with col2:
+            st.metric("Curvas", f"{curvas['raio'].size}")
+        with col3:
+            st.metric("Pontos Estaqueados", f"{estacas.size}")
+        
+        st.markdown("**Elementos das Curvas**")
+        st.dataframe(pd.DataFrame({
+            'PI': np.arange(1, curvas['raio'].size + 1),
+            'Deflexão (°)': curvas['deflexao'],
+            'R (m)': curvas['raio'],
+            'Ls (m)': curvas['Ls'],
+            'θs (°)': curvas['theta_s'],
+            'Xs (m)': curvas['Xs'],
+            'Ys (m)': curvas['Ys'],
+            'p (m)': curvas['p'],
+            'k (m)': curvas['k'],
+            'Ts (m)': curvas['tangente'],
+            'Dc (m)': curvas['desenvolvimento'],
+            'Estaca TS (m)': curvas['estaca_TS'],
+            'Estaca SC (m)': curvas['estaca_SC'],
+            'Estaca CS (m)': curvas['estaca_CS'],
+            'Estaca ST (m)': curvas['estaca_ST']
+        }).round(3), use_container_width=True)
+        
+        st.markdown(f"**Verificação DNIT (V = {velocidade:.0f} km/h, e_max = {e_max}%)**")
+        st.dataframe(pd.DataFrame({
+            'PI': np.arange(1, curvas['raio'].size + 1),
+            'R (m)': curvas['raio'],
+            'R mín. (m)': verificacao['raio_minimo'],
+            'Superelevação (%)': verificacao['superelevacao'] * 100,
+            'Ls (m)': curvas['Ls'],
+            'Ls mín. (m)': np.where(verificacao['sem_superelevacao'], 0.0, verificacao['comprimento_minimo_espiral']),
+            'Raio': np.where(verificacao['atende_raio'], '✅', '❌'),
+            'Transição': np.where(verificacao['atende_espiral'], '✅', '❌')
+        }).round(2), use_container_width=True)
+        if not verificacao['atende_raio'].all():
+            st.warning(f"⚠️ {int((~verificacao['atende_raio']).sum())} curva(s) com raio inferior ao mínimo do DNIT")
+        if not verificacao['atende_espiral'].all():
+            st.warning(f"⚠️ {int((~verificacao['atende_espiral']).sum())} curva(s) com transição inferior à mínima")
+        
+        eixo = pd.DataFrame({'Estaca (m)': estacas, 'X (m)': pontos['x'], 'Y (m)': pontos['y'], 'Azimute (°)': pontos['azimute']})
+        st.download_button("Baixar Estaqueamento (CSV)", eixo.to_csv(index=False), file_name="estaqueamento.csv")
+        
+        # Eixo denso para o desenho
+        denso = avaliar_alinhamento(alinhamento, np.linspace(estaca_inicial, estaca_inicial + alinhamento['comprimento'], 2000))
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=pis['X'], y=pis['Y'], mode='lines+markers', name='Poligonal dos PIs',
+                                 line=dict(color='gray', width=1, dash='dash'), marker=dict(size=8)))
+        fig.add_trace(go.Scatter(x=denso['x'], y=denso['y'], mode='lines', name='Eixo',
+                                 line=dict(color='blue', width=3)))
+        notaveis = avaliar_alinhamento(alinhamento, np.concatenate([curvas['estaca_TS'], curvas['estaca_ST']]))
+        fig.add_trace(go.Scatter(x=notaveis['x'], y=notaveis['y'], mode='markers', name='TS / ST',
+                                 marker=dict(size=9, color='green')))
+        transicao = curvas['Ls'] > 0
+        if transicao.any():
+            sc_cs = avaliar_alinhamento(alinhamento, np.concatenate([curvas['estaca_SC'][transicao],
+                                                                      curvas['estaca_CS'][transicao]]))
+            fig.add_trace(go.Scatter(x=sc_cs['x'], y=sc_cs['y'], mode='markers', name='SC / CS',
+                                     marker=dict(size=8, color='orange', symbol='diamond')))
+        fig.update_layout(
+            title="Alinhamento Horizontal",
+            xaxis_title="X (m)",
+            yaxis_title="Y (m)",
+            height=600,
+            xaxis=dict(scaleanchor="y", scaleratio=1),
+            template='plotly_white'
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+def show_calculadora_perfil():
+    """Perfil longitudinal, volumes de terraplenagem e diagrama de Brückner"""
+    st.subheader("⛰️ Perfil Longitudinal e Terraplenagem")
+    
+    st.markdown("""
+    ### 🎯 Como Usar
+    
+    Defina o greide pelos PIVs (estaca, cota e comprimento **L** da curva vertical) e o terreno pelas
+    seções transversais. Sem arquivo, cada seção é gerada a partir da cota do terreno no eixo e de uma
+    inclinação transversal constante; com arquivo CSV, informe uma linha por estaca com a coluna
+    **Estaca** e uma coluna por afastamento (nome numérico em m, negativo à esquerda).
+    """)
+    
+    st.markdown("**PIVs do Greide**")
+    pivs = pd.DataFrame({
+        'Estaca': [0.0, 600.0, 1300.0, 2000.0],
+        'Cota': [100.0, 112.0, 98.0, 104.0],
+        'L': [np.nan, 240.0, 300.0, np.nan]
+    })
+    pivs = st.data_editor(pivs, num_rows="dynamic", use_container_width=True, key="pivs_perfil")
+    
+    arquivo = st.file_uploader("Seções transversais do terreno (CSV)", type=["csv"], key="secoes_perfil")
+    if arquivo is None:
+        st.markdown("**Terreno no Eixo**")
+        terreno = pd.DataFrame({
+            'Estaca': [0.0, 300.0, 700.0, 1000.0, 1500.0, 2000.0],
+            'Cota': [101.0, 104.0, 115.0, 103.0, 96.0, 106.0],
+            'Inclinação Transversal (%)': [2.0, 5.0, -3.0, 0.0, 8.0, 4.0]
+        })
+        terreno = st.data_editor(terreno, num_rows="dynamic", use_container_width=True, key="terreno_perfil")
+        intervalo = st.number_input("Intervalo entre Seções (m)", min_value=1.0, value=20.0, step=5.0)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        semi_largura = st.number_input("Semi-largura da Plataforma (m)", min_value=0.5, value=7.0, step=0.5)
+        abaulamento = st.number_input("Abaulamento (%)", min_value=0.0, value=2.0, step=0.5)
+    with col2:
+        talude_corte = st.number_input("Talude de Corte (H:V)", min_value=0.1, value=1.0, step=0.1)
+        talude_aterro = st.number_input("Talude de Aterro (H:V)", min_value=0.1, value=1.5, step=0.1)
+    with col3:
+        metodo = st.selectbox("Cálculo dos Volumes", ["Média das áreas", "Prismoidal"])
+        fator_homogeneizacao = st.number_input("Fator de Homogeneização", min_value=0.5, value=1.25, step=0.05)
+    
+    linha_otima = st.checkbox("Linha de compensação ótima (mínimo momento de transporte)", value=True)
+    if not linha_otima:
+        cota_linha = st.number_input("Ordenada da Linha de Compensação (m³)", value=0.0, step=100.0)
+    
+    if st.button("Calcular Terraplenagem", type="primary"):
+        try:
+            perfil = criar_perfil(pivs['Estaca'].to_numpy(float), pivs['Cota'].to_numpy(float),
+                                  np.nan_to_num(pivs['L'].to_numpy(float)[1:-1]))
+            if arquivo is not None:
+                secoes = pd.read_csv(arquivo).sort_values('Estaca')
+                estacas = secoes['Estaca'].to_numpy(float)
+                colunas = [c for c in secoes.columns if c != 'Estaca']
+                afastamentos = np.array(colunas, dtype=float)
+                ordem = np.argsort(afastamentos)
+                afastamentos = afastamentos[ordem]
+                cotas_terreno = secoes[colunas].to_numpy(float)[:, ordem]
+            else:
+                terreno = terreno.sort_values('Estaca')
+                estacas = np.append(np.arange(perfil['estaca'][0], perfil['estaca'][-1], intervalo), perfil['estaca'][-1])
+                cota_eixo = np.interp(estacas, terreno['Estaca'], terreno['Cota'])
+                inclinacao = np.interp(estacas, terreno['Estaca'], terreno['Inclinação Transversal (%)']) / 100
+                afastamentos = np.linspace(-60.0, 60.0, 121)
+                cotas_terreno = cota_eixo[:, None] + inclinacao[:, None] * afastamentos[None, :]
+            
+            greide = cotas_greide(perfil, estacas)
+            areas = areas_secoes(greide['cota'], afastamentos, cotas_terreno, semi_largura,
+                                 abaulamento / 100, talude_corte, talude_aterro)
+            volumes = volumes_terraplenagem(estacas, areas['corte'], areas['aterro'],
+                                            'prismoidal' if metodo == "Prismoidal" else 'media', fator_homogeneizacao)
+            compensacao = linha_compensacao(estacas, volumes['bruckner'], None if linha_otima else cota_linha)
+        except (ValueError, KeyError) as e:
+            st.error(f"Erro: {e}")
+            return
+        
+        ondas = compensacao['ondas']
+        volume_transportado = ondas['volume'].sum()
+        
+        st.markdown("### ✅ Resultados")
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Volume de Corte", f"{volumes['total_corte']:,.0f} m³")
+        with col2:
+            st.metric("Volume de Aterro", f"{volumes['total_aterro']:,.0f} m³")
+        with col3:
+            st.metric("Momento de Transporte", f"{compensacao['momento']:,.0f} m³·m")
+        with col4:
+            dmt = compensacao['momento'] / volume_transportado if volume_transportado > 0 else 0.0
+            st.metric("DMT Média", f"{dmt:.0f} m")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Extremo Inicial", f"{compensacao['inicio']:,.0f} m³",
+                      help="Positivo: bota-fora; negativo: empréstimo")
+        with col2:
+            st.metric("Extremo Final", f"{compensacao['fim']:,.0f} m³",
+                      help="Positivo: bota-fora; negativo: empréstimo")
+        
+        if areas['incompleta'].any():
+            st.warning(f"⚠️ {int(areas['incompleta'].sum())} seções com taludes que não encontram o terreno "
+                       f"dentro dos afastamentos levantados")
+        
+        if perfil['curvas']['L'].size:
+            st.markdown("**Curvas Verticais**")
+            curvas = perfil['curvas']
+            st.dataframe(pd.DataFrame({
+                'Estaca PIV (m)': curvas['estaca_PIV'],
+                'L (m)': curvas['L'],
+                'A (%)': curvas['A'],
+                'K (m/%)': curvas['K'],
+                'Flecha (m)': curvas['flecha'],
+                'Estaca PCV (m)': curvas['estaca_PCV'],
+                'Estaca PTV (m)': curvas['estaca_PTV'],
+                'Estaca Máx./Mín. (m)': curvas['estaca_extremo'],
+                'Cota Máx./Mín. (m)': curvas['cota_extremo']
+            }).round(3), use_container_width=True)
+        
+        st.markdown("**Distribuição de Terras (Ondas de Brückner)**")
+        st.dataframe(pd.DataFrame({
+            'Início (m)': ondas['inicio'],
+            'Fim (m)': ondas['fim'],
+            'Volume (m³)': ondas['volume'],
+            'Momento (m³·m)': ondas['momento'],
+            'DMT (m)': ondas['dmt'],
+            'Sentido': np.where(ondas['sentido'] > 0, 'Avante', 'Ré')
+        }).round(1), use_container_width=True)
+        
+        # Terreno no eixo: interpolação entre as leituras vizinhas ao afastamento zero
+        k = int(np.clip(np.searchsorted(afastamentos, 0.0) - 1, 0, afastamentos.size - 2))
+        w = -afastamentos[k] / (afastamentos[k + 1] - afastamentos[k])
+        nota = pd.DataFrame({
+            'Estaca (m)': estacas,
+            'Cota Terreno Eixo (m)': cotas_terreno[:, k] * (1 - w) + cotas_terreno[:, k + 1] * w,
+            'Cota Greide (m)': greide['cota'],
+            'Área Corte (m²)': areas['corte'],
+            'Área Aterro (m²)': areas['aterro'],
+            'Brückner (m³)': volumes['bruckner']
+        })
+        st.download_button("Baixar Nota de Serviço (CSV)", nota.to_csv(index=False), file_name="terraplenagem.csv")
+        
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=estacas, y=nota['Cota Terreno Eixo (m)'], mode='lines', name='Terreno',
+                                 line=dict(color='saddlebrown', width=2)))
+        fig.add_trace(go.Scatter(x=estacas, y=greide['cota'], mode='lines', name='Greide',
+                                 line=dict(color='blue', width=3)))
+        fig.add_trace(go.Scatter(x=pivs['Estaca'], y=pivs['Cota'], mode='lines+markers', name='PIVs',
+                                 line=dict(color='gray', width=1, dash='dash')))
+        fig.update_layout(title="Perfil Longitudinal", xaxis_title="Estaca (m)", yaxis_title="Cota (m)",
+                          height=450, template='plotly_white')
+        st.plotly_chart(fig, use_container_width=True)
+        
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=estacas, y=volumes['bruckner'], mode='lines', name='Diagrama de Brückner',
+                                 line=dict(color='green', width=2)))
+        fig.add_hline(y=compensacao['cota'], line_dash="dash", line_color="red", annotation_text="Linha de compensação")
+        fig.update_layout(title="Diagrama de Brückner", xaxis_title="Estaca (m)", yaxis_title="Volume acumulado (m³)",
+                          height=450, template='plotly_white')
+        st.plotly_chart(fig, use_container_width=True)
+
 def show_calculadora_poligonal():
     """Calculadora de poligonal topográfica"""
     st.subheader("📐 Calculadora de Poligonal Topográfica")
@@ -535,68 +885,113 @@ def show_calculadora_poligonal():
     st.markdown("""
     ### 🎯 Como Usar
     
-    Insira os dados da poligonal (distâncias e azimutes) para calcular coordenadas e verificar fechamento.
+    Insira os dados da poligonal (distâncias e azimutes) para calcular coordenadas, verificar o fechamento
+    e compensar o erro pelos métodos de Bowditch ou Transit. Poligonais extensas podem ser carregadas de um
+    arquivo CSV com as colunas **Distância** e **Azimute**.
     """)
     
-    num_lados = st.number_input("Número de Lados", min_value=2, max_value=20, value=4, step=1)
+    arquivo = st.file_uploader("Lados da poligonal (CSV)", type=["csv"], key="lados_poligonal")
+    if arquivo is not None:
+        lados = pd.read_csv(arquivo)
+        st.caption(f"{len(lados)} lados carregados")
+    else:
+        lados = pd.DataFrame({
+            'Distância': [50.0, 50.02, 49.99, 50.01],
+            'Azimute': [0.0, 90.0, 180.01, 270.0]
+        })
+        lados = st.data_editor(lados, num_rows="dynamic", use_container_width=True, key="editor_poligonal")
     
-    # Coordenadas iniciais
-    col1, col2 = st.columns(2)
+    col1, col2, col3 = st.columns(3)
     with col1:
-        X0 = st.number_input("Coordenada X Inicial", value=100.0)
+        tipo = st.radio("Tipo de Poligonal", ["Fechada", "Aberta amarrada"], horizontal=True)
     with col2:
-        Y0 = st.number_input("Coordenada Y Inicial", value=200.0)
+        metodo = st.radio("Compensação", ["Bowditch", "Transit"], horizontal=True)
+    with col3:
+        sistema = st.radio("Coordenadas de Partida", ["Locais / UTM", "Geográficas"], horizontal=True)
     
-    st.markdown("### Dados dos Lados")
-    
-    dados = []
-    for i in range(num_lados):
-        st.markdown(f"**Lado {i+1}**")
+    # Coordenadas iniciais (e de chegada, na poligonal amarrada)
+    geograficas = sistema == "Geográficas"
+    if geograficas:
+        st.caption("Os pontos geográficos são projetados em UTM (SIRGAS 2000) no fuso do ponto de partida; "
+                   "os azimutes informados são considerados azimutes de quadrícula.")
         col1, col2 = st.columns(2)
         with col1:
-            D = st.number_input(f"Distância (m)", min_value=0.1, value=50.0, key=f"D_{i}")
+            datum = st.selectbox("Datum das Coordenadas", list(DATUMS), format_func=lambda d: DATUMS[d]['nome'])
         with col2:
-            Az = st.number_input(f"Azimute (graus)", min_value=0.0, max_value=360.0, value=90.0*i, key=f"Az_{i}")
-        dados.append({'D': D, 'Az': Az})
+            reduzir = st.checkbox("Reduzir as distâncias ao plano UTM (fator de escala)", value=True)
+    
+    pontos_controle = ["Inicial"] + (["de Chegada"] if tipo == "Aberta amarrada" else [])
+    valores_padrao = {
+        "Inicial": (100.0, 200.0, -23.550000, -46.633000),
+        "de Chegada": (300.0, 200.0, -23.549000, -46.631000)
+    }
+    coordenadas = {}
+    for ponto in pontos_controle:
+        x_padrao, y_padrao, lat_padrao, lon_padrao = valores_padrao[ponto]
+        col1, col2 = st.columns(2)
+        if geograficas:
+            with col1:
+                a = st.number_input(f"Latitude {ponto} (°)", min_value=-80.0, max_value=84.0,
+                                    value=lat_padrao, format="%.8f")
+            with col2:
+                b = st.number_input(f"Longitude {ponto} (°)", min_value=-180.0, max_value=180.0,
+                                    value=lon_padrao, format="%.8f")
+        else:
+            with col1:
+                a = st.number_input(f"Coordenada X {ponto}", value=x_padrao)
+            with col2:
+                b = st.number_input(f"Coordenada Y {ponto}", value=y_padrao)
+        coordenadas[ponto] = (a, b)
     
     if st.button("Calcular Poligonal", type="primary"):
-        # Calcular incrementos
-        delta_X = []
-        delta_Y = []
-        for dado in dados:
-            Az_rad = np.radians(dado['Az'])
-            dX = dado['D'] * np.sin(Az_rad)
-            dY = dado['D'] * np.cos(Az_rad)
-            delta_X.append(dX)
-            delta_Y.append(dY)
-        
-        # Calcular coordenadas
-        X = [X0]
-        Y = [Y0]
-        for i in range(num_lados):
-            X.append(X[-1] + delta_X[i])
-            Y.append(Y[-1] + delta_Y[i])
-        
-        # Erros
-        E_x = sum(delta_X)
-        E_y = sum(delta_Y)
-        E_linear = np.sqrt(E_x**2 + E_y**2)
-        soma_D = sum([d['D'] for d in dados])
-        precisao = 1 / (E_linear / soma_D) if E_linear > 0 else float('inf')
+        try:
+            distancias = lados['Distância'].to_numpy(float)
+            if geograficas:
+                lat, lon = np.array(list(coordenadas.values())).T
+                sirgas = transformar_datum(lat, lon, 0.0, datum, 'SIRGAS2000')
+                utm = geograficas_para_utm(sirgas['latitude'], sirgas['longitude'],
+                                           fuso=fuso_utm(sirgas['longitude'][0]))
+                fuso, sul = int(utm['fuso'][0]), bool(utm['sul'][0])
+                if reduzir:
+                    distancias = distancias * utm['fator_escala'].mean()
+                X0, Y0 = utm['E'][0], utm['N'][0]
+                X_final, Y_final = (utm['E'][1], utm['N'][1]) if utm['E'].size > 1 else (None, None)
+            else:
+                X0, Y0 = coordenadas["Inicial"]
+                X_final, Y_final = coordenadas.get("de Chegada", (None, None))
+            resultado = ajustar_poligonal(distancias, lados['Azimute'].to_numpy(float),
+                                          X0, Y0, X_final, Y_final, metodo.lower())
+        except (ValueError, KeyError) as e:
+            st.error(f"Erro: {e}")
+            return
+        
+        num_lados = resultado['dx'].size
+        E_x = resultado['erro_x']
+        E_y = resultado['erro_y']
+        E_linear = resultado['erro_linear']
+        precisao = resultado['precisao']
         
         st.markdown("### ✅ Resultados")
         
         # Tabela
         df = pd.DataFrame({
-            'Lado': range(1, num_lados + 1),
-            'Distância (m)': [d['D'] for d in dados],
-            'Azimute (°)': [d['Az'] for d in dados],
-            'ΔX (m)': [f"{dx:.3f}" for dx in delta_X],
-            'ΔY (m)': [f"{dy:.3f}" for dy in delta_Y],
-            'X (m)': [f"{x:.3f}" for x in X[1:]],
-            'Y (m)': [f"{y:.3f}" for y in Y[1:]]
-        })
+            'Lado': np.arange(1, num_lados + 1),
+            'Distância (m)': lados['Distância'].to_numpy(float),
+            'Azimute (°)': lados['Azimute'].to_numpy(float),
+            'ΔX (m)': resultado['dx'],
+            'ΔY (m)': resultado['dy'],
+            'Correção X (m)': resultado['correcao_x'],
+            'Correção Y (m)': resultado['correcao_y'],
+            'X (m)': resultado['x_ajustado'][1:],
+            'Y (m)': resultado['y_ajustado'][1:]
+        }).round(4)
+        if geograficas:
+            geo = utm_para_geograficas(resultado['x_ajustado'][1:], resultado['y_ajustado'][1:], fuso, sul)
+            df['Latitude SIRGAS 2000 (°)'] = np.round(geo['latitude'], 9)
+            df['Longitude SIRGAS 2000 (°)'] = np.round(geo['longitude'], 9)
+            st.caption(f"Coordenadas X, Y em UTM, fuso {fuso}{'S' if sul else 'N'} (SIRGAS 2000)")
         st.dataframe(df, use_container_width=True)
+        st.download_button("Baixar Coordenadas Compensadas (CSV)", df.to_csv(index=False), file_name="poligonal.csv")
         
         st.markdown("---")
         st.markdown("### 📊 Verificação de Fechamento")
@@ -624,14 +1019,22 @@ def show_calculadora_poligonal():
         st.markdown("---")
         st.markdown("### 📐 Visualização da Poligonal")
         
+        X, Y = resultado['x_ajustado'], resultado['y_ajustado']
+        rotulos = num_lados <= 50
         fig = go.Figure()
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
+            x=resultado['x'], y=resultado['y'],
+            mode='lines',
+            name='Sem compensação',
+            line=dict(color='gray', width=1, dash='dash')
+        ))
+        fig.add_trace(go.Scattergl(
             x=X, y=Y,
-            mode='lines+markers+text',
-            name='Poligonal',
+            mode='lines+markers+text' if rotulos else 'lines',
+            name='Compensada',
             line=dict(color='blue', width=2),
             marker=dict(size=8, color='red'),
-            text=[f"P{i}" for i in range(len(X))],
+            text=[f"P{i}" for i in range(X.size)] if rotulos else None,
             textposition="top center"
         ))
         fig.update_layout(
@@ -643,6 +1046,443 @@ def show_calculadora_poligonal():
         )
         st.plotly_chart(fig, use_container_width=True)
 
+def show_calculadora_rede():
+    """Ajustamento de redes planimétricas por mínimos quadrados"""
+    st.subheader("🕸️ Ajustamento de Rede por Mínimos Quadrados")
+    
+    st.markdown("""
+    ### 🎯 Como Usar
+    
+    Informe os pontos (coordenadas aproximadas e quais são fixos) e as observações: distâncias (m),
+    direções (leituras em graus, desvio em segundos) e vetores GNSS (**Valor** = ΔX e **Valor Y** = ΔY).
+    As duas tabelas também podem ser carregadas de arquivos CSV com as mesmas colunas.
+    """)
+    
+    arquivo_pontos = st.file_uploader("Pontos (CSV: Ponto, X, Y, Fixo)", type=["csv"], key="pontos_rede")
+    if arquivo_pontos is not None:
+        pontos = pd.read_csv(arquivo_pontos)
+    else:
+        pontos = pd.DataFrame({
+            'Ponto': ['A', 'B', 'C', 'D'],
+            'X': [1000.0, 1500.0, 1452.0, 1048.0],
+            'Y': [1000.0, 1000.0, 1398.0, 1421.0],
+            'Fixo': [True, True, False, False]
+        })
+        pontos = st.data_editor(pontos, num_rows="dynamic", use_container_width=True, key="editor_pontos_rede")
+    
+    arquivo_obs = st.file_uploader("Observações (CSV: Tipo, De, Para, Valor, Valor Y, Desvio, Desvio Y)",
+                                   type=["csv"], key="obs_rede")
+    if arquivo_obs is not None:
+        observacoes = pd.read_csv(arquivo_obs)
+    else:
+        observacoes = pd.DataFrame({
+            'Tipo': ['Distância'] * 6 + ['Direção'] * 12,
+            'De': ['A', 'A', 'A', 'B', 'B', 'C', 'A', 'A', 'A', 'B', 'B', 'B', 'C', 'C', 'C', 'D', 'D', 'D'],
+            'Para': ['B', 'C', 'D', 'C', 'D', 'D', 'B', 'C', 'D', 'A', 'C', 'D', 'A', 'B', 'D', 'A', 'B', 'C'],
+            'Valor': [500.0, 602.565, 424.27, 400.963, 618.162, 405.106,
+                      77.50003, 36.14674, 353.97951, 69.74966, 152.91947, 112.7469,
+                      287.64606, 232.16868, 332.31703, 140.73017, 87.24595, 47.56679],
+            'Valor Y': [np.nan] * 18,
+            'Desvio': [0.003] * 6 + [2.0] * 12,
+            'Desvio Y': [np.nan] * 18
+        })
+        observacoes = st.data_editor(observacoes, num_rows="dynamic", use_container_width=True,
+                                     key="editor_obs_rede",
+                                     column_config={'Tipo': st.column_config.SelectboxColumn(
+                                         options=['Distância', 'Direção', 'GNSS'])})
+    
+    limite_w = st.number_input("Valor Crítico do Teste w", min_value=1.0, value=3.29, step=0.1)
+    
+    if st.button("Ajustar Rede", type="primary"):
+        try:
+            nomes = pd.Index(pontos['Ponto'].astype(str))
+            de = nomes.get_indexer(observacoes['De'].astype(str))
+            para = nomes.get_indexer(observacoes['Para'].astype(str))
+            tipo = observacoes['Tipo'].astype(str).to_numpy()
+            
+            def grupo(nome, campos):
+                linhas = tipo == nome
+                if not linhas.any():
+                    return None
+                dados = {'de': de[linhas], 'para': para[linhas]}
+                for campo, coluna in campos.items():
+                    dados[campo] = observacoes[coluna].to_numpy(float)[linhas]
+                return dados
+            
+            resultado = ajustar_rede(
+                pontos['X'].to_numpy(float), pontos['Y'].to_numpy(float), pontos['Fixo'].to_numpy(bool),
+                distancias=grupo('Distância', {'valor': 'Valor', 'desvio': 'Desvio'}),
+                direcoes=grupo('Direção', {'valor': 'Valor', 'desvio': 'Desvio'}),
+                gnss=grupo('GNSS', {'dx': 'Valor', 'dy': 'Valor Y', 'desvio_x': 'Desvio', 'desvio_y': 'Desvio Y'}),
+                limite_w=limite_w
+            )
+        except (ValueError, KeyError) as e:
+            st.error(f"Erro: {e}")
+            return
+        
+        obs = resultado['observacoes']
+        
+        st.markdown("### ✅ Resultados")
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("σ0² a posteriori", f"{resultado['sigma0_2']:.3f}")
+        with col2:
+            st.metric("Graus de Liberdade", f"{resultado['graus_liberdade']}")
+        with col3:
+            st.metric("Iterações", f"{resultado['iteracoes']}")
+        with col4:
+            st.metric("Observações Suspeitas", f"{int(obs['suspeita'].sum())}")
+        
+        if obs['suspeita'].any():
+            st.warning(f"⚠️ {int(obs['suspeita'].sum())} observações com |w| > {limite_w:.2f}: possíveis erros grosseiros")
+        
+        st.markdown("**Coordenadas Ajustadas e Elipses de Erro (1σ)**")
+        st.dataframe(pd.DataFrame({
+            'Ponto': nomes,
+            'X (m)': resultado['x'],
+            'Y (m)': resultado['y'],
+            'σX (mm)': 1000 * resultado['sigma_x'],
+            'σY (mm)': 1000 * resultado['sigma_y'],
+            'a (mm)': 1000 * resultado['elipse_a'],
+            'b (mm)': 1000 * resultado['elipse_b'],
+            'Azimute de a (°)': resultado['elipse_azimute']
+        }).round(4), use_container_width=True)
+        
+        st.markdown("**Resíduos das Observações**")
+        residuos = pd.DataFrame({
+            'Tipo': np.array(['Distância', 'Direção', 'GNSS X', 'GNSS Y'])[obs['tipo']],
+            'Resíduo (m ou ")': obs['residuo'],
+            'w': obs['w'],
+            'Redundância': obs['redundancia'],
+            'Suspeita': obs['suspeita']
+        }).round(4)
+        st.dataframe(residuos, use_container_width=True)
+        
+        # Elipses ampliadas para visualização (maior semi-eixo ≈ 5% da extensão da rede)
+        extensao = max(np.ptp(resultado['x']), np.ptp(resultado['y']), 1.0)
+        maior = np.nanmax(resultado['elipse_a'])
+        escala = 0.05 * extensao / maior if maior > 0 else 1.0
+        t = np.linspace(0, 2 * np.pi, 60)
+        az = np.radians(resultado['elipse_azimute'])[:, None]
+        a = escala * resultado['elipse_a'][:, None]
+        b = escala * resultado['elipse_b'][:, None]
+        ex = resultado['x'][:, None] + a * np.cos(t) * np.sin(az) + b * np.sin(t) * np.cos(az)
+        ey = resultado['y'][:, None] + a * np.cos(t) * np.cos(az) - b * np.sin(t) * np.sin(az)
+        separador = np.full((ex.shape[0], 1), np.nan)
+        
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=np.hstack([ex, separador]).ravel(), y=np.hstack([ey, separador]).ravel(),
+                                 mode='lines', name=f'Elipses (×{escala:.0f})', line=dict(color='red', width=1)))
+        fixos = pontos['Fixo'].to_numpy(bool)
+        modo = 'markers+text' if nomes.size <= 50 else 'markers'
+        fig.add_trace(go.Scatter(x=resultado['x'][fixos], y=resultado['y'][fixos], mode=modo,
+                                 name='Fixos', text=nomes[fixos], textposition="top center",
+                                 marker=dict(size=10, symbol='triangle-up', color='black')))
+        fig.add_trace(go.Scatter(x=resultado['x'][~fixos], y=resultado['y'][~fixos], mode=modo,
+                                 name='Ajustados', text=nomes[~fixos], textposition="top center",
+                                 marker=dict(size=8, color='blue')))
+        fig.update_layout(title="Rede Ajustada", xaxis_title="X (m)", yaxis_title="Y (m)", height=550,
+                          xaxis=dict(scaleanchor="y", scaleratio=1), template='plotly_white')
+        st.plotly_chart(fig, use_container_width=True)
+
+def show_calculadora_terreno():
+    """Modelo digital do terreno (TIN) e volumes de corte e aterro"""
+    st.subheader("🗻 Modelo Digital do Terreno")
+    
+    st.markdown("""
+    ### 🎯 Como Usar
+    
+    Carregue a nuvem de pontos do levantamento (topografia ou LiDAR) em texto com colunas **X Y Z**.
+    O arquivo é convertido para um binário mapeado em memória e triangulado em blocos, de modo que
+    nuvens com milhões de pontos não precisam caber inteiras na memória. Os volumes são calculados
+    em relação a um plano de projeto (cota e inclinações) ou a uma segunda superfície.
+    Sem arquivo, é usado um terreno de exemplo.
+    """)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        arquivo = st.file_uploader("Pontos do terreno (XYZ)", type=["txt", "xyz", "csv"], key="pontos_terreno")
+    with col2:
+        arquivo_projeto = st.file_uploader("Superfície de projeto (XYZ, opcional)", type=["txt", "xyz", "csv"],
+                                           key="pontos_projeto")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        separador = st.selectbox("Separador", ["Espaço/Tabulação", "Vírgula", "Ponto e vírgula"])
+    with col2:
+        cabecalho = st.number_input("Linhas de Cabeçalho", min_value=0, value=0, step=1)
+    
+    if arquivo_projeto is None:
+        st.markdown("**Plano de Projeto**")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            cota = st.number_input("Cota na Origem (m)", value=100.0, step=0.5)
+        with col2:
+            inclinacao_x = st.number_input("Inclinação em X (%)", value=0.0, step=0.5)
+        with col3:
+            inclinacao_y = st.number_input("Inclinação em Y (%)", value=0.0, step=0.5)
+        col1, col2 = st.columns(2)
+        with col1:
+            origem_x = st.number_input("X da Origem (m)", value=0.0, step=10.0)
+        with col2:
+            origem_y = st.number_input("Y da Origem (m)", value=0.0, step=10.0)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        aresta_maxima = st.number_input("Aresta Máxima dos Triângulos (m, 0 = sem limite)", min_value=0.0,
+                                        value=0.0, step=5.0)
+    with col2:
+        pontos_por_tile = st.number_input("Pontos por Bloco", min_value=10_000, value=2_000_000, step=100_000)
+    
+    if st.button("Calcular Volumes", type="primary"):
+        try:
+            sep = {"Espaço/Tabulação": None, "Vírgula": ",", "Ponto e vírgula": ";"}[separador]
+            
+            # Arquivos convertidos ficam num diretório temporário removido ao fim do cálculo
+            with tempfile.TemporaryDirectory() as pasta:
+                def carregar(envio, nome):
+                    caminho = os.path.join(pasta, nome + ".txt")
+                    with open(caminho, "wb") as destino:
+                        destino.write(envio.getbuffer())
+                    return converter_xyz(caminho, os.path.join(pasta, nome + ".npy"), sep, int(cabecalho))
+                
+                if arquivo is not None:
+                    pontos = carregar(arquivo, "terreno")
+                else:
+                    rng = np.random.default_rng(0)
+                    xy = rng.uniform(0.0, 500.0, size=(20000, 2))
+                    z = 100 + 6 * np.sin(xy[:, 0] / 80) * np.cos(xy[:, 1] / 120) + 0.01 * xy[:, 1]
+                    pontos = np.column_stack([xy, z])
+                superficie = carregar(arquivo_projeto, "projeto") if arquivo_projeto is not None else None
+                
+                if superficie is None:
+                    resultado = volumes_terreno(pontos, cota, inclinacao_x / 100, inclinacao_y / 100,
+                                                (origem_x, origem_y), aresta_maxima=aresta_maxima or None,
+                                                pontos_por_tile=int(pontos_por_tile))
+                else:
+                    resultado = volumes_terreno(pontos, superficie=superficie, aresta_maxima=aresta_maxima or None,
+                                                pontos_por_tile=int(pontos_por_tile))
+                
+                # Amostra copiada para a visualização antes de liberar os arquivos mapeados
+                amostra = np.array(pontos[::max(1, pontos.shape[0] // 20000)])
+                del pontos, superficie
+        except (ValueError, OSError) as e:
+            st.error(f"Erro: {e}")
+            return
+        
+        st.markdown("### ✅ Resultados")
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Volume de Corte", f"{resultado['corte']:,.1f} m³")
+        with col2:
+            st.metric("Volume de Aterro", f"{resultado['aterro']:,.1f} m³")
+        with col3:
+            st.metric("Área Triangulada", f"{resultado['area']:,.1f} m²")
+        with col4:
+            st.metric("Triângulos", f"{resultado['triangulos']:,}", help=f"{resultado['tiles']} bloco(s)")
+        
+        st.metric("Volume Líquido (Corte - Aterro)", f"{resultado['corte'] - resultado['aterro']:,.1f} m³")
+        
+        # Visualização de uma amostra da nuvem
+        try:
+            triangulos = Delaunay(amostra[:, :2]).simplices
+        except QhullError:
+            st.info("A amostra exibida é colinear; visualização 3D omitida.")
+            return
+        fig = go.Figure(go.Mesh3d(x=amostra[:, 0], y=amostra[:, 1], z=amostra[:, 2], i=triangulos[:, 0],
+                                  j=triangulos[:, 1], k=triangulos[:, 2], intensity=amostra[:, 2],
+                                  colorscale='Earth', colorbar=dict(title='Cota (m)')))
+        fig.update_layout(title=f"Modelo Digital do Terreno ({amostra.shape[0]:,} pontos exibidos)", height=600,
+                          scene=dict(xaxis_title='X (m)', yaxis_title='Y (m)', zaxis_title='Cota (m)',
+                                     aspectmode='data'), template='plotly_white')
+        st.plotly_chart(fig, use_container_width=True)
+
+def show_calculadora_curvas_nivel():
+    """Curvas de nível, cotas em pontos quaisquer e perfis sobre o TIN"""
+    st.subheader("🗺️ Curvas de Nível e Consultas ao Terreno")
+    
+    st.markdown("""
+    ### 🎯 Como Usar
+    
+    Informe os pontos levantados (por exemplo, as coordenadas compensadas da poligonal acrescidas das
+    cotas) na tabela ou em um arquivo CSV com as colunas **X**, **Y** e **Z** (ou **Cota**). Os pontos são
+    triangulados e indexados numa grade espacial, de modo que cada consulta de cota percorre apenas os
+    triângulos vizinhos.
+    """)
+    
+    arquivo = st.file_uploader("Pontos levantados (CSV)", type=["csv"], key="pontos_curvas_nivel")
+    if arquivo is None:
+        rng = np.random.default_rng(7)
+        xy = rng.uniform(0.0, 200.0, size=(80, 2))
+        pontos = pd.DataFrame({
+            'X': xy[:, 0].round(2),
+            'Y': xy[:, 1].round(2),
+            'Z': (50 + 8 * np.exp(-((xy[:, 0] - 120)**2 + (xy[:, 1] - 90)**2) / 3000) + 0.03 * xy[:, 0]).round(3)
+        })
+        pontos = st.data_editor(pontos, num_rows="dynamic", use_container_width=True, key="tabela_curvas_nivel")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        equidistancia = st.number_input("Equidistância (m)", min_value=0.01, value=0.5, step=0.1)
+    with col2:
+        intervalo_mestra = st.number_input("Curva Mestra a Cada", min_value=1, value=5, step=1)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("**Pontos de Consulta**")
+        consultas = pd.DataFrame({'X': [50.0, 120.0, 180.0], 'Y': [40.0, 90.0, 150.0]})
+        consultas = st.data_editor(consultas, num_rows="dynamic", use_container_width=True, key="consultas_terreno")
+    with col2:
+        st.markdown("**Polilinha do Perfil**")
+        polilinha = pd.DataFrame({'X': [10.0, 100.0, 190.0], 'Y': [20.0, 120.0, 60.0]})
+        polilinha = st.data_editor(polilinha, num_rows="dynamic", use_container_width=True, key="polilinha_terreno")
+        intervalo = st.number_input("Intervalo do Perfil (m)", min_value=0.1, value=5.0, step=1.0)
+    
+    if st.button("Gerar Curvas de Nível", type="primary"):
+        try:
+            if arquivo is not None:
+                pontos = pd.read_csv(arquivo)
+                pontos.columns = [str(c).replace(' (m)', '').strip() for c in pontos.columns]
+                if 'Z' not in pontos.columns:
+                    pontos = pontos.rename(columns={'Cota': 'Z'})
+            pontos = pontos.dropna(subset=['X', 'Y', 'Z'])
+            tin = criar_tin(pontos['X'].to_numpy(float), pontos['Y'].to_numpy(float), pontos['Z'].to_numpy(float))
+            curvas = curvas_nivel(tin, equidistancia, int(intervalo_mestra))
+            consultas = consultas.dropna()
+            cotas = cotas_tin(tin, consultas['X'].to_numpy(float), consultas['Y'].to_numpy(float))
+            polilinha = polilinha.dropna()
+            perfil = perfil_tin(tin, polilinha['X'].to_numpy(float), polilinha['Y'].to_numpy(float), intervalo)
+        except (ValueError, KeyError) as e:
+            st.error(f"Erro: {e}")
+            return
+        
+        st.markdown("### ✅ Resultados")
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Pontos", f"{tin['x'].size:,}")
+        with col2:
+            st.metric("Triângulos", f"{tin['triangulos'].shape[0]:,}")
+        with col3:
+            st.metric("Cota Mínima", f"{tin['z'].min():.3f} m")
+        with col4:
+            st.metric("Cota Máxima", f"{tin['z'].max():.3f} m")
+        
+        st.markdown("**Cotas nos Pontos de Consulta**")
+        st.dataframe(pd.DataFrame({
+            'X (m)': consultas['X'].to_numpy(float),
+            'Y (m)': consultas['Y'].to_numpy(float),
+            'Cota (m)': cotas
+        }).round(3), use_container_width=True)
+        if np.isnan(cotas).any():
+            st.warning("⚠️ Pontos fora da área triangulada ficam sem cota")
+        
+        fig = go.Figure()
+        for mestra, cor, largura, nome in [(False, 'peru', 1, 'Curvas intermediárias'),
+                                           (True, 'saddlebrown', 2, 'Curvas mestras')]:
+            selecao = curvas['mestra'] == mestra
+            n = int(selecao.sum())
+            x = np.column_stack([curvas['x'][selecao], np.full(n, np.nan)]).ravel()
+            y = np.column_stack([curvas['y'][selecao], np.full(n, np.nan)]).ravel()
+            fig.add_trace(go.Scattergl(x=x, y=y, mode='lines', name=nome, line=dict(color=cor, width=largura)))
+        fig.add_trace(go.Scattergl(x=tin['x'], y=tin['y'], mode='markers', name='Pontos levantados',
+                                   marker=dict(size=4, color='black')))
+        fig.add_trace(go.Scatter(x=polilinha['X'], y=polilinha['Y'], mode='lines+markers', name='Perfil',
+                                 line=dict(color='blue', width=2, dash='dash')))
+        fig.add_trace(go.Scatter(x=consultas['X'], y=consultas['Y'], mode='markers', name='Consultas',
+                                 marker=dict(size=10, color='red', symbol='x')))
+        fig.update_layout(title="Curvas de Nível", xaxis_title="X (m)", yaxis_title="Y (m)", height=600,
+                          xaxis=dict(scaleanchor="y", scaleratio=1), template='plotly_white')
+        st.plotly_chart(fig, use_container_width=True)
+        
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=perfil['distancia'], y=perfil['cota'], mode='lines', name='Terreno',
+                                 line=dict(color='saddlebrown', width=2)))
+        fig.update_layout(title="Perfil do Terreno", xaxis_title="Distância (m)", yaxis_title="Cota (m)",
+                          height=350, template='plotly_white')
+        st.plotly_chart(fig, use_container_width=True)
+        
+        st.download_button("Baixar Perfil (CSV)", pd.DataFrame({
+            'Distância (m)': perfil['distancia'],
+            'X (m)': perfil['x'],
+            'Y (m)': perfil['y'],
+            'Cota (m)': perfil['cota']
+        }).to_csv(index=False), file_name="perfil_terreno.csv")
+
+def show_calculadora_lotes():
+    """Áreas, perímetros e centroides de lotes"""
+    st.subheader("🏘️ Áreas de Lotes")
+    
+    st.markdown("""
+    ### 🎯 Como Usar
+    
+    Informe os vértices de cada lote em ordem (horária ou anti-horária), um por linha, com as colunas
+    **Lote**, **X** e **Y**; as linhas de um mesmo lote devem ser consecutivas. Um arquivo CSV sem a
+    coluna **Lote** (por exemplo, as coordenadas compensadas da poligonal) é tratado como um único
+    polígono.
+    """)
+    
+    arquivo = st.file_uploader("Vértices dos lotes (CSV)", type=["csv"], key="vertices_lotes")
+    if arquivo is None:
+        vertices = pd.DataFrame({
+            'Lote': ['L1'] * 4 + ['L2'] * 4 + ['L3'] * 5,
+            'X': [0.0, 12.0, 12.0, 0.0, 12.0, 24.0, 24.0, 12.0, 24.0, 40.0, 42.0, 30.0, 24.0],
+            'Y': [0.0, 0.0, 30.0, 30.0, 0.0, 0.0, 30.0, 30.0, 0.0, 0.0, 18.0, 30.0, 30.0]
+        })
+        vertices = st.data_editor(vertices, num_rows="dynamic", use_container_width=True, key="tabela_lotes")
+    
+    if st.button("Calcular Áreas", type="primary"):
+        try:
+            if arquivo is not None:
+                vertices = pd.read_csv(arquivo)
+                vertices.columns = [str(c).replace(' (m)', '').strip() for c in vertices.columns]
+                if 'Lote' not in vertices.columns:
+                    vertices['Lote'] = 'Poligonal'
+            vertices = vertices.dropna(subset=['Lote', 'X', 'Y'])
+            lote = vertices['Lote'].astype(str).to_numpy()
+            inicio = np.flatnonzero(np.r_[True, lote[1:] != lote[:-1]])
+            x = vertices['X'].to_numpy(float)
+            y = vertices['Y'].to_numpy(float)
+            resultado = propriedades_poligonos(x, y, inicio)
+        except (ValueError, KeyError) as e:
+            st.error(f"Erro: {e}")
+            return
+        
+        st.markdown("### ✅ Resultados")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Lotes", f"{inicio.size:,}")
+        with col2:
+            st.metric("Área Total", f"{resultado['area'].sum():,.2f} m²")
+        with col3:
+            st.metric("Área Média", f"{resultado['area'].mean():,.2f} m²")
+        
+        df = pd.DataFrame({
+            'Lote': lote[inicio],
+            'Vértices': np.diff(np.append(inicio, x.size)),
+            'Área (m²)': resultado['area'],
+            'Área (ha)': resultado['area'] / 10000,
+            'Perímetro (m)': resultado['perimetro'],
+            'Centroide X (m)': resultado['centroide_x'],
+            'Centroide Y (m)': resultado['centroide_y'],
+            'Sentido': np.where(resultado['horario'], 'Horário', 'Anti-horário')
+        })
+        st.dataframe(df.round(4), use_container_width=True)
+        st.download_button("Baixar Quadro de Áreas (CSV)", df.to_csv(index=False), file_name="lotes.csv")
+        
+        # Contornos fechados separados por NaN em um único traço
+        fechamento = np.append(inicio[1:], x.size)
+        posicoes = np.insert(np.arange(x.size), np.repeat(fechamento, 2), -1)
+        posicoes[np.flatnonzero(posicoes == -1)[0::2]] = inicio
+        xp = np.where(posicoes >= 0, x[posicoes], np.nan)
+        yp = np.where(posicoes >= 0, y[posicoes], np.nan)
+        fig = go.Figure()
+        fig.add_trace(go.Scattergl(x=xp, y=yp, mode='lines', name='Lotes', line=dict(color='green', width=1)))
+        fig.add_trace(go.Scattergl(x=resultado['centroide_x'], y=resultado['centroide_y'], mode='markers',
+                                   name='Centroides', text=lote[inicio], marker=dict(size=5, color='red')))
+        fig.update_layout(title="Lotes", xaxis_title="X (m)", yaxis_title="Y (m)", height=550,
+                          xaxis=dict(scaleanchor="y", scaleratio=1), template='plotly_white')
+        st.plotly_chart(fig, use_container_width=True)
+
 def show():
     """Função principal do módulo de Transportes"""
     st.title("🛣️ Módulo de Transportes & Topografia")
@@ -661,7 +1501,9 @@ def show():
     with tab_calc:
         calc_tab = st.radio(
             "Selecione a Calculadora:",
-            ["Curvas Horizontais", "Poligonal Topográfica"],
+            ["Curvas Horizontais", "Alinhamento Horizontal", "Perfil e Terraplenagem", "Poligonal Topográfica",
+             "Ajustamento de Rede", "Modelo Digital do Terreno", "Curvas de Nível",
+             "Áreas de Lotes"],
             horizontal=True
         )
         
@@ -669,6 +1511,18 @@ def show():
         
         if calc_tab == "Curvas Horizontais":
             show_calculadora_curvas()
+        elif calc_tab == "Alinhamento Horizontal":
+            show_calculadora_alinhamento()
+        elif calc_tab == "Perfil e Terraplenagem":
+            show_calculadora_perfil()
         elif calc_tab == "Poligonal Topográfica":
             show_calculadora_poligonal()
+        elif calc_tab == "Ajustamento de Rede":
+            show_calculadora_rede()
+        elif calc_tab == "Modelo Digital do Terreno":
+            show_calculadora_terreno()
+        elif calc_tab == "Curvas de Nível":
+            show_calculadora_curvas_nivel()
+        elif calc_tab == "Áreas de Lotes":
+            show_calculadora_lotes()
 
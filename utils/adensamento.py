@@ -0,0 +1,130 @@
+"""
+Adensamento unidimensional de Terzaghi - diferenças finitas implícitas
+Perfis com várias camadas, condições de drenagem e carregamento variável
+"""
+
+import numpy as np
+from scipy.linalg import solve_banded
+
+def _malha_camadas(espessuras, cv, mv, nos_por_metro, min_elementos):
+    """Malha 1D com nós nas interfaces das camadas (z positivo para baixo)"""
+    z = [0.0]
+    cv_el, mv_el = [], []
+    for H, c, m in zip(espessuras, cv, mv):
+        n = max(min_elementos, int(np.ceil(H * nos_por_metro)))
+        z.extend(z[-1] + H * np.arange(1, n + 1) / n)
+        cv_el.extend([c] * n)
+        mv_el.extend([m] * n)
+    return np.array(z), np.array(cv_el), np.array(mv_el)
+
+def simular_adensamento(espessuras, cv, mv, tempos_carga, cargas, t_final,
+                        drenagem_topo=True, drenagem_base=True, n_passos=200,
+                        nos_por_metro=20, min_elementos=10):
+    """
+    Resolve o adensamento 1D em perfil estratificado
+    
+    Equação: mv·∂u/∂t = ∂/∂z(cv·mv·∂u/∂z) + mv·∂σ/∂t, com σ uniforme na
+    profundidade. Volumes finitos centrados nos nós (fluxo contínuo nas
+    interfaces) e Euler implícito; cada passo é um sistema tridiagonal
+    resolvido por solve_banded em O(n_nós). Os passos de tempo crescem
+    geometricamente para cobrir várias décadas.
+    
+    Parameters:
+    -----------
+    espessuras : array
+        Espessura de cada camada, do topo para a base (m)
+    cv : array
+        Coeficiente de adensamento de cada camada (m²/ano)
+    mv : array
+        Coeficiente de variação volumétrica de cada camada (1/kPa)
+    tempos_carga : array
+        Instantes da história de carregamento (anos, crescente)
+    cargas : array
+        Acréscimo de tensão total em cada instante (kPa); interpolação
+        linear entre instantes (rampas de construção)
+    t_final : float
+        Tempo final da simulação (anos)
+    drenagem_topo, drenagem_base : bool
+        Fronteira drenante (u = 0) ou impermeável (fluxo nulo)
+    n_passos : int
+        Número de passos de tempo
+    nos_por_metro : float
+        Densidade da malha
+    min_elementos : int
+        Número mínimo de elementos por camada
+    
+    Returns:
+    --------
+    dict : {'t': anos, 'z': m, 'u': kPa (n_t × n_nós), 'carga': kPa,
+            'recalque': m, 'recalque_final': m, 'grau_adensamento'}
+    """
+    espessuras = np.atleast_1d(np.asarray(espessuras, dtype=float))
+    cv = np.broadcast_to(np.asarray(cv, dtype=float), espessuras.shape)
+    mv = np.broadcast_to(np.asarray(mv, dtype=float), espessuras.shape)
+    tempos_carga = np.atleast_1d(np.asarray(tempos_carga, dtype=float))
+    cargas = np.atleast_1d(np.asarray(cargas, dtype=float))
+    
+    if not (drenagem_topo or drenagem_base):
+        raise ValueError("Ao menos uma fronteira deve ser drenante")
+    
+    z, cv_el, mv_el = _malha_camadas(espessuras, cv, mv, nos_por_metro, min_elementos)
+    dz = np.diff(z)
+    n = z.size
+    
+    # Capacidade nodal (mv·Δz) e condutância entre nós (cv·mv/Δz)
+    capacidade = np.zeros(n)
+    capacidade[:-1] += 0.5 * mv_el * dz
+    capacidade[1:] += 0.5 * mv_el * dz
+    condutancia = cv_el * mv_el / dz
+    
+    # Tempos: progressão geométrica + instantes de mudança de carga
+    t_min = t_final * 1e-6
+    t = np.concatenate([[0.0], np.geomspace(t_min, t_final, n_passos)])
+    t = np.unique(np.concatenate([t, tempos_carga[(tempos_carga > 0) & (tempos_carga < t_final)]]))
+    sigma = np.interp(t, tempos_carga, cargas, left=0.0 if tempos_carga[0] > 0 else cargas[0])
+    
+    drenado = np.zeros(n, dtype=bool)
+    drenado[0] = drenagem_topo
+    drenado[-1] = drenagem_base
+    
+    u = np.zeros((t.size, n))
+    u[0] = np.where(drenado, 0.0, sigma[0])
+    
+    # Matriz de rigidez tridiagonal (formato banded: superdiagonal, diagonal, subdiagonal)
+    rigidez = np.zeros((3, n))
+    rigidez[0, 1:] = -condutancia
+    rigidez[2, :-1] = -condutancia
+    rigidez[1, :-1] += condutancia
+    rigidez[1, 1:] += condutancia
+    
+    for k in range(1, t.size):
+        dt = t[k] - t[k - 1]
+        ab = rigidez.copy()
+        ab[1] += capacidade / dt
+        rhs = capacidade / dt * (u[k - 1] + sigma[k] - sigma[k - 1])
+        
+        # Fronteiras drenantes: linha identidade com u = 0
+        for i in np.flatnonzero(drenado):
+            ab[1, i] = 1.0
+            rhs[i] = 0.0
+            if i > 0:
+                ab[2, i - 1] = 0.0
+            if i < n - 1:
+                ab[0, i + 1] = 0.0
+        
+        u[k] = solve_banded((1, 1), ab, rhs)
+    
+    # Recalque = ∫ mv·(σ - u) dz (regra dos trapézios por elemento)
+    tensao_efetiva = sigma[:, None] - u
+    recalque = (0.5 * (tensao_efetiva[:, :-1] + tensao_efetiva[:, 1:]) * (mv_el * dz)).sum(axis=1)
+    recalque_final = cargas[-1] * np.sum(mv * espessuras)
+    
+    return {
+        't': t,
+        'z': z,
+        'u': u,
+        'carga': sigma,
+        'recalque': recalque,
+        'recalque_final': recalque_final,
+        'grau_adensamento': recalque / recalque_final if recalque_final > 0 else np.zeros_like(recalque)
+    }
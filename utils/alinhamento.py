@@ -0,0 +1,270 @@
+"""
+Alinhamento horizontal de rodovias
+Tangentes, curvas circulares e transições em clotoide encadeadas a partir
+dos PIs, com estaqueamento acumulado e avaliação vetorizada de coordenadas
+e azimutes (integrais de Fresnel nas espirais)
+"""
+
+import numpy as np
+from scipy.special import fresnel
+
+# Tipos de elemento do alinhamento
+TANGENTE, CIRCULAR, ESPIRAL_ENTRADA, ESPIRAL_SAIDA = 0, 1, 2, 3
+
+def _azimute(dx, dy):
+    """Azimute a partir do Norte, sentido horário, em [0, 2π)"""
+    return np.mod(np.arctan2(dx, dy), 2 * np.pi)
+
+def _deflexao(az_entrada, az_saida):
+    """Deflexão com sinal em (-π, π]: positiva à direita"""
+    return np.pi - np.mod(np.pi - (az_saida - az_entrada), 2 * np.pi)
+
+def _clotoide(l, A):
+    """Coordenadas locais (x ao longo da tangente, y afastamento) da clotoide R·L = A²"""
+    escala = A * np.sqrt(np.pi)
+    S, C = fresnel(l / np.where(escala > 0, escala, 1.0))
+    return escala * C, escala * S
+
+def elementos_espiral(raio, comprimento_espiral, deflexao):
+    """
+    Elementos da curva circular com transições em clotoide simétricas
+    
+    Parameters:
+    -----------
+    raio : float or array
+        Raio da curva circular (m)
+    comprimento_espiral : float or array
+        Comprimento de cada espiral Ls (m); 0 para curva circular simples
+    deflexao : float or array
+        Deflexão total Δ entre as tangentes (graus, valor absoluto)
+    
+    Returns:
+    --------
+    dict : {'theta_s' (graus), 'Xs', 'Ys', 'p', 'k', 'tangente' (Ts),
+            'desenvolvimento_circular' (Dc), 'deflexao_circular' (graus)}
+    """
+    R = np.asarray(raio, dtype=float)
+    Ls = np.asarray(comprimento_espiral, dtype=float)
+    delta = np.radians(np.abs(np.asarray(deflexao, dtype=float)))
+    
+    theta_s = Ls / (2 * R)
+    Xs, Ys = _clotoide(Ls, np.sqrt(R * Ls))
+    p = Ys - R * (1 - np.cos(theta_s))
+    k = Xs - R * np.sin(theta_s)
+    delta_c = delta - 2 * theta_s
+    
+    return {
+        'theta_s': np.degrees(theta_s),
+        'Xs': Xs,
+        'Ys': Ys,
+        'p': p,
+        'k': k,
+        'tangente': k + (R + p) * np.tan(delta / 2),
+        'desenvolvimento_circular': R * delta_c,
+        'deflexao_circular': np.degrees(delta_c)
+    }
+
+def criar_alinhamento(pis_x, pis_y, raios, comprimentos_espiral=None, estaca_inicial=0.0):
+    """
+    Monta o alinhamento horizontal a partir dos PIs, raios e espirais
+    
+    O alinhamento é representado por uma tabela de elementos com estaca
+    inicial, ponto e azimute de referência, curvatura (arcos) e parâmetro
+    A da clotoide (espirais); qualquer estaca é avaliada localizando seu
+    elemento com np.searchsorted (ver avaliar_alinhamento). Cada curva gera
+    a sequência espiral de entrada, arco, espiral de saída e tangente;
+    elementos de comprimento nulo são mantidos para uma indexação regular.
+    
+    Parameters:
+    -----------
+    pis_x, pis_y : array (n,)
+        Coordenadas dos PIs, incluindo o início e o fim do traçado (m)
+    raios : array (n - 2,)
+        Raio da curva circular em cada PI interno (m)
+    comprimentos_espiral : array (n - 2,), optional
+        Comprimento Ls das espirais de cada curva (m). Padrão: 0
+    estaca_inicial : float
+        Estaca do primeiro ponto (m)
+    
+    Returns:
+    --------
+    dict : {'elementos': arrays 'tipo', 'estaca', 'comprimento', 'x', 'y',
+            'azimute', 'curvatura', 'A', 'sentido'; 'curvas': arrays por PI
+            interno ('deflexao', 'raio', 'Ls', 'tangente', 'desenvolvimento',
+            elementos da espiral e estacas TS, SC, CS, ST); 'estaca_inicial';
+            'comprimento': extensão total (m)}
+        Para as espirais de saída, o ponto e o azimute de referência são os
+        do ST.
+    """
+    x = np.asarray(pis_x, dtype=float)
+    y = np.asarray(pis_y, dtype=float)
+    raios = np.atleast_1d(np.asarray(raios, dtype=float))
+    if x.size < 2:
+        raise ValueError("São necessários ao menos dois PIs")
+    if raios.size != x.size - 2:
+        raise ValueError("Informe um raio para cada PI interno")
+    if np.any(raios <= 0):
+        raise ValueError("Os raios devem ser positivos")
+    Ls = np.zeros_like(raios) if comprimentos_espiral is None else np.broadcast_to(
+        np.asarray(comprimentos_espiral, dtype=float), raios.shape)
+    if np.any(Ls < 0):
+        raise ValueError("Os comprimentos de espiral não podem ser negativos")
+    
+    dx, dy = np.diff(x), np.diff(y)
+    distancias = np.hypot(dx, dy)
+    azimutes = _azimute(dx, dy)
+    az_entrada, az_saida = azimutes[:-1], azimutes[1:]
+    
+    deflexao = _deflexao(az_entrada, az_saida)
+    sentido = np.sign(deflexao)
+    espiral = elementos_espiral(raios, Ls, np.degrees(deflexao))
+    if np.any(espiral['deflexao_circular'] < -1e-9):
+        i = int(np.argmin(espiral['deflexao_circular']))
+        raise ValueError(f"As espirais do PI {i + 1} excedem a deflexão da curva (2θs > Δ)")
+    tangente = espiral['tangente']
+    desenvolvimento_circular = np.maximum(espiral['desenvolvimento_circular'], 0.0)
+    
+    # Comprimento das tangentes entre curvas
+    recuo = np.concatenate([[0.0], tangente, [0.0]])
+    trechos_retos = distancias - recuo[:-1] - recuo[1:]
+    if np.any(trechos_retos < -1e-9):
+        i = int(np.argmin(trechos_retos))
+        raise ValueError(f"As curvas se sobrepõem entre os PIs {i} e {i + 1}")
+    trechos_retos = np.maximum(trechos_retos, 0.0)
+    
+    # Pontos notáveis de cada curva
+    x_TS = x[1:-1] - tangente * np.sin(az_entrada)
+    y_TS = y[1:-1] - tangente * np.cos(az_entrada)
+    x_ST = x[1:-1] + tangente * np.sin(az_saida)
+    y_ST = y[1:-1] + tangente * np.cos(az_saida)
+    A = np.sqrt(raios * Ls)
+    x_SC = x_TS + espiral['Xs'] * np.sin(az_entrada) + sentido * espiral['Ys'] * np.cos(az_entrada)
+    y_SC = y_TS + espiral['Xs'] * np.cos(az_entrada) - sentido * espiral['Ys'] * np.sin(az_entrada)
+    az_SC = az_entrada + sentido * Ls / (2 * raios)
+    
+    # Elementos: tangente inicial + (espiral, arco, espiral, tangente) por curva
+    n = raios.size
+    tipo = np.zeros(4 * n + 1, dtype=np.int8)
+    tipo[1::4], tipo[2::4], tipo[3::4] = ESPIRAL_ENTRADA, CIRCULAR, ESPIRAL_SAIDA
+    comprimento = np.zeros(tipo.size)
+    comprimento[0::4] = trechos_retos
+    comprimento[1::4] = Ls
+    comprimento[2::4] = desenvolvimento_circular
+    comprimento[3::4] = Ls
+    
+    x_ref = np.empty(tipo.size)
+    y_ref = np.empty(tipo.size)
+    azimute = np.empty(tipo.size)
+    x_ref[0], y_ref[0], azimute[0] = x[0], y[0], azimutes[0]
+    x_ref[1::4], y_ref[1::4], azimute[1::4] = x_TS, y_TS, az_entrada
+    x_ref[2::4], y_ref[2::4], azimute[2::4] = x_SC, y_SC, az_SC
+    x_ref[3::4], y_ref[3::4], azimute[3::4] = x_ST, y_ST, az_saida
+    x_ref[4::4], y_ref[4::4], azimute[4::4] = x_ST, y_ST, az_saida
+    
+    curvatura = np.zeros(tipo.size)
+    curvatura[2::4] = sentido / raios
+    parametro_A = np.zeros(tipo.size)
+    parametro_A[1::4] = A
+    parametro_A[3::4] = A
+    sentido_el = np.zeros(tipo.size)
+    for deslocamento in (1, 2, 3):
+        sentido_el[deslocamento::4] = sentido
+    
+    estaca = estaca_inicial + np.concatenate([[0.0], np.cumsum(comprimento)[:-1]])
+    
+    return {
+        'elementos': {
+            'tipo': tipo,
+            'estaca': estaca,
+            'comprimento': comprimento,
+            'x': x_ref,
+            'y': y_ref,
+            'azimute': azimute,
+            'curvatura': curvatura,
+            'A': parametro_A,
+            'sentido': sentido_el
+        },
+        'curvas': {
+            'deflexao': np.degrees(deflexao),
+            'raio': raios,
+            'Ls': Ls,
+            'theta_s': espiral['theta_s'],
+            'Xs': espiral['Xs'],
+            'Ys': espiral['Ys'],
+            'p': espiral['p'],
+            'k': espiral['k'],
+            'tangente': tangente,
+            'desenvolvimento': desenvolvimento_circular,
+            'estaca_TS': estaca[1::4],
+            'estaca_SC': estaca[2::4],
+            'estaca_CS': estaca[3::4],
+            'estaca_ST': estaca[4::4]
+        },
+        'estaca_inicial': estaca_inicial,
+        'comprimento': float(comprimento.sum())
+    }
+
+def avaliar_alinhamento(alinhamento, estacas, afastamento=0.0):
+    """
+    Coordenadas e azimutes em estacas arbitrárias do alinhamento
+    
+    Parameters:
+    -----------
+    alinhamento : dict
+        Resultado de criar_alinhamento
+    estacas : float or array
+        Estacas a avaliar (m); valores fora do traçado são limitados às
+        extremidades
+    afastamento : float or array
+        Afastamento lateral do eixo (m, positivo à direita)
+    
+    Returns:
+    --------
+    dict : {'x', 'y', 'azimute' (graus), 'elemento'}
+    """
+    el = alinhamento['elementos']
+    inicio = alinhamento['estaca_inicial']
+    estacas = np.clip(np.asarray(estacas, dtype=float), inicio, inicio + alinhamento['comprimento'])
+    
+    i = np.clip(np.searchsorted(el['estaca'], estacas, side='right') - 1, 0, el['tipo'].size - 1)
+    ds = estacas - el['estaca'][i]
+    az0 = el['azimute'][i]
+    k = el['curvatura'][i]
+    tipo = el['tipo'][i]
+    
+    # Tangentes e arcos: corda do arco (reduz-se à tangente quando k = 0)
+    corda = ds * np.sinc(k * ds / (2 * np.pi))
+    az_medio = az0 + k * ds / 2
+    x = el['x'][i] + corda * np.sin(az_medio)
+    y = el['y'][i] + corda * np.cos(az_medio)
+    az = az0 + k * ds
+    
+    # Espirais: integrais de Fresnel apenas nos pontos em espiral
+    em_espiral = (tipo == ESPIRAL_ENTRADA) | (tipo == ESPIRAL_SAIDA)
+    if np.any(em_espiral):
+        j = i[em_espiral]
+        entrada = tipo[em_espiral] == ESPIRAL_ENTRADA
+        A = el['A'][j]
+        sentido = el['sentido'][j]
+        a_ref = el['azimute'][j]
+        # A espiral de saída é percorrida a partir do ST, em sentido inverso
+        l = np.where(entrada, ds[em_espiral], el['comprimento'][j] - ds[em_espiral])
+        xl, yl = _clotoide(l, A)
+        avanco = np.where(entrada, xl, -xl)
+        x = np.asarray(x, dtype=float).copy()
+        y = np.asarray(y, dtype=float).copy()
+        az = np.asarray(az, dtype=float).copy()
+        x[em_espiral] = el['x'][j] + avanco * np.sin(a_ref) + sentido * yl * np.cos(a_ref)
+        y[em_espiral] = el['y'][j] + avanco * np.cos(a_ref) - sentido * yl * np.sin(a_ref)
+        giro = sentido * l**2 / (2 * np.where(A > 0, A, 1.0)**2)
+        az[em_espiral] = a_ref + np.where(entrada, giro, -giro)
+    
+    x = x + afastamento * np.cos(az)
+    y = y - afastamento * np.sin(az)
+    
+    return {
+        'x': x,
+        'y': y,
+        'azimute': np.degrees(np.mod(az, 2 * np.pi)),
+        'elemento': i
+    }
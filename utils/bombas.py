@@ -0,0 +1,182 @@
+"""
+Seleção de bombas centrífugas: curva do sistema x curvas de catálogo
+"""
+
+import numpy as np
+
+from utils.calculations import (
+    calcular_fator_atrito_colebrook,
+    calcular_perda_carga_darcy_weisbach
+)
+
+def curva_sistema(vazoes, altura_estatica, comprimento, diametro, rugosidade_relativa,
+                  densidade=1000.0, viscosidade=0.001, soma_k_localizadas=0.0, g=9.81):
+    """
+    Curva do sistema H(Q) = Hg + hf(Q) + ΣK·V²/2g
+    
+    Parameters:
+    -----------
+    vazoes : array
+        Vazões em que a curva é avaliada (m³/s)
+    altura_estatica : float
+        Desnível geométrico Hg (m)
+    comprimento : float
+        Comprimento da tubulação (m)
+    diametro : float
+        Diâmetro interno (m)
+    rugosidade_relativa : float
+        ε/D
+    densidade : float
+        Densidade do fluido (kg/m³)
+    viscosidade : float
+        Viscosidade dinâmica (Pa.s)
+    soma_k_localizadas : float
+        Soma dos coeficientes de perdas localizadas
+    g : float
+        Aceleração da gravidade (m/s²)
+    
+    Returns:
+    --------
+    array : Altura manométrica exigida pelo sistema (m)
+    """
+    vazoes = np.asarray(vazoes, dtype=float)
+    velocidade = vazoes / (np.pi * diametro**2 / 4)
+    Re = densidade * velocidade * diametro / viscosidade
+    
+    # A curva tem poucas centenas de pontos; Colebrook é resolvido ponto a ponto
+    f = np.zeros_like(Re)
+    escoando = Re > 0
+    f[escoando] = [calcular_fator_atrito_colebrook(r, rugosidade_relativa) for r in Re[escoando]]
+    
+    hf = calcular_perda_carga_darcy_weisbach(f, comprimento, diametro, velocidade, g)
+    return altura_estatica + hf + soma_k_localizadas * velocidade**2 / (2 * g)
+
+def avaliar_polinomios(coeficientes, x):
+    """
+    Avalia um polinômio por linha (Horner vetorizado)
+    
+    Parameters:
+    -----------
+    coeficientes : array (n, grau + 1)
+        Coeficientes em potências crescentes: c0 + c1·x + c2·x² + ...
+    x : array (n,)
+        Abscissa de cada polinômio
+    """
+    coeficientes = np.asarray(coeficientes, dtype=float)
+    y = coeficientes[:, -1] + np.zeros(np.shape(x))
+    for k in range(coeficientes.shape[1] - 2, -1, -1):
+        y = y * x + coeficientes[:, k]
+    return y
+
+def expandir_rotores(coef_altura, coef_rendimento, vazao_max, razoes_diametro):
+    """
+    Gera curvas para diâmetros de rotor reduzidos (leis de similaridade)
+    
+    Para a razão r = D2/D1: Q2 = r·Q1 e H2 = r²·H1, de modo que o
+    coeficiente de Q^k da curva de altura é multiplicado por r^(2-k) e o
+    da curva de rendimento por r^(-k).
+    
+    Parameters:
+    -----------
+    coef_altura, coef_rendimento : array (n_modelos, grau + 1)
+        Curvas no diâmetro de referência
+    vazao_max : array (n_modelos,)
+        Limite de vazão de cada curva (m³/s)
+    razoes_diametro : array (n_rotores,)
+        Razões D2/D1 a gerar
+    
+    Returns:
+    --------
+    dict : {'coef_altura', 'coef_rendimento', 'vazao_max', 'modelo', 'razao'}
+        com n_modelos × n_rotores linhas
+    """
+    coef_altura = np.asarray(coef_altura, dtype=float)
+    coef_rendimento = np.asarray(coef_rendimento, dtype=float)
+    r = np.asarray(razoes_diametro, dtype=float)
+    n_modelos = coef_altura.shape[0]
+    
+    k_h = np.arange(coef_altura.shape[1])
+    k_e = np.arange(coef_rendimento.shape[1])
+    escala_h = r[:, None] ** (2 - k_h)[None, :]
+    escala_e = r[:, None] ** (-k_e)[None, :]
+    
+    return {
+        'coef_altura': (coef_altura[:, None, :] * escala_h[None]).reshape(-1, k_h.size),
+        'coef_rendimento': (coef_rendimento[:, None, :] * escala_e[None]).reshape(-1, k_e.size),
+        'vazao_max': (np.asarray(vazao_max, dtype=float)[:, None] * r[None, :]).ravel(),
+        'modelo': np.repeat(np.arange(n_modelos), r.size),
+        'razao': np.tile(r, n_modelos)
+    }
+
+def selecionar_bombas(coef_altura, coef_rendimento, vazao_max, vazoes_sistema, alturas_sistema,
+                      vazao_minima=0.0, densidade=1000.0, g=9.81, n_iter=60):
+    """
+    Ponto de operação de todas as bombas do catálogo de uma só vez
+    
+    A interseção H_bomba(Q) = H_sistema(Q) é resolvida por bisseção
+    vetorizada sobre todas as curvas simultaneamente; a curva do sistema é
+    interpolada linearmente entre os pontos fornecidos.
+    
+    Parameters:
+    -----------
+    coef_altura : array (n, grau + 1)
+        Curvas H(Q) das bombas (potências crescentes de Q)
+    coef_rendimento : array (n, grau + 1)
+        Curvas η(Q) das bombas (fração, 0 a 1)
+    vazao_max : array (n,)
+        Vazão máxima de cada curva (m³/s)
+    vazoes_sistema, alturas_sistema : array
+        Curva do sistema (ver curva_sistema), Q crescente
+    vazao_minima : float
+        Vazão mínima exigida no ponto de operação (m³/s)
+    densidade : float
+        Densidade do fluido (kg/m³)
+    g : float
+        Aceleração da gravidade (m/s²)
+    n_iter : int
+        Iterações da bisseção
+    
+    Returns:
+    --------
+    dict : {'vazao', 'altura', 'rendimento', 'potencia', 'valido', 'ranking'}
+        'potencia' em kW; 'ranking' são os índices das bombas válidas em
+        ordem decrescente de rendimento no ponto de operação.
+    """
+    coef_altura = np.asarray(coef_altura, dtype=float)
+    coef_rendimento = np.asarray(coef_rendimento, dtype=float)
+    vazoes_sistema = np.asarray(vazoes_sistema, dtype=float)
+    alturas_sistema = np.asarray(alturas_sistema, dtype=float)
+    
+    def residuo(Q):
+        return avaliar_polinomios(coef_altura, Q) - np.interp(Q, vazoes_sistema, alturas_sistema)
+    
+    lo = np.zeros(coef_altura.shape[0])
+    hi = np.minimum(np.asarray(vazao_max, dtype=float), vazoes_sistema[-1])
+    # Só há interseção se a bomba vence o sistema em Q = 0 e perde no limite
+    valido = (residuo(lo) > 0) & (residuo(hi) < 0)
+    
+    for _ in range(n_iter):
+        meio = 0.5 * (lo + hi)
+        positivo = residuo(meio) > 0
+        lo = np.where(positivo, meio, lo)
+        hi = np.where(positivo, hi, meio)
+    
+    vazao = 0.5 * (lo + hi)
+    altura = np.interp(vazao, vazoes_sistema, alturas_sistema)
+    rendimento = avaliar_polinomios(coef_rendimento, vazao)
+    valido &= (vazao >= vazao_minima) & (rendimento > 0)
+    
+    potencia = np.full_like(vazao, np.nan)
+    potencia[valido] = densidade * g * vazao[valido] * altura[valido] / rendimento[valido] / 1000
+    
+    candidatos = np.flatnonzero(valido)
+    ranking = candidatos[np.argsort(-rendimento[candidatos], kind='stable')]
+    
+    return {
+        'vazao': vazao,
+        'altura': altura,
+        'rendimento': rendimento,
+        'potencia': potencia,
+        'valido': valido,
+        'ranking': ranking
+    }
@@ -2,6 +2,8 @@
 Funções de cálculo compartilhadas
 """
 
+from functools import lru_cache
+
 import numpy as np
 from scipy.optimize import fsolve, brentq
 
@@ -261,6 +263,41 @@ def dimensionar_concreto_armado_simples(Mk, fck, aco_tipo='CA50', bw=0.2, d=None
         'x_d': x_d
     }
 
+# Rótulos indexados pelo código de regime retornado por calcular_reynolds_array
+REGIMES_ESCOAMENTO = np.array(["Laminar", "Transição", "Turbulento"])
+
+def calcular_reynolds_array(densidade, velocidade, diametro, viscosidade):
+    """
+    Número de Reynolds e código de regime para arrays de leituras
+    
+    Parameters:
+    -----------
+    densidade : float or array
+        Densidade do fluido (kg/m³)
+    velocidade : float or array
+        Velocidade média (m/s)
+    diametro : float or array
+        Diâmetro característico (m)
+    viscosidade : float or array
+        Viscosidade dinâmica (Pa.s)
+    
+    Returns:
+    --------
+    Re : array
+        Número de Reynolds
+    codigo : array of int8
+        0 = Laminar, 1 = Transição, 2 = Turbulento (ver REGIMES_ESCOAMENTO);
+        -1 = Inválido (Re ausente ou não finito, p. ex. leituras em branco)
+    """
+    Re = (np.asarray(densidade) * np.asarray(velocidade) * np.asarray(diametro)) / np.asarray(viscosidade)
+    codigo = np.select([~np.isfinite(Re), Re < 2300, Re < 4000], [-1, 0, 1], default=2).astype(np.int8)
+    return Re, codigo
+
+def rotulos_regime(codigo):
+    """Converte códigos de regime (int8) nos rótulos correspondentes ('Inválido' para -1)"""
+    codigo = np.asarray(codigo)
+    return np.where(codigo >= 0, REGIMES_ESCOAMENTO[np.maximum(codigo, 0)], "Inválido")
+
 def calcular_reynolds(densidade, velocidade, diametro, viscosidade):
     """
     Calcula número de Reynolds e classifica o regime
@@ -280,16 +317,9 @@ def calcular_reynolds(densidade, velocidade, diametro, viscosidade):
     --------
     dict : {'Re': float, 'regime': str}
     """
-    Re = (densidade * velocidade * diametro) / viscosidade
+    Re, codigo = calcular_reynolds_array(densidade, velocidade, diametro, viscosidade)
     
-    if Re < 2300:
-        regime = "Laminar"
-    elif Re < 4000:
-        regime = "Transição"
-    else:
-        regime = "Turbulento"
-    
-    return {'Re': Re, 'regime': regime}
+    return {'Re': float(Re), 'regime': str(rotulos_regime(codigo))}
 
 def calcular_fator_atrito_colebrook(Re, rugosidade_relativa, tol=1e-6, max_iter=100):
     """
@@ -351,6 +381,10 @@ def calcular_perda_carga_darcy_weisbach(f, comprimento, diametro, velocidade, g=
     hf = f * (comprimento / diametro) * (velocidade**2 / (2 * g))
     return hf
 
+def _velocidade_manning(raio_hidraulico, declividade, n_manning):
+    """Velocidade média pela fórmula de Manning (aceita arrays)"""
+    return (1 / n_manning) * raio_hidraulico**(2/3) * declividade**0.5
+
 def calcular_manning_canal(vazao, declividade, largura, n_manning, altura=None):
     """
     Resolve equação de Manning para canais abertos
@@ -378,7 +412,7 @@ def calcular_manning_canal(vazao, declividade, largura, n_manning, altura=None):
             area = largura * y
             perimetro = largura + 2 * y
             raio_hidraulico = area / perimetro
-            vazao_calc = (1 / n_manning) * area * raio_hidraulico**(2/3) * declividade**0.5
+            vazao_calc = area * _velocidade_manning(raio_hidraulico, declividade, n_manning)
             return vazao_calc - vazao
         
         # Método de bisseção
@@ -391,7 +425,7 @@ def calcular_manning_canal(vazao, declividade, largura, n_manning, altura=None):
     area = largura * altura
     perimetro = largura + 2 * altura
     raio_hidraulico = area / perimetro
-    velocidade = (1 / n_manning) * raio_hidraulico**(2/3) * declividade**0.5
+    velocidade = _velocidade_manning(raio_hidraulico, declividade, n_manning)
     
     return {
         'altura': altura,
@@ -401,3 +435,148 @@ def calcular_manning_canal(vazao, declividade, largura, n_manning, altura=None):
         'raio_hidraulico': raio_hidraulico
     }
 
+@lru_cache(maxsize=1)
+def _tabela_manning_circular(n_pontos=4001):
+    """
+    Tabela Q/Q_plena x y/D para seção circular parcialmente cheia
+    
+    Construída uma única vez por processo. Cobre apenas o ramo crescente da
+    curva (até o máximo de vazão, y/D ≈ 0.938), onde a relação é inversível.
+    """
+    theta = np.linspace(1e-4, 2 * np.pi, n_pontos)
+    razao_area = (theta - np.sin(theta)) / (2 * np.pi)
+    razao_raio = 1 - np.sin(theta) / theta
+    razao_vazao = razao_area * razao_raio**(2/3)
+    
+    i_max = np.argmax(razao_vazao)
+    theta = theta[:i_max + 1]
+    razao_vazao = razao_vazao[:i_max + 1]
+    razao_vazao[0] = 0.0
+    return theta, razao_vazao
+
+def calcular_manning_circular(vazao, declividade, diametro, n_manning):
+    """
+    Resolve Manning para condutos circulares parcialmente cheios
+    
+    Versão vetorizada: todos os argumentos aceitam arrays (com broadcast).
+    A lâmina é obtida por interpolação inversa da curva Q/Q_plena x θ.
+    
+    Parameters:
+    -----------
+    vazao : float or array
+        Vazão (m³/s)
+    declividade : float or array
+        Declividade do conduto (m/m)
+    diametro : float or array
+        Diâmetro interno (m)
+    n_manning : float or array
+        Coeficiente de Manning
+    
+    Returns:
+    --------
+    dict : {'altura', 'lamina', 'velocidade', 'area', 'perimetro',
+            'raio_hidraulico', 'vazao_plena', 'sobrecarga'}
+        'lamina' é y/D; 'sobrecarga' indica vazão acima da capacidade
+        máxima em superfície livre (conduto trabalhando sob pressão).
+    """
+    vazao, declividade, diametro, n_manning = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (vazao, declividade, diametro, n_manning))
+    )
+    
+    area_plena = np.pi * diametro**2 / 4
+    vazao_plena = area_plena * _velocidade_manning(diametro / 4, declividade, n_manning)
+    
+    theta_tab, razao_tab = _tabela_manning_circular()
+    razao = vazao / vazao_plena
+    sobrecarga = razao > razao_tab[-1]
+    theta = np.interp(razao, razao_tab, theta_tab)
+    # Acima do máximo em superfície livre o conduto é considerado cheio
+    theta = np.where(sobrecarga, 2 * np.pi, theta)
+    
+    area = diametro**2 / 8 * (theta - np.sin(theta))
+    perimetro = diametro * theta / 2
+    raio_hidraulico = np.divide(area, perimetro, out=np.zeros_like(area), where=perimetro > 0)
+    velocidade = np.divide(vazao, area, out=np.zeros_like(area), where=area > 0)
+    lamina = (1 - np.cos(theta / 2)) / 2
+    
+    return {
+        'altura': lamina * diametro,
+        'lamina': lamina,
+        'velocidade': velocidade,
+        'area': area,
+        'perimetro': perimetro,
+        'raio_hidraulico': raio_hidraulico,
+        'vazao_plena': vazao_plena,
+        'sobrecarga': sobrecarga
+    }
+
+# Coeficientes de forma de Terzaghi: (multiplicador de c·Nc, multiplicador de γ·B·Nγ)
+FATORES_FORMA_TERZAGHI = {
+    'corrida': (1.0, 0.5),
+    'quadrada': (1.3, 0.4),
+    'circular': (1.3, 0.3)
+}
+
+def calcular_capacidade_carga_terzaghi(c, phi, gamma, B, D, tipo='corrida', FS=3.0):
+    """
+    Capacidade de carga de fundações superficiais (Terzaghi)
+    
+    Todos os argumentos aceitam arrays e são combinados por broadcast,
+    permitindo varrer grades φ × B × D inteiras em uma chamada.
+    
+    Parameters:
+    -----------
+    c : float or array
+        Coesão (kPa)
+    phi : float or array
+        Ângulo de atrito (graus)
+    gamma : float or array
+        Peso específico (kN/m³)
+    B : float or array
+        Largura ou diâmetro da fundação (m)
+    D : float or array
+        Profundidade de assentamento (m)
+    tipo : str or array of str
+        'corrida', 'quadrada' ou 'circular'
+    FS : float or array
+        Fator de segurança
+    
+    Returns:
+    --------
+    dict : {'Nc', 'Nq', 'Ngamma', 'parcela_coesao', 'parcela_sobrecarga',
+            'parcela_peso', 'q_ult', 'q_adm'} (tensões em kPa)
+    """
+    phi = np.asarray(phi, dtype=float)
+    tipo = np.asarray(tipo)
+    
+    tipos, inverso = np.unique(tipo, return_inverse=True)
+    desconhecidos = set(tipos.tolist()) - set(FATORES_FORMA_TERZAGHI)
+    if desconhecidos:
+        raise ValueError(f"Tipo de fundação '{desconhecidos.pop()}' não suportado")
+    fatores = np.array([FATORES_FORMA_TERZAGHI[t] for t in tipos.tolist()])
+    sc = fatores[:, 0][inverso].reshape(tipo.shape)
+    sg = fatores[:, 1][inverso].reshape(tipo.shape)
+    
+    # Fatores de capacidade; φ = 0 tratado por máscara (Nc = 5.7, Nγ = 0)
+    phi_rad = np.radians(phi)
+    tan_phi = np.tan(phi_rad)
+    com_atrito = phi > 0
+    Nq = np.exp(np.pi * tan_phi) * np.tan(np.radians(45 + phi / 2))**2
+    Nc = np.where(com_atrito, (Nq - 1) / np.where(com_atrito, tan_phi, 1.0), 5.7)
+    Ngamma = np.where(com_atrito, 0.5 * (Nq - 1) * np.tan(np.radians(1.4 * phi)), 0.0)
+    
+    parcela_coesao = sc * c * Nc
+    parcela_sobrecarga = np.asarray(gamma) * D * Nq
+    parcela_peso = sg * np.asarray(gamma) * B * Ngamma
+    q_ult = parcela_coesao + parcela_sobrecarga + parcela_peso
+    
+    return {
+        'Nc': Nc,
+        'Nq': Nq,
+        'Ngamma': Ngamma,
+        'parcela_coesao': parcela_coesao,
+        'parcela_sobrecarga': parcela_sobrecarga,
+        'parcela_peso': parcela_peso,
+        'q_ult': q_ult,
+        'q_adm': q_ult / FS
+    }
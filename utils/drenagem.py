@@ -0,0 +1,204 @@
+"""
+Dimensionamento de redes de drenagem pluvial (Método Racional)
+"""
+
+import numpy as np
+
+from utils.calculations import calcular_manning_circular
+
+# Diâmetros comerciais de tubos de concreto (m), em ordem crescente
+DIAMETROS_COMERCIAIS = np.array([0.30, 0.40, 0.50, 0.60, 0.70, 0.80, 0.90, 1.00,
+                                 1.20, 1.50, 1.75, 2.00])
+
+# Equação IDF na forma i = K·T^a / (t + b)^c  (i em mm/h, t em min, T em anos)
+IDF_PADRAO = {'K': 1747.9, 'a': 0.181, 'b': 15.0, 'c': 0.89}
+
+def ordenar_rede(pai):
+    """
+    Ordena topologicamente uma rede em árvore (montante → jusante)
+    
+    Parameters:
+    -----------
+    pai : array of int
+        Índice do trecho imediatamente a jusante de cada trecho
+        (-1 para trechos que descarregam no exutório)
+    
+    Returns:
+    --------
+    list of array : Níveis da rede. Todos os trechos de montante de um
+        trecho aparecem em níveis anteriores ao dele.
+    """
+    pai = np.asarray(pai, dtype=np.int64)
+    n = pai.size
+    
+    if np.any((pai < -1) | (pai >= n)):
+        raise ValueError("Índices de jusante fora do intervalo da rede")
+    if np.any(pai == np.arange(n)):
+        raise ValueError("Trecho não pode descarregar em si mesmo")
+    
+    # Algoritmo de Kahn processando uma frente inteira por vez
+    grau_entrada = np.bincount(pai[pai >= 0], minlength=n)
+    frente = np.flatnonzero(grau_entrada == 0)
+    niveis = []
+    processados = 0
+    
+    while frente.size:
+        niveis.append(frente)
+        processados += frente.size
+        
+        jusante = pai[frente]
+        jusante = jusante[jusante >= 0]
+        np.subtract.at(grau_entrada, jusante, 1)
+        candidatos = np.unique(jusante)
+        frente = candidatos[grau_entrada[candidatos] == 0]
+    
+    if processados < n:
+        raise ValueError("A rede contém ciclos - esperado formato em árvore")
+    
+    return niveis
+
+def intensidade_chuva(tempo_concentracao, periodo_retorno, idf=None):
+    """
+    Intensidade de chuva pela equação IDF (mm/h)
+    
+    Parameters:
+    -----------
+    tempo_concentracao : float or array
+        Duração da chuva = tempo de concentração (min)
+    periodo_retorno : float
+        Período de retorno (anos)
+    idf : dict, optional
+        Parâmetros {'K', 'a', 'b', 'c'}. Padrão: IDF_PADRAO
+    """
+    p = IDF_PADRAO if idf is None else idf
+    return p['K'] * periodo_retorno**p['a'] / (np.asarray(tempo_concentracao) + p['b'])**p['c']
+
+def _fator_capacidade_circular(lamina):
+    """Razão Q(y/D)/Q_plena para a lâmina relativa informada"""
+    theta = 2 * np.arccos(1 - 2 * lamina)
+    razao_area = (theta - np.sin(theta)) / (2 * np.pi)
+    razao_raio = 1 - np.sin(theta) / theta
+    return razao_area * razao_raio**(2/3)
+
+def dimensionar_rede_pluvial(pai, area, coef_escoamento, comprimento, declividade,
+                             n_manning=0.013, tempo_entrada=10.0, periodo_retorno=10.0,
+                             idf=None, diametros=None, lamina_max=0.85):
+    """
+    Dimensiona uma rede pluvial em árvore pelo Método Racional
+    
+    Percorre a rede uma única vez em ordem topológica, processando cada nível
+    de forma vetorizada: acumula áreas e tempos de concentração, calcula a
+    vazão de projeto e escolhe o menor diâmetro comercial que atende a
+    lâmina máxima (busca binária no catálogo).
+    
+    Parameters:
+    -----------
+    pai : array of int
+        Trecho de jusante de cada trecho (-1 = exutório)
+    area : array
+        Área de contribuição direta de cada trecho (ha)
+    coef_escoamento : float or array
+        Coeficiente de escoamento superficial C
+    comprimento : array
+        Comprimento de cada trecho (m)
+    declividade : array
+        Declividade de cada trecho (m/m)
+    n_manning : float or array
+        Coeficiente de Manning dos tubos
+    tempo_entrada : float or array
+        Tempo de entrada nas bocas de lobo (min)
+    periodo_retorno : float
+        Período de retorno (anos)
+    idf : dict, optional
+        Parâmetros da equação IDF
+    diametros : array, optional
+        Catálogo de diâmetros em ordem crescente (m)
+    lamina_max : float
+        Lâmina relativa máxima admitida y/D
+    
+    Returns:
+    --------
+    dict : arrays por trecho com 'area_acumulada', 'tempo_concentracao',
+        'intensidade', 'vazao', 'diametro', 'lamina', 'velocidade',
+        'tempo_percurso', 'capacidade_insuficiente' e 'nivel'
+    """
+    niveis = ordenar_rede(pai)
+    pai = np.asarray(pai, dtype=np.int64)
+    n = pai.size
+    
+    def por_trecho(valor):
+        return np.broadcast_to(np.asarray(valor, dtype=float), (n,))
+    
+    area = por_trecho(area)
+    coef_escoamento = por_trecho(coef_escoamento)
+    comprimento = por_trecho(comprimento)
+    declividade = por_trecho(declividade)
+    n_manning = por_trecho(n_manning)
+    
+    diametros = DIAMETROS_COMERCIAIS if diametros is None else np.sort(np.asarray(diametros, dtype=float))
+    
+    # Grandezas acumuladas de montante (recebem a contribuição dos afluentes)
+    area_acumulada = area.copy()
+    ca_acumulado = coef_escoamento * area
+    tempo_concentracao = por_trecho(tempo_entrada).copy()
+    diametro_montante = np.zeros(n)
+    
+    intensidade = np.empty(n)
+    vazao = np.empty(n)
+    diametro = np.empty(n)
+    lamina = np.empty(n)
+    velocidade = np.empty(n)
+    tempo_percurso = np.empty(n)
+    insuficiente = np.zeros(n, dtype=bool)
+    nivel = np.empty(n, dtype=np.int64)
+    
+    # Q = K_cap · D^(8/3) · S^½ / n  →  D necessário em forma fechada
+    k_cap = _fator_capacidade_circular(lamina_max) * (np.pi / 4) * 4**(-2/3)
+    
+    for k, idx in enumerate(niveis):
+        nivel[idx] = k
+        S = declividade[idx]
+        
+        i = intensidade_chuva(tempo_concentracao[idx], periodo_retorno, idf)
+        Q = ca_acumulado[idx] * i / 360  # m³/s (área em ha, i em mm/h)
+        
+        D_req = (Q * n_manning[idx] / (k_cap * np.sqrt(S)))**(3/8)
+        pos = np.searchsorted(diametros, D_req)
+        insuficiente[idx] = pos >= diametros.size
+        D = diametros[np.minimum(pos, diametros.size - 1)]
+        # Diâmetro nunca diminui para jusante
+        D = np.maximum(D, diametro_montante[idx])
+        
+        hidr = calcular_manning_circular(Q, S, D, n_manning[idx])
+        V = hidr['velocidade']
+        tp = np.divide(comprimento[idx], V, out=np.zeros_like(V), where=V > 0) / 60
+        
+        intensidade[idx] = i
+        vazao[idx] = Q
+        diametro[idx] = D
+        lamina[idx] = hidr['lamina']
+        velocidade[idx] = V
+        tempo_percurso[idx] = tp
+        insuficiente[idx] |= hidr['sobrecarga']
+        
+        # Propagar para o trecho de jusante
+        jus = pai[idx]
+        m = jus >= 0
+        jus = jus[m]
+        np.add.at(area_acumulada, jus, area_acumulada[idx][m])
+        np.add.at(ca_acumulado, jus, ca_acumulado[idx][m])
+        np.maximum.at(tempo_concentracao, jus, (tempo_concentracao[idx] + tp)[m])
+        np.maximum.at(diametro_montante, jus, D[m])
+    
+    return {
+        'area_acumulada': area_acumulada,
+        'tempo_concentracao': tempo_concentracao,
+        'intensidade': intensidade,
+        'vazao': vazao,
+        'diametro': diametro,
+        'lamina': lamina,
+        'velocidade': velocidade,
+        'tempo_percurso': tempo_percurso,
+        'capacidade_insuficiente': insuficiente,
+        'nivel': nivel
+    }
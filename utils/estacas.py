@@ -0,0 +1,192 @@
+"""
+Capacidade de carga axial de estacas a partir de sondagens SPT
+Métodos de Aoki-Velloso e Décourt-Quaresma, avaliados em lote
+(furos × tipos de estaca × diâmetros × profundidades)
+"""
+
+import numpy as np
+
+# Aoki-Velloso: K (kPa) e α (%); Décourt-Quaresma: grupo (0 argila, 1 silte, 2 areia) e C (kPa)
+SOLOS_SPT = {
+    'areia': {'nome': 'Areia', 'K': 1000, 'alfa': 1.4, 'grupo': 2, 'C': 400},
+    'areia_siltosa': {'nome': 'Areia siltosa', 'K': 800, 'alfa': 2.0, 'grupo': 2, 'C': 400},
+    'areia_silto_argilosa': {'nome': 'Areia silto-argilosa', 'K': 700, 'alfa': 2.4, 'grupo': 2, 'C': 400},
+    'areia_argilosa': {'nome': 'Areia argilosa', 'K': 600, 'alfa': 3.0, 'grupo': 2, 'C': 400},
+    'areia_argilo_siltosa': {'nome': 'Areia argilo-siltosa', 'K': 500, 'alfa': 2.8, 'grupo': 2, 'C': 400},
+    'silte': {'nome': 'Silte', 'K': 400, 'alfa': 3.0, 'grupo': 1, 'C': 200},
+    'silte_arenoso': {'nome': 'Silte arenoso', 'K': 550, 'alfa': 2.2, 'grupo': 1, 'C': 250},
+    'silte_areno_argiloso': {'nome': 'Silte areno-argiloso', 'K': 450, 'alfa': 2.8, 'grupo': 1, 'C': 250},
+    'silte_argiloso': {'nome': 'Silte argiloso', 'K': 230, 'alfa': 3.4, 'grupo': 1, 'C': 200},
+    'silte_argilo_arenoso': {'nome': 'Silte argilo-arenoso', 'K': 250, 'alfa': 3.0, 'grupo': 1, 'C': 200},
+    'argila': {'nome': 'Argila', 'K': 200, 'alfa': 6.0, 'grupo': 0, 'C': 120},
+    'argila_arenosa': {'nome': 'Argila arenosa', 'K': 350, 'alfa': 2.4, 'grupo': 0, 'C': 120},
+    'argila_areno_siltosa': {'nome': 'Argila areno-siltosa', 'K': 300, 'alfa': 2.8, 'grupo': 0, 'C': 120},
+    'argila_siltosa': {'nome': 'Argila siltosa', 'K': 220, 'alfa': 4.0, 'grupo': 0, 'C': 120},
+    'argila_silto_arenosa': {'nome': 'Argila silto-arenosa', 'K': 330, 'alfa': 3.0, 'grupo': 0, 'C': 120}
+}
+
+# F1 e F2 (Aoki-Velloso); α e β de Décourt-Quaresma por grupo (argila, silte, areia).
+# F1/F2 = None indica a pré-moldada, para a qual F1 = 1 + D/0,80 e F2 = 2·F1
+TIPOS_ESTACA = {
+    'franki': {'nome': 'Franki', 'F1': 2.50, 'F2': 5.0,
+               'alfa_dq': (1.0, 1.0, 1.0), 'beta_dq': (1.0, 1.0, 1.0)},
+    'metalica': {'nome': 'Metálica', 'F1': 1.75, 'F2': 3.5,
+                 'alfa_dq': (1.0, 1.0, 1.0), 'beta_dq': (1.0, 1.0, 1.0)},
+    'pre_moldada': {'nome': 'Pré-moldada', 'F1': None, 'F2': None,
+                    'alfa_dq': (1.0, 1.0, 1.0), 'beta_dq': (1.0, 1.0, 1.0)},
+    'escavada': {'nome': 'Escavada', 'F1': 3.0, 'F2': 6.0,
+                 'alfa_dq': (0.85, 0.60, 0.50), 'beta_dq': (0.80, 0.65, 0.50)},
+    'escavada_bentonita': {'nome': 'Escavada com bentonita', 'F1': 3.0, 'F2': 6.0,
+                           'alfa_dq': (0.85, 0.60, 0.50), 'beta_dq': (0.90, 0.75, 0.60)},
+    'helice_continua': {'nome': 'Hélice contínua', 'F1': 2.0, 'F2': 4.0,
+                        'alfa_dq': (0.30, 0.30, 0.30), 'beta_dq': (1.0, 1.0, 1.0)},
+    'raiz': {'nome': 'Raiz', 'F1': 2.0, 'F2': 4.0,
+             'alfa_dq': (0.85, 0.60, 0.50), 'beta_dq': (1.5, 1.5, 1.5)},
+    'injetada': {'nome': 'Injetada sob alta pressão', 'F1': 2.0, 'F2': 4.0,
+                 'alfa_dq': (1.0, 1.0, 1.0), 'beta_dq': (3.0, 3.0, 3.0)}
+}
+
+def sondagens_para_arrays(furo, profundidade, N, solo):
+    """
+    Converte registros de sondagem (um por metro) em arrays furos × profundidades
+    
+    Parameters:
+    -----------
+    furo : array
+        Identificação do furo de cada registro
+    profundidade : array
+        Profundidade do registro (m, inteira, a partir de 1)
+    N : array
+        Índice de resistência à penetração N_SPT
+    solo : array of str
+        Chave do solo em SOLOS_SPT
+    
+    Returns:
+    --------
+    dict : {'furos', 'N': (n_furos, n_prof) com NaN abaixo do fim do furo,
+            'solo': índices em SOLOS_SPT (-1 sem dado)}
+    """
+    furo = np.asarray(furo)
+    profundidade = np.rint(np.asarray(profundidade, dtype=float)).astype(int)
+    solo = np.asarray(solo, dtype=str)
+    
+    chaves = np.array(list(SOLOS_SPT))
+    ordem = np.argsort(chaves)
+    pos = np.searchsorted(chaves[ordem], solo)
+    pos = np.clip(pos, 0, chaves.size - 1)
+    desconhecido = chaves[ordem][pos] != solo
+    if np.any(desconhecido):
+        raise ValueError(f"Solo não cadastrado: {solo[desconhecido][0]}")
+    if np.any(profundidade < 1):
+        raise ValueError("As profundidades devem começar em 1 m")
+    
+    furos, i_furo = np.unique(furo, return_inverse=True)
+    n_prof = profundidade.max()
+    N_arr = np.full((furos.size, n_prof), np.nan)
+    solo_arr = np.full((furos.size, n_prof), -1, dtype=int)
+    N_arr[i_furo, profundidade - 1] = np.asarray(N, dtype=float)
+    solo_arr[i_furo, profundidade - 1] = ordem[pos]
+    
+    return {'furos': furos, 'N': N_arr, 'solo': solo_arr}
+
+def _parametros_solo(solo, campo):
+    """Propriedade de SOLOS_SPT para cada posição de um array de índices (NaN se -1)"""
+    tabela = np.array([propriedades[campo] for propriedades in SOLOS_SPT.values()] + [np.nan], dtype=float)
+    return tabela[np.where(solo >= 0, solo, -1)]
+
+def capacidade_estacas_spt(N, solo, tipos, diametros, FS_aoki=2.0, FS_lateral_dq=1.3, FS_ponta_dq=4.0):
+    """
+    Capacidade de carga de estacas por Aoki-Velloso e Décourt-Quaresma
+    
+    O SPT é dado por metro: a coluna j corresponde à profundidade j + 1 m e
+    representa o metro acima dela. Uma estaca de comprimento L tem a ponta
+    na coluna L - 1 e o fuste nas colunas 0 a L - 1. A resistência lateral
+    é acumulada por soma cumulativa ao longo da profundidade, de modo que
+    todos os comprimentos são avaliados de uma vez. N é limitado a 50 (e a
+    no mínimo 3 no fuste de Décourt-Quaresma).
+    
+    Aoki-Velloso: rp = K·Np/F1, rl = α·K·Nl/F2
+    Décourt-Quaresma: rp = α·C·Np (Np = média de 3 valores em torno da
+    ponta), rl = β·10·(Nl/3 + 1) kPa, aplicados camada a camada
+    
+    Parameters:
+    -----------
+    N : array (n_furos, n_prof)
+        N_SPT por metro (NaN abaixo do fim do furo)
+    solo : array of int (n_furos, n_prof)
+        Índices em SOLOS_SPT (ver sondagens_para_arrays)
+    tipos : list of str
+        Chaves em TIPOS_ESTACA
+    diametros : array
+        Diâmetros das estacas (m)
+    FS_aoki : float
+        Fator de segurança global de Aoki-Velloso
+    FS_lateral_dq, FS_ponta_dq : float
+        Fatores de segurança parciais de Décourt-Quaresma
+    
+    Returns:
+    --------
+    dict : {'comprimento': m, 'aoki_velloso', 'decourt_quaresma'}
+        Cada método contém 'Rl', 'Rp', 'R' e 'P_adm' (kN) com forma
+        (n_furos, n_tipos, n_diametros, n_prof)
+    """
+    N = np.atleast_2d(np.asarray(N, dtype=float))
+    solo = np.atleast_2d(np.asarray(solo, dtype=int))
+    diametros = np.atleast_1d(np.asarray(diametros, dtype=float))
+    tipos = list(tipos)
+    for tipo in tipos:
+        if tipo not in TIPOS_ESTACA:
+            raise ValueError(f"Tipo de estaca '{tipo}' não suportado")
+    
+    N = np.minimum(N, 50.0)
+    K = _parametros_solo(solo, 'K')
+    alfa = _parametros_solo(solo, 'alfa') / 100
+    grupo = np.where(solo >= 0, _parametros_solo(solo, 'grupo'), 0).astype(int)
+    C = _parametros_solo(solo, 'C')
+    
+    # Eixos: furo, tipo, diâmetro, profundidade
+    D = diametros[None, None, :, None]
+    perimetro = np.pi * D
+    area_ponta = np.pi * D**2 / 4
+    
+    F2_pm = 2 * (1 + diametros / 0.80)
+    F1 = np.array([[1 + d / 0.80 if TIPOS_ESTACA[t]['F1'] is None else TIPOS_ESTACA[t]['F1'] for d in diametros]
+                   for t in tipos])
+    F2 = np.array([[f2 if TIPOS_ESTACA[t]['F2'] is None else TIPOS_ESTACA[t]['F2'] for f2 in F2_pm]
+                   for t in tipos])
+    F1 = F1[None, :, :, None]
+    F2 = F2[None, :, :, None]
+    
+    # Aoki-Velloso
+    rl_av = (alfa * K * N)[:, None, None, :] / F2
+    Rl_av = perimetro * np.cumsum(rl_av, axis=-1)
+    Rp_av = area_ponta * (K * N)[:, None, None, :] / F1
+    
+    # Décourt-Quaresma
+    alfa_dq = np.array([TIPOS_ESTACA[t]['alfa_dq'] for t in tipos])
+    beta_dq = np.array([TIPOS_ESTACA[t]['beta_dq'] for t in tipos])
+    rl_dq = beta_dq[:, grupo].transpose(1, 0, 2) * 10 * (np.clip(N, 3, 50) / 3 + 1)[:, None, :]
+    Rl_dq = perimetro * np.cumsum(rl_dq, axis=-1)[:, :, None, :]
+    
+    N_pad = np.pad(N, ((0, 0), (1, 1)), constant_values=np.nan)
+    janela = np.stack([N_pad[:, :-2], N_pad[:, 1:-1], N_pad[:, 2:]])
+    validos = np.isfinite(janela)
+    Np = np.where(np.isfinite(N), np.where(validos, janela, 0).sum(axis=0) / np.maximum(validos.sum(axis=0), 1), np.nan)
+    rp_dq = alfa_dq[:, grupo].transpose(1, 0, 2) * (C * Np)[:, None, :]
+    Rp_dq = area_ponta * rp_dq[:, :, None, :]
+    
+    return {
+        'comprimento': np.arange(1, N.shape[1] + 1, dtype=float),
+        'aoki_velloso': {
+            'Rl': Rl_av,
+            'Rp': Rp_av,
+            'R': Rl_av + Rp_av,
+            'P_adm': (Rl_av + Rp_av) / FS_aoki
+        },
+        'decourt_quaresma': {
+            'Rl': Rl_dq,
+            'Rp': Rp_dq,
+            'R': Rl_dq + Rp_dq,
+            'P_adm': Rl_dq / FS_lateral_dq + Rp_dq / FS_ponta_dq
+        }
+    }
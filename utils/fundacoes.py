@@ -0,0 +1,235 @@
+"""
+Capacidade de carga de fundações superficiais - formulação geral
+Métodos de Meyerhof, Vesic e Hansen com fatores de forma, profundidade,
+inclinação da carga, inclinação da base e do terreno
+"""
+
+import numpy as np
+
+METODOS_CAPACIDADE = ('meyerhof', 'vesic', 'hansen')
+
+def fatores_capacidade(phi, metodo='vesic'):
+    """
+    Fatores de capacidade de carga Nc, Nq e Nγ
+    
+    Parameters:
+    -----------
+    phi : float or array
+        Ângulo de atrito (graus)
+    metodo : str
+        'meyerhof', 'vesic' ou 'hansen'
+    
+    Returns:
+    --------
+    tuple : (Nc, Nq, Ngamma) como arrays
+    """
+    if metodo not in METODOS_CAPACIDADE:
+        raise ValueError(f"Método '{metodo}' não suportado")
+    
+    phi = np.asarray(phi, dtype=float)
+    tan_phi = np.tan(np.radians(phi))
+    com_atrito = phi > 0
+    
+    Nq = np.exp(np.pi * tan_phi) * np.tan(np.radians(45 + phi / 2))**2
+    Nc = np.where(com_atrito, (Nq - 1) / np.where(com_atrito, tan_phi, 1.0), np.pi + 2)
+    
+    if metodo == 'meyerhof':
+        Ngamma = (Nq - 1) * np.tan(np.radians(1.4 * phi))
+    elif metodo == 'vesic':
+        Ngamma = 2 * (Nq + 1) * tan_phi
+    else:
+        Ngamma = 1.5 * (Nq - 1) * tan_phi
+    
+    return Nc, Nq, Ngamma
+
+def _correcao_nivel_agua(gamma, gamma_sat, B, D, nivel_agua, gamma_w):
+    """
+    Sobrecarga efetiva q e peso específico efetivo para o termo de Nγ
+    
+    nivel_agua é a profundidade do N.A. medida a partir da superfície
+    (np.inf quando ausente).
+    """
+    gamma_sub = gamma_sat - gamma_w
+    
+    # Caso 1: N.A. acima da base da fundação
+    acima = nivel_agua <= D
+    z = np.minimum(nivel_agua, D)
+    q = np.where(acima, gamma * z + gamma_sub * (D - z), gamma * D)
+    
+    # Caso 2: N.A. entre a base e a profundidade B abaixo dela
+    fracao = np.clip((nivel_agua - D) / B, 0.0, 1.0)
+    gamma_efetivo = np.where(acima, gamma_sub, gamma_sub + fracao * (gamma - gamma_sub))
+    
+    return q, gamma_efetivo
+
+def calcular_capacidade_carga_geral(c, phi, gamma, B, D, L=None, metodo='vesic',
+                                    V=None, H=0.0, inclinacao_base=0.0, inclinacao_terreno=0.0,
+                                    nivel_agua=None, gamma_sat=None, FS=3.0, gamma_w=9.81):
+    """
+    Capacidade de carga pela equação geral (Meyerhof, Vesic ou Hansen)
+    
+    q_ult = c·Nc·sc·dc·ic·bc·gc + q·Nq·sq·dq·iq·bq·gq + ½·γ·B·Nγ·sγ·dγ·iγ·bγ·gγ
+    
+    Todos os argumentos numéricos aceitam arrays (uma posição por sapata,
+    ou grades com broadcast). Meyerhof não define fatores de inclinação da
+    base e do terreno; para esse método eles valem 1.
+    
+    Parameters:
+    -----------
+    c : float or array
+        Coesão (kPa)
+    phi : float or array
+        Ângulo de atrito (graus)
+    gamma : float or array
+        Peso específico natural (kN/m³)
+    B : float or array
+        Largura da fundação (m)
+    D : float or array
+        Profundidade de assentamento (m)
+    L : float or array, optional
+        Comprimento da fundação (m). None para sapata corrida
+    metodo : str
+        'meyerhof', 'vesic' ou 'hansen'
+    V : float or array, optional
+        Carga vertical (kN, ou kN/m para sapata corrida). Necessária se H > 0
+    H : float or array
+        Carga horizontal na direção de B (mesma unidade de V)
+    inclinacao_base : float or array
+        Inclinação da base da fundação η (graus)
+    inclinacao_terreno : float or array
+        Inclinação do terreno β (graus)
+    nivel_agua : float or array, optional
+        Profundidade do nível d'água a partir da superfície (m)
+    gamma_sat : float or array, optional
+        Peso específico saturado (kN/m³). Padrão: gamma
+    FS : float or array
+        Fator de segurança
+    gamma_w : float
+        Peso específico da água (kN/m³)
+    
+    Returns:
+    --------
+    dict : {'Nc', 'Nq', 'Ngamma', 'fatores', 'q', 'q_ult', 'q_adm'}
+        'fatores' contém os arrays sc, sq, sg, dc, dq, dg, ic, iq, ig,
+        bc, bq, bg, gc, gq, gg (índice g = γ).
+    """
+    Nc, Nq, Ngamma = fatores_capacidade(phi, metodo)
+    
+    phi = np.asarray(phi, dtype=float)
+    c = np.asarray(c, dtype=float)
+    gamma = np.asarray(gamma, dtype=float)
+    B = np.asarray(B, dtype=float)
+    D = np.asarray(D, dtype=float)
+    H = np.asarray(H, dtype=float)
+    
+    phi_rad = np.radians(phi)
+    tan_phi = np.tan(phi_rad)
+    com_atrito = phi > 0
+    tan_seguro = np.where(com_atrito, tan_phi, 1.0)
+    
+    if L is None:
+        B_L = np.zeros_like(B)
+        area = B
+    else:
+        L = np.asarray(L, dtype=float)
+        B_L = B / L
+        area = B * L
+    
+    # Forma
+    if metodo == 'meyerhof':
+        Kp = np.tan(np.radians(45 + phi / 2))**2
+        sc = 1 + 0.2 * Kp * B_L
+        sq = np.where(phi >= 10, 1 + 0.1 * Kp * B_L, 1.0)
+        sg = sq
+    else:
+        sc = 1 + (Nq / Nc) * B_L
+        sq = 1 + B_L * (tan_phi if metodo == 'vesic' else np.sin(phi_rad))
+        sg = np.maximum(1 - 0.4 * B_L, 0.6)
+    
+    # Profundidade
+    D_B = D / B
+    if metodo == 'meyerhof':
+        raiz_Kp = np.tan(np.radians(45 + phi / 2))
+        dc = 1 + 0.2 * raiz_Kp * D_B
+        dq = np.where(phi >= 10, 1 + 0.1 * raiz_Kp * D_B, 1.0)
+        dg = dq
+    else:
+        k = np.where(D_B <= 1, D_B, np.arctan(D_B))
+        dc = 1 + 0.4 * k
+        dq = 1 + 2 * tan_phi * (1 - np.sin(phi_rad))**2 * k
+        dg = np.ones_like(dq)
+    
+    # Inclinação da carga
+    if np.any(H > 0):
+        if V is None:
+            raise ValueError("Carga vertical V é necessária quando H > 0")
+        V = np.asarray(V, dtype=float)
+        ca_cot = area * c / tan_seguro
+        
+        if metodo == 'meyerhof':
+            alpha = np.degrees(np.arctan2(H, V))
+            ic = (1 - alpha / 90)**2
+            iq = ic
+            ig = np.where(com_atrito, np.clip(1 - alpha / np.where(com_atrito, phi, 1.0), 0, 1)**2, 1.0)
+        elif metodo == 'vesic':
+            m = (2 + B_L) / (1 + B_L)
+            base = np.clip(1 - H / np.where(com_atrito, V + ca_cot, 1.0), 0, 1)
+            iq = np.where(com_atrito, base**m, 1.0)
+            ig = np.where(com_atrito, base**(m + 1), 1.0)
+            ic = np.where(com_atrito,
+                          iq - (1 - iq) / (Nc * tan_seguro),
+                          1 - m * H / np.maximum(area * c * Nc, 1e-12))
+        else:
+            iq = np.where(com_atrito, np.clip(1 - 0.5 * H / np.where(com_atrito, V + ca_cot, 1.0), 0, 1)**5, 1.0)
+            ig = np.where(com_atrito, np.clip(1 - 0.7 * H / np.where(com_atrito, V + ca_cot, 1.0), 0, 1)**5, 1.0)
+            # Para φ = 0 usa-se 1 - i'c, com i'c = 0.5 - 0.5·√(1 - H/(A·c))
+            ic_argila = 0.5 + 0.5 * np.sqrt(np.clip(1 - H / np.maximum(area * c, 1e-12), 0, 1))
+            ic = np.where(com_atrito, iq - (1 - iq) / np.maximum(Nq - 1, 1e-12), ic_argila)
+        ic = np.clip(ic, 0, 1)
+    else:
+        ic = iq = ig = np.ones_like(Nq)
+    
+    # Inclinação da base (η) e do terreno (β)
+    eta = np.radians(np.asarray(inclinacao_base, dtype=float))
+    beta = np.radians(np.asarray(inclinacao_terreno, dtype=float))
+    if metodo == 'meyerhof':
+        bc = bq = bg = gc = gq = gg = np.ones_like(Nq)
+    elif metodo == 'vesic':
+        bq = (1 - eta * tan_phi)**2
+        bg = bq
+        bc = np.where(com_atrito, bq - (1 - bq) / (Nc * tan_seguro), 1 - 2 * eta / (np.pi + 2))
+        gq = (1 - np.tan(beta))**2
+        gg = gq
+        gc = np.where(com_atrito, gq - (1 - gq) / ((np.pi + 2) * tan_seguro), 1 - 2 * beta / (np.pi + 2))
+    else:
+        bc = 1 - np.degrees(eta) / 147
+        bq = np.exp(-2 * eta * tan_phi)
+        bg = np.exp(-2.7 * eta * tan_phi)
+        gc = 1 - np.degrees(beta) / 147
+        gq = (1 - 0.5 * np.tan(beta))**5
+        gg = gq
+    
+    # Nível d'água
+    gamma_sat = gamma if gamma_sat is None else np.asarray(gamma_sat, dtype=float)
+    nivel_agua = np.inf if nivel_agua is None else np.asarray(nivel_agua, dtype=float)
+    q, gamma_efetivo = _correcao_nivel_agua(gamma, gamma_sat, B, D, nivel_agua, gamma_w)
+    
+    q_ult = (c * Nc * sc * dc * ic * bc * gc
+             + q * Nq * sq * dq * iq * bq * gq
+             + 0.5 * gamma_efetivo * B * Ngamma * sg * dg * ig * bg * gg)
+    
+    return {
+        'Nc': Nc,
+        'Nq': Nq,
+        'Ngamma': Ngamma,
+        'fatores': {
+            'sc': sc, 'sq': sq, 'sg': sg,
+            'dc': dc, 'dq': dq, 'dg': dg,
+            'ic': ic, 'iq': iq, 'ig': ig,
+            'bc': bc, 'bq': bq, 'bg': bg,
+            'gc': gc, 'gq': gq, 'gg': gg
+        },
+        'q': q,
+        'q_ult': q_ult,
+        'q_adm': q_ult / FS
+    }
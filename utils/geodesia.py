@@ -0,0 +1,217 @@
+"""
+Geodésia - transformações de coordenadas em lote
+Projeção UTM (séries de Krüger) direta e inversa, conversão geodésicas ↔
+geocêntricas e transformação de datum por Helmert, sem serviços externos
+"""
+
+import numpy as np
+
+# Semi-eixo maior (m) e achatamento
+ELIPSOIDES = {
+    'GRS80': {'nome': 'GRS 1980', 'a': 6378137.0, 'f': 1 / 298.257222101},
+    'WGS84': {'nome': 'WGS 84', 'a': 6378137.0, 'f': 1 / 298.257223563},
+    'UGGI67': {'nome': 'Internacional 1967 (UGGI 67)', 'a': 6378160.0, 'f': 1 / 298.25},
+    'HAYFORD': {'nome': 'Internacional 1924 (Hayford)', 'a': 6378388.0, 'f': 1 / 297.0}
+}
+
+# Parâmetros de transformação para o SIRGAS 2000 (translações em m; IBGE)
+DATUMS = {
+    'SIRGAS2000': {'nome': 'SIRGAS 2000', 'elipsoide': 'GRS80', 'para_sirgas': (0.0, 0.0, 0.0)},
+    'WGS84': {'nome': 'WGS 84 (G1150)', 'elipsoide': 'WGS84', 'para_sirgas': (0.0, 0.0, 0.0)},
+    'SAD69': {'nome': 'SAD 69', 'elipsoide': 'UGGI67', 'para_sirgas': (-67.348, 3.879, -38.223)},
+    'CORREGO_ALEGRE': {'nome': 'Córrego Alegre', 'elipsoide': 'HAYFORD', 'para_sirgas': (-205.57, 168.77, -4.12)}
+}
+
+K0_UTM = 0.9996
+FALSO_LESTE = 500000.0
+FALSO_NORTE_SUL = 10000000.0
+
+def _elipsoide(elipsoide):
+    if elipsoide not in ELIPSOIDES:
+        raise ValueError(f"Elipsoide '{elipsoide}' não suportado")
+    return ELIPSOIDES[elipsoide]['a'], ELIPSOIDES[elipsoide]['f']
+
+def _coeficientes_kruger(f):
+    """Raio retificador e coeficientes das séries de Krüger (até n³)"""
+    n = f / (2 - f)
+    A = 1 / (1 + n) * (1 + n**2 / 4 + n**4 / 64)
+    alfa = (n / 2 - 2 * n**2 / 3 + 5 * n**3 / 16, 13 * n**2 / 48 - 3 * n**3 / 5, 61 * n**3 / 240)
+    beta = (n / 2 - 2 * n**2 / 3 + 37 * n**3 / 96, n**2 / 48 + n**3 / 15, 17 * n**3 / 480)
+    delta = (2 * n - 2 * n**2 / 3 - 2 * n**3, 7 * n**2 / 3 - 8 * n**3 / 5, 56 * n**3 / 15)
+    return n, A, alfa, beta, delta
+
+def meridiano_central(fuso):
+    """Longitude do meridiano central do fuso UTM (graus)"""
+    return 6.0 * np.asarray(fuso) - 183.0
+
+def fuso_utm(longitude):
+    """Fuso UTM (1 a 60) de cada longitude (graus)"""
+    return np.clip(np.floor((np.asarray(longitude, dtype=float) + 180.0) / 6.0).astype(int) + 1, 1, 60)
+
+def geograficas_para_utm(latitude, longitude, fuso=None, elipsoide='GRS80'):
+    """
+    Projeção UTM de coordenadas geodésicas (séries de Krüger)
+    
+    As séries em n = f/(2 - f) são avaliadas em arrays, com erro inferior a
+    1 mm dentro do fuso. Se o fuso não for informado, cada ponto usa o
+    seu; para projetos que cruzam fusos, informe um fuso único.
+    
+    Parameters:
+    -----------
+    latitude, longitude : float or array
+        Coordenadas geodésicas (graus; sul e oeste negativos)
+    fuso : int or array, optional
+        Fuso UTM
+    elipsoide : str
+        Chave em ELIPSOIDES (SIRGAS 2000: 'GRS80')
+    
+    Returns:
+    --------
+    dict : {'E', 'N' (m), 'fuso', 'sul': hemisfério, 'convergencia':
+            convergência meridiana γ (graus; azimute de quadrícula =
+            azimute geodésico - γ), 'fator_escala'}
+    """
+    a, f = _elipsoide(elipsoide)
+    n, A, alfa, _, _ = _coeficientes_kruger(f)
+    lat = np.radians(np.asarray(latitude, dtype=float))
+    lon = np.asarray(longitude, dtype=float)
+    if np.any((lat < np.radians(-80.0)) | (lat > np.radians(84.0))):
+        raise ValueError("A projeção UTM é definida entre as latitudes 80°S e 84°N")
+    fuso = fuso_utm(lon) if fuso is None else np.broadcast_to(np.asarray(fuso, dtype=int), lon.shape)
+    dlon = np.radians(lon - meridiano_central(fuso))
+    
+    e = np.sqrt(f * (2 - f))
+    sen_lat = np.sin(lat)
+    t = np.sinh(np.arctanh(sen_lat) - e * np.arctanh(e * sen_lat))
+    xi = np.arctan2(t, np.cos(dlon))
+    eta = np.arctanh(np.sin(dlon) / np.sqrt(1 + t**2))
+    
+    x_soma, y_soma = xi.copy(), eta.copy()
+    sigma, tau = np.ones_like(xi), np.zeros_like(xi)
+    for j, aj in enumerate(alfa, start=1):
+        x_soma += aj * np.sin(2 * j * xi) * np.cosh(2 * j * eta)
+        y_soma += aj * np.cos(2 * j * xi) * np.sinh(2 * j * eta)
+        sigma += 2 * j * aj * np.cos(2 * j * xi) * np.cosh(2 * j * eta)
+        tau += 2 * j * aj * np.sin(2 * j * xi) * np.sinh(2 * j * eta)
+    
+    sul = lat < 0
+    E = FALSO_LESTE + K0_UTM * a * A * y_soma
+    N = np.where(sul, FALSO_NORTE_SUL, 0.0) + K0_UTM * a * A * x_soma
+    
+    tan_dlon = np.tan(dlon)
+    raiz = np.sqrt(1 + t**2)
+    convergencia = np.arctan2(tau * raiz + sigma * t * tan_dlon, sigma * raiz - tau * t * tan_dlon)
+    fator_escala = K0_UTM * A * np.sqrt((1 + ((1 - n) / (1 + n) * np.tan(lat))**2) * (sigma**2 + tau**2)
+                                        / (t**2 + np.cos(dlon)**2))
+    
+    return {
+        'E': E,
+        'N': N,
+        'fuso': fuso,
+        'sul': sul,
+        'convergencia': np.degrees(convergencia),
+        'fator_escala': fator_escala
+    }
+
+def utm_para_geograficas(E, N, fuso, sul=True, elipsoide='GRS80'):
+    """
+    Coordenadas geodésicas a partir de coordenadas UTM (séries de Krüger inversas)
+    
+    Parameters:
+    -----------
+    E, N : float or array
+        Coordenadas UTM (m)
+    fuso : int or array
+        Fuso UTM
+    sul : bool or array
+        Hemisfério sul (falso norte de 10 000 km)
+    elipsoide : str
+        Chave em ELIPSOIDES
+    
+    Returns:
+    --------
+    dict : {'latitude', 'longitude' (graus)}
+    """
+    a, f = _elipsoide(elipsoide)
+    _, A, _, beta, delta = _coeficientes_kruger(f)
+    E = np.asarray(E, dtype=float)
+    N = np.asarray(N, dtype=float)
+    fuso = np.asarray(fuso, dtype=int)
+    if np.any((fuso < 1) | (fuso > 60)):
+        raise ValueError("O fuso UTM deve estar entre 1 e 60")
+    
+    xi = (N - np.where(sul, FALSO_NORTE_SUL, 0.0)) / (K0_UTM * a * A)
+    eta = (E - FALSO_LESTE) / (K0_UTM * a * A)
+    xi_l, eta_l = xi.copy(), eta.copy()
+    for j, bj in enumerate(beta, start=1):
+        xi_l -= bj * np.sin(2 * j * xi) * np.cosh(2 * j * eta)
+        eta_l -= bj * np.cos(2 * j * xi) * np.sinh(2 * j * eta)
+    
+    chi = np.arcsin(np.sin(xi_l) / np.cosh(eta_l))
+    lat = chi.copy()
+    for j, dj in enumerate(delta, start=1):
+        lat += dj * np.sin(2 * j * chi)
+    lon = meridiano_central(fuso) + np.degrees(np.arctan2(np.sinh(eta_l), np.cos(xi_l)))
+    
+    return {'latitude': np.degrees(lat), 'longitude': lon}
+
+def geodesicas_para_geocentricas(latitude, longitude, altitude=0.0, elipsoide='GRS80'):
+    """Coordenadas cartesianas geocêntricas X, Y, Z (m)"""
+    a, f = _elipsoide(elipsoide)
+    e2 = f * (2 - f)
+    lat = np.radians(np.asarray(latitude, dtype=float))
+    lon = np.radians(np.asarray(longitude, dtype=float))
+    h = np.asarray(altitude, dtype=float)
+    Nr = a / np.sqrt(1 - e2 * np.sin(lat)**2)
+    return ((Nr + h) * np.cos(lat) * np.cos(lon),
+            (Nr + h) * np.cos(lat) * np.sin(lon),
+            (Nr * (1 - e2) + h) * np.sin(lat))
+
+def geocentricas_para_geodesicas(X, Y, Z, elipsoide='GRS80'):
+    """
+    Latitude, longitude (graus) e altitude elipsoidal (m) a partir de X, Y, Z
+    
+    Latitude pela fórmula de Bowring com duas iterações (precisão
+    submilimétrica para pontos próximos à superfície).
+    """
+    a, f = _elipsoide(elipsoide)
+    b = a * (1 - f)
+    e2 = f * (2 - f)
+    ep2 = e2 / (1 - e2)
+    X, Y, Z = (np.asarray(v, dtype=float) for v in (X, Y, Z))
+    p = np.hypot(X, Y)
+    
+    beta = np.arctan2(a * Z, b * p)
+    for _ in range(2):
+        lat = np.arctan2(Z + ep2 * b * np.sin(beta)**3, p - e2 * a * np.cos(beta)**3)
+        beta = np.arctan2((1 - f) * np.sin(lat), np.cos(lat))
+    
+    sen_lat = np.sin(lat)
+    Nr = a / np.sqrt(1 - e2 * sen_lat**2)
+    cos_lat = np.cos(lat)
+    h = np.where(np.abs(cos_lat) > 1e-10, p / np.where(np.abs(cos_lat) > 1e-10, cos_lat, 1.0) - Nr,
+                 np.abs(Z) - b)
+    return np.degrees(lat), np.degrees(np.arctan2(Y, X)), h
+
+def transformar_datum(latitude, longitude, altitude=0.0, origem='SAD69', destino='SIRGAS2000'):
+    """
+    Transformação de datum por translação geocêntrica (Helmert de 3 parâmetros)
+    
+    As coordenadas são convertidas para X, Y, Z no elipsoide de origem,
+    levadas ao SIRGAS 2000 e então ao datum de destino (parâmetros do
+    IBGE em DATUMS).
+    
+    Returns:
+    --------
+    dict : {'latitude', 'longitude' (graus), 'altitude' (m)}
+    """
+    for datum in (origem, destino):
+        if datum not in DATUMS:
+            raise ValueError(f"Datum '{datum}' não suportado")
+    X, Y, Z = geodesicas_para_geocentricas(latitude, longitude, altitude, DATUMS[origem]['elipsoide'])
+    t_origem = np.array(DATUMS[origem]['para_sirgas'])
+    t_destino = np.array(DATUMS[destino]['para_sirgas'])
+    deslocamento = t_origem - t_destino
+    lat, lon, h = geocentricas_para_geodesicas(X + deslocamento[0], Y + deslocamento[1], Z + deslocamento[2],
+                                               DATUMS[destino]['elipsoide'])
+    return {'latitude': lat, 'longitude': lon, 'altitude': h}
@@ -0,0 +1,267 @@
+"""
+Muros de arrimo de gravidade e de flexão
+Empuxo (Rankine / Coulomb), verificações de tombamento, deslizamento e
+capacidade de carga avaliadas em grades de geometria
+"""
+
+import numpy as np
+
+from utils.fundacoes import calcular_capacidade_carga_geral
+
+GAMMA_AGUA = 9.81
+
+def coeficiente_empuxo_rankine(phi, beta=0.0):
+    """
+    Coeficiente de empuxo ativo de Rankine com terrapleno inclinado
+    
+    Parameters:
+    -----------
+    phi : float or array
+        Ângulo de atrito do aterro (graus)
+    beta : float or array
+        Inclinação do terrapleno (graus, β ≤ φ)
+    
+    Returns:
+    --------
+    array : Ka (NaN se β > φ)
+    """
+    phi = np.radians(np.asarray(phi, dtype=float))
+    beta = np.radians(np.asarray(beta, dtype=float))
+    raiz = np.sqrt(np.maximum(np.cos(beta)**2 - np.cos(phi)**2, 0.0))
+    Ka = np.cos(beta) * (np.cos(beta) - raiz) / (np.cos(beta) + raiz)
+    return np.where(beta <= phi, Ka, np.nan)
+
+def coeficiente_empuxo_coulomb(phi, delta, beta=0.0, alpha=0.0):
+    """
+    Coeficiente de empuxo ativo de Coulomb
+    
+    Parameters:
+    -----------
+    phi : float or array
+        Ângulo de atrito do aterro (graus)
+    delta : float or array
+        Ângulo de atrito solo-muro (graus)
+    beta : float or array
+        Inclinação do terrapleno (graus)
+    alpha : float or array
+        Inclinação do paramento com a vertical (graus, positivo sob o aterro)
+    
+    Returns:
+    --------
+    array : Ka (NaN se β > φ)
+    """
+    phi, delta, beta, alpha = (np.radians(np.asarray(v, dtype=float)) for v in (phi, delta, beta, alpha))
+    raiz = np.sqrt(np.maximum(np.sin(phi + delta) * np.sin(phi - beta)
+                              / (np.cos(delta + alpha) * np.cos(alpha - beta)), 0.0))
+    Ka = np.cos(phi - alpha)**2 / (np.cos(alpha)**2 * np.cos(delta + alpha) * (1 + raiz)**2)
+    return np.where(beta <= phi, Ka, np.nan)
+
+def _empuxo_plano(Ka, altura, gamma, gamma_sat, sobrecarga, prof_agua):
+    """
+    Empuxo efetivo e da água em um plano vertical de altura dada
+    
+    Returns:
+    --------
+    tuple : (E_solo, M_solo, E_agua, M_agua, h_agua), momentos em relação à base
+    """
+    h1 = np.clip(prof_agua, 0.0, altura)
+    h2 = altura - h1
+    gamma_sub = gamma_sat - GAMMA_AGUA
+    
+    E1 = Ka * (sobrecarga * h1 + 0.5 * gamma * h1**2)
+    M1 = Ka * (sobrecarga * (altura * h1 - h1**2 / 2) + gamma * (altura * h1**2 / 2 - h1**3 / 3))
+    topo = Ka * (sobrecarga + gamma * h1)
+    E2 = topo * h2 + 0.5 * Ka * gamma_sub * h2**2
+    M2 = topo * h2**2 / 2 + Ka * gamma_sub * h2**3 / 6
+    
+    E_agua = 0.5 * GAMMA_AGUA * h2**2
+    M_agua = GAMMA_AGUA * h2**3 / 6
+    return E1 + E2, M1 + M2, E_agua, M_agua, h2
+
+def verificar_muro(altura, base, ponta, espessura_base, espessura_fuste, espessura_topo=0.25,
+                   gamma=18.0, phi=30.0, beta=0.0, sobrecarga=0.0, prof_agua=None, gamma_sat=None,
+                   metodo_empuxo='rankine', delta=None, c_fundacao=0.0, phi_fundacao=30.0,
+                   gamma_fundacao=18.0, embutimento=0.5, gamma_concreto=25.0, metodo_capacidade='vesic',
+                   FS_tombamento=2.0, FS_deslizamento=1.5, FS_capacidade=3.0):
+    """
+    Verificações de estabilidade de muros de arrimo (por metro linear)
+    
+    A geometria cobre muros de flexão e de gravidade: sapata de largura
+    base (ponta à frente do fuste, talão atrás) e fuste com face frontal
+    vertical e face posterior inclinada (espessura_topo → espessura_fuste).
+    Com talão nulo e sapata fina, o perfil é o de um muro de gravidade.
+    O empuxo é calculado no plano vertical virtual que passa pelo fim do
+    talão; o solo à frente desse plano conta como peso estabilizante e a
+    sobrecarga entra apenas no empuxo (a favor da segurança). O empuxo
+    passivo à frente do muro é desprezado.
+    
+    Todos os argumentos geométricos aceitam arrays com broadcast, de modo
+    que uma grade inteira de geometrias é verificada de uma vez.
+    
+    Parameters:
+    -----------
+    altura : float or array
+        Altura total, da base da sapata ao topo do fuste (m)
+    base, ponta : float or array
+        Largura da sapata e comprimento da ponta (m)
+    espessura_base : float or array
+        Espessura da sapata (m)
+    espessura_fuste, espessura_topo : float or array
+        Espessura do fuste na base e no topo (m)
+    gamma, phi : float
+        Peso específico (kN/m³) e ângulo de atrito (graus) do aterro
+    beta : float
+        Inclinação do terrapleno (graus)
+    sobrecarga : float
+        Sobrecarga uniforme no terrapleno (kPa)
+    prof_agua : float, optional
+        Profundidade do nível d'água a partir do topo do aterro (m)
+    gamma_sat : float, optional
+        Peso específico saturado do aterro (kN/m³). Padrão: gamma
+    metodo_empuxo : str
+        'rankine' (empuxo inclinado de β) ou 'coulomb' (inclinado de δ)
+    delta : float, optional
+        Atrito no plano virtual para Coulomb (graus). Padrão: 2φ/3
+    c_fundacao, phi_fundacao, gamma_fundacao : float
+        Parâmetros do solo de fundação
+    embutimento : float
+        Profundidade da base da sapata abaixo do terreno à frente (m)
+    gamma_concreto : float
+        Peso específico do concreto (kN/m³)
+    metodo_capacidade : str
+        Método de calcular_capacidade_carga_geral
+    FS_tombamento, FS_deslizamento, FS_capacidade : float
+        Fatores de segurança mínimos
+    
+    Returns:
+    --------
+    dict : {'Ka', 'empuxo_horizontal' (kN/m), 'carga_vertical' (kN/m),
+            'FS_tombamento', 'FS_deslizamento', 'FS_capacidade',
+            'excentricidade' (m), 'q_max', 'q_min' (kPa),
+            'volume_concreto' (m³/m), 'valido', 'atende'}
+    """
+    altura, base, ponta, espessura_base, espessura_fuste, espessura_topo = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (altura, base, ponta, espessura_base, espessura_fuste, espessura_topo)))
+    
+    talao = base - ponta - espessura_fuste
+    h_fuste = altura - espessura_base
+    valido = (talao >= -1e-9) & (ponta >= 0) & (espessura_fuste >= espessura_topo) & (h_fuste > 0)
+    talao = np.maximum(talao, 0.0)
+    
+    # Pesos e braços em relação à ponta
+    inclinacao = espessura_fuste - espessura_topo
+    largura_aterro = base - ponta - espessura_topo
+    tan_beta = np.tan(np.radians(beta))
+    pesos = [
+        (gamma_concreto * base * espessura_base, base / 2),
+        (gamma_concreto * espessura_topo * h_fuste, ponta + espessura_topo / 2),
+        (gamma_concreto * 0.5 * inclinacao * h_fuste, ponta + espessura_topo + inclinacao / 3),
+        (gamma * 0.5 * inclinacao * h_fuste, ponta + espessura_topo + 2 * inclinacao / 3),
+        (gamma * talao * h_fuste, base - talao / 2),
+        (gamma * 0.5 * largura_aterro**2 * tan_beta, ponta + espessura_topo + 2 * largura_aterro / 3)
+    ]
+    W = sum(peso for peso, _ in pesos)
+    M_pesos = sum(peso * braco for peso, braco in pesos)
+    
+    # Empuxo no plano virtual
+    altura_virtual = altura + largura_aterro * tan_beta
+    if metodo_empuxo == 'rankine':
+        Ka = coeficiente_empuxo_rankine(phi, beta)
+        inclinacao_empuxo = np.radians(beta)
+    elif metodo_empuxo == 'coulomb':
+        delta = 2 * phi / 3 if delta is None else delta
+        Ka = coeficiente_empuxo_coulomb(phi, delta, beta)
+        inclinacao_empuxo = np.radians(delta)
+    else:
+        raise ValueError(f"Método de empuxo '{metodo_empuxo}' não suportado")
+    
+    prof_agua = np.inf if prof_agua is None else prof_agua
+    gamma_sat = gamma if gamma_sat is None else gamma_sat
+    E_solo, M_solo, E_agua, M_agua, h_agua = _empuxo_plano(Ka, altura_virtual, gamma, gamma_sat,
+                                                           sobrecarga, prof_agua)
+    
+    Ph = E_solo * np.cos(inclinacao_empuxo) + E_agua
+    Pv = E_solo * np.sin(inclinacao_empuxo)
+    subpressao = 0.5 * GAMMA_AGUA * np.minimum(h_agua, altura) * base
+    
+    M_resistente = M_pesos + Pv * base
+    M_atuante = M_solo * np.cos(inclinacao_empuxo) + M_agua + subpressao * 2 * base / 3
+    V = W + Pv - subpressao
+    
+    FS_tomb = M_resistente / M_atuante
+    
+    delta_base = np.radians(2 * phi_fundacao / 3)
+    FS_desl = (V * np.tan(delta_base) + 2 * c_fundacao / 3 * base) / Ph
+    
+    excentricidade = base / 2 - (M_resistente - M_atuante) / V
+    q_max = V / base * (1 + 6 * excentricidade / base)
+    q_min = V / base * (1 - 6 * excentricidade / base)
+    
+    # Capacidade de carga com largura efetiva B' = B - 2e e carga inclinada
+    base_efetiva = np.maximum(base - 2 * np.abs(excentricidade), 1e-6)
+    capacidade = calcular_capacidade_carga_geral(c_fundacao, phi_fundacao, gamma_fundacao, base_efetiva,
+                                                 embutimento, metodo=metodo_capacidade, V=V, H=Ph)
+    FS_cap = capacidade['q_ult'] / (V / base_efetiva)
+    
+    volume = base * espessura_base + 0.5 * (espessura_topo + espessura_fuste) * h_fuste
+    valido &= np.isfinite(Ka) & (V > 0)
+    atende = (valido & (FS_tomb >= FS_tombamento) & (FS_desl >= FS_deslizamento)
+              & (np.abs(excentricidade) <= base / 6) & (FS_cap >= FS_capacidade))
+    
+    return {
+        'Ka': np.broadcast_to(Ka, altura.shape),
+        'empuxo_horizontal': Ph,
+        'carga_vertical': V,
+        'FS_tombamento': FS_tomb,
+        'FS_deslizamento': FS_desl,
+        'FS_capacidade': FS_cap,
+        'excentricidade': excentricidade,
+        'q_max': q_max,
+        'q_min': q_min,
+        'volume_concreto': volume,
+        'valido': valido,
+        'atende': atende
+    }
+
+def otimizar_muro(altura, bases, pontas_relativas, espessuras_base, espessuras_fuste, **parametros):
+    """
+    Geometria de menor volume de concreto que atende a todas as verificações
+    
+    A grade completa (bases × pontas × espessuras de sapata × espessuras
+    de fuste) é avaliada em uma única chamada de verificar_muro.
+    
+    Parameters:
+    -----------
+    altura : float
+        Altura total do muro (m)
+    bases : array
+        Larguras de sapata (m)
+    pontas_relativas : array
+        Comprimento da ponta como fração da largura da sapata
+    espessuras_base, espessuras_fuste : array
+        Espessuras da sapata e do fuste na base (m)
+    **parametros
+        Demais argumentos de verificar_muro
+    
+    Returns:
+    --------
+    dict : {'encontrado', 'geometria', 'verificacoes', 'grade', 'n_atende'}
+        'grade' contém o resultado completo com forma
+        (n_bases, n_pontas, n_esp_base, n_esp_fuste)
+    """
+    B, r, tb, tf = np.meshgrid(np.asarray(bases, dtype=float), np.asarray(pontas_relativas, dtype=float),
+                               np.asarray(espessuras_base, dtype=float), np.asarray(espessuras_fuste, dtype=float),
+                               indexing='ij')
+    grade = verificar_muro(altura, B, r * B, tb, tf, **parametros)
+    
+    volume = np.where(grade['atende'], grade['volume_concreto'], np.inf)
+    i = np.unravel_index(np.argmin(volume), volume.shape)
+    encontrado = bool(np.isfinite(volume[i]))
+    
+    return {
+        'encontrado': encontrado,
+        'geometria': {'base': B[i], 'ponta': r[i] * B[i], 'espessura_base': tb[i], 'espessura_fuste': tf[i]},
+        'verificacoes': {chave: valor[i] for chave, valor in grade.items()},
+        'grade': grade,
+        'n_atende': int(grade['atende'].sum())
+    }
@@ -0,0 +1,204 @@
+"""
+Percolação bidimensional em regime permanente
+Diferenças finitas em malha estruturada com matriz esparsa (scipy.sparse)
+"""
+
+import inspect
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import splu, cg
+
+# O SciPy < 1.12 recebe a tolerância relativa do cg como 'tol'
+_PARAMETRO_TOLERANCIA = 'rtol' if 'rtol' in inspect.signature(cg).parameters else 'tol'
+
+def _media_harmonica(a, b):
+    """Média harmônica elemento a elemento (zero se algum valor for zero)"""
+    soma = a + b
+    return np.where(soma > 0, 2 * a * b / np.where(soma > 0, soma, 1.0), 0.0)
+
+def resolver_percolacao(carga_imposta, kx, ky, dx, dy, vazao_imposta=None, solver='direto', tol=1e-10):
+    """
+    Resolve ∂/∂x(kx·∂h/∂x) + ∂/∂y(ky·∂h/∂y) = 0 em uma malha de nós (ny × nx)
+    
+    Cada nó representa um volume de controle (meio volume nas bordas); as
+    condutâncias entre nós usam a média harmônica das permeabilidades, de
+    modo que nós com k = 0 funcionam como barreiras (cortinas, lajes). As
+    bordas sem carga imposta são impermeáveis (Neumann homogêneo); fluxos
+    não nulos entram por vazao_imposta. A linha 0 é o topo da malha.
+    
+    Parameters:
+    -----------
+    carga_imposta : array (ny, nx)
+        Carga total imposta (m) nos nós de Dirichlet; NaN nos demais
+    kx, ky : float or array (ny, nx)
+        Permeabilidades horizontal e vertical (m/s)
+    dx, dy : float
+        Espaçamento da malha (m)
+    vazao_imposta : array (ny, nx), optional
+        Vazão injetada em cada nó (m³/s por metro; positiva entrando)
+    solver : str
+        'direto' (fatoração LU esparsa; cerca de 10 s para 10⁶ nós em um
+        núcleo, custo dominado pela fatoração) ou 'iterativo' (gradientes
+        conjugados com pré-condicionador de Jacobi, menor consumo de
+        memória e mais lento)
+    tol : float
+        Tolerância relativa do solver iterativo
+    
+    Returns:
+    --------
+    dict : {'h': carga total (NaN em nós isolados), 'vazao_nos': vazão
+            trocada com cada nó de Dirichlet (positiva entrando no domínio),
+            'Q': vazão total (m³/s/m), 'ix', 'iy': gradientes hidráulicos,
+            'qx', 'qy': velocidades de descarga (m/s)}
+    """
+    carga_imposta = np.asarray(carga_imposta, dtype=float)
+    ny, nx = carga_imposta.shape
+    kx = np.broadcast_to(np.asarray(kx, dtype=float), (ny, nx))
+    ky = np.broadcast_to(np.asarray(ky, dtype=float), (ny, nx))
+    if np.any(kx < 0) or np.any(ky < 0):
+        raise ValueError("As permeabilidades não podem ser negativas")
+    
+    indice = np.arange(ny * nx).reshape(ny, nx)
+    
+    # Largura das faces: meia célula nas bordas
+    largura_y = np.full(ny, dy)
+    largura_y[[0, -1]] = dy / 2
+    largura_x = np.full(nx, dx)
+    largura_x[[0, -1]] = dx / 2
+    
+    cond_x = _media_harmonica(kx[:, :-1], kx[:, 1:]) * largura_y[:, None] / dx
+    cond_y = _media_harmonica(ky[:-1, :], ky[1:, :]) * largura_x[None, :] / dy
+    
+    i = np.concatenate([indice[:, :-1].ravel(), indice[:-1, :].ravel()])
+    j = np.concatenate([indice[:, 1:].ravel(), indice[1:, :].ravel()])
+    c = np.concatenate([cond_x.ravel(), cond_y.ravel()])
+    
+    n = ny * nx
+    diagonal = np.bincount(i, c, minlength=n) + np.bincount(j, c, minlength=n)
+    A = sparse.coo_matrix((np.concatenate([-c, -c, diagonal]),
+                           (np.concatenate([i, j, np.arange(n)]), np.concatenate([j, i, np.arange(n)]))),
+                          shape=(n, n)).tocsr()
+    
+    fixo = np.isfinite(carga_imposta.ravel())
+    isolado = diagonal == 0
+    livre = ~fixo & ~isolado
+    if not fixo.any():
+        raise ValueError("É necessário ao menos um nó com carga imposta")
+    
+    h = np.full(n, np.nan)
+    h[fixo] = carga_imposta.ravel()[fixo]
+    b = np.zeros(n) if vazao_imposta is None else np.asarray(vazao_imposta, dtype=float).ravel().copy()
+    
+    A_ll = A[livre][:, livre]
+    rhs = b[livre] - A[livre][:, fixo] @ h[fixo]
+    if solver == 'direto':
+        # Matriz simétrica: ordenação de grau mínimo em A + Aᵀ reduz o preenchimento
+        fatoracao = splu(A_ll.tocsc(), permc_spec='MMD_AT_PLUS_A', options=dict(SymmetricMode=True))
+        h[livre] = fatoracao.solve(rhs)
+    elif solver == 'iterativo':
+        jacobi = sparse.diags(1 / A_ll.diagonal())
+        h[livre], info = cg(A_ll, rhs, M=jacobi, maxiter=20 * int(np.sqrt(n)) + 1000,
+                            **{_PARAMETRO_TOLERANCIA: tol})
+        if info != 0:
+            raise ValueError("O solver iterativo não convergiu")
+    else:
+        raise ValueError(f"Solver '{solver}' não suportado")
+    
+    # Vazão nos nós de Dirichlet: resíduo do balanço de massa
+    h_calculo = np.where(isolado, 0.0, h)
+    vazao_nos = np.where(fixo, A @ h_calculo - b, 0.0).reshape(ny, nx)
+    
+    H = h.reshape(ny, nx)
+    grad_y, grad_x = np.gradient(H, dy, dx)
+    # y cresce para baixo (linha 0 no topo): gradiente vertical positivo para cima
+    ix, iy = -grad_x, grad_y
+    
+    return {
+        'h': H,
+        'vazao_nos': vazao_nos,
+        'Q': float(vazao_nos[vazao_nos > 0].sum()),
+        'ix': ix,
+        'iy': iy,
+        'qx': kx * ix,
+        'qy': ky * iy
+    }
+
+def modelo_fundacao(comprimento, espessura, x_montante, x_jusante, carga_montante, carga_jusante,
+                    cortinas=None, dx=0.5, dy=None):
+    """
+    Malha de percolação sob barragem de concreto ou cortina de estacas-prancha
+    
+    O terreno ocupa [0, comprimento] × [0, espessura] com base impermeável.
+    Na superfície, a carga é carga_montante para x ≤ x_montante e
+    carga_jusante para x ≥ x_jusante; entre esses pontos fica a base
+    impermeável da estrutura (para uma cortina isolada, x_montante =
+    x_jusante = posição da cortina).
+    
+    Parameters:
+    -----------
+    comprimento, espessura : float
+        Dimensões do domínio (m)
+    x_montante, x_jusante : float
+        Limites da estrutura na superfície (m)
+    carga_montante, carga_jusante : float
+        Cargas totais a montante e a jusante (m)
+    cortinas : list of tuple, optional
+        Cortinas impermeáveis (x, profundidade) em m
+    dx, dy : float
+        Espaçamento da malha (m); dy padrão = dx
+    
+    Returns:
+    --------
+    dict : {'x', 'y' (profundidade), 'carga_imposta', 'impermeavel'}
+    """
+    dy = dx if dy is None else dy
+    x = np.linspace(0, comprimento, int(round(comprimento / dx)) + 1)
+    y = np.linspace(0, espessura, int(round(espessura / dy)) + 1)
+    
+    carga_imposta = np.full((y.size, x.size), np.nan)
+    carga_imposta[0, x <= x_montante + 1e-9] = carga_montante
+    carga_imposta[0, x >= x_jusante - 1e-9] = carga_jusante
+    
+    impermeavel = np.zeros((y.size, x.size), dtype=bool)
+    for x_cortina, profundidade in cortinas or []:
+        j = int(np.argmin(np.abs(x - x_cortina)))
+        impermeavel[y <= profundidade + 1e-9, j] = True
+    carga_imposta[impermeavel] = np.nan
+    
+    return {'x': x, 'y': y, 'carga_imposta': carga_imposta, 'impermeavel': impermeavel}
+
+def gradiente_saida(resultado, dy):
+    """
+    Gradiente de saída máximo nos nós de jusante (onde a água deixa o domínio)
+    
+    Calculado pela diferença entre a carga do nó de superfície e a do nó
+    imediatamente abaixo. No pé de uma estrutura sem cortina a jusante o
+    gradiente teórico é singular e o valor obtido depende da malha.
+    
+    Returns:
+    --------
+    float : Gradiente de saída
+    """
+    h = resultado['h']
+    saida = resultado['vazao_nos'][0] < 0
+    if not saida.any():
+        return 0.0
+    return float(np.nanmax((h[1, saida] - h[0, saida]) / dy))
+
+def funcao_corrente(resultado, dy):
+    """
+    Função de corrente ψ para o traçado das linhas de fluxo
+    
+    Integra qx ao longo de cada coluna a partir da base impermeável (ψ = 0),
+    o que é válido para o campo de velocidades conservativo obtido.
+    
+    Returns:
+    --------
+    array (ny, nx) : ψ (m³/s por metro)
+    """
+    qx = np.nan_to_num(resultado['qx'])
+    trechos = 0.5 * (qx[1:] + qx[:-1]) * dy
+    psi = np.zeros_like(qx)
+    psi[:-1] = np.cumsum(trechos[::-1], axis=0)[::-1]
+    return psi
@@ -0,0 +1,354 @@
+"""
+Perfil longitudinal e terraplenagem
+Greide com curvas verticais parabólicas, áreas das seções transversais,
+volumes acumulados e diagrama de Brückner com linha de compensação
+"""
+
+import numpy as np
+
+def criar_perfil(estacas_piv, cotas_piv, comprimentos_curva):
+    """
+    Monta o greide a partir dos PIVs e das curvas verticais parabólicas simétricas
+    
+    Parameters:
+    -----------
+    estacas_piv, cotas_piv : array (n,)
+        Estacas (m) e cotas (m) dos PIVs, incluindo o início e o fim do greide
+    comprimentos_curva : array (n - 2,)
+        Comprimento L da curva vertical em cada PIV interno (m); 0 sem curva
+    
+    Returns:
+    --------
+    dict : {'estaca', 'cota': PIVs, 'rampas': inclinações (m/m),
+            'curvas': arrays por PIV interno ('estaca_PIV', 'L', 'A' (%),
+            'K' (m/%), 'flecha', 'estaca_PCV', 'cota_PCV', 'estaca_PTV',
+            'cota_PTV', 'estaca_extremo', 'cota_extremo' (NaN se o ponto
+            de máximo/mínimo estiver fora da curva))}
+    """
+    estacas = np.asarray(estacas_piv, dtype=float)
+    cotas = np.asarray(cotas_piv, dtype=float)
+    L = np.atleast_1d(np.asarray(comprimentos_curva, dtype=float))
+    if estacas.size < 2 or cotas.size != estacas.size:
+        raise ValueError("Informe ao menos dois PIVs com estaca e cota")
+    if L.size != estacas.size - 2:
+        raise ValueError("Informe um comprimento de curva para cada PIV interno")
+    if np.any(np.diff(estacas) <= 0):
+        raise ValueError("As estacas dos PIVs devem ser crescentes")
+    if np.any(L < 0):
+        raise ValueError("Os comprimentos de curva não podem ser negativos")
+    
+    rampas = np.diff(cotas) / np.diff(estacas)
+    i1, i2 = rampas[:-1], rampas[1:]
+    A = i2 - i1
+    
+    estaca_PCV = estacas[1:-1] - L / 2
+    estaca_PTV = estacas[1:-1] + L / 2
+    inicio = np.concatenate([[estacas[0]], estaca_PTV])
+    fim = np.concatenate([estaca_PCV, [estacas[-1]]])
+    if np.any(fim - inicio < -1e-9):
+        i = int(np.argmin(fim - inicio))
+        raise ValueError(f"As curvas verticais se sobrepõem entre os PIVs {i} e {i + 1}")
+    
+    cota_PCV = cotas[1:-1] - i1 * L / 2
+    # Ponto de máximo/mínimo: rampa nula em x = -i1·L/A a partir do PCV
+    x_extremo = np.where(A != 0, -i1 * L / np.where(A != 0, A, 1.0), np.nan)
+    no_trecho = (x_extremo >= 0) & (x_extremo <= L)
+    x_extremo = np.where(no_trecho, x_extremo, np.nan)
+    L_seguro = np.where(L > 0, L, 1.0)
+    
+    return {
+        'estaca': estacas,
+        'cota': cotas,
+        'rampas': rampas,
+        'curvas': {
+            'estaca_PIV': estacas[1:-1],
+            'L': L,
+            'A': 100 * A,
+            'K': np.where(A != 0, L / np.where(A != 0, 100 * np.abs(A), 1.0), np.inf),
+            'flecha': A * L / 8,
+            'estaca_PCV': estaca_PCV,
+            'cota_PCV': cota_PCV,
+            'estaca_PTV': estaca_PTV,
+            'cota_PTV': cotas[1:-1] + i2 * L / 2,
+            'estaca_extremo': estaca_PCV + x_extremo,
+            'cota_extremo': cota_PCV + i1 * x_extremo + A * x_extremo**2 / (2 * L_seguro)
+        }
+    }
+
+def cotas_greide(perfil, estacas):
+    """
+    Cota e rampa do greide em estacas arbitrárias
+    
+    Fora das curvas o greide segue a poligonal dos PIVs; dentro delas,
+    cota = cota_PCV + i1·x + A·x²/(2L), com x medido a partir do PCV. A
+    curva de cada estaca é localizada com np.searchsorted.
+    
+    Returns:
+    --------
+    dict : {'cota' (m), 'rampa' (m/m)}
+    """
+    estacas = np.clip(np.asarray(estacas, dtype=float), perfil['estaca'][0], perfil['estaca'][-1])
+    curvas = perfil['curvas']
+    
+    cota = np.interp(estacas, perfil['estaca'], perfil['cota'])
+    trecho = np.clip(np.searchsorted(perfil['estaca'], estacas, side='right') - 1, 0, perfil['rampas'].size - 1)
+    rampa = perfil['rampas'][trecho]
+    
+    if curvas['L'].size:
+        j = np.clip(np.searchsorted(curvas['estaca_PCV'], estacas, side='right') - 1, 0, curvas['L'].size - 1)
+        x = estacas - curvas['estaca_PCV'][j]
+        L = curvas['L'][j]
+        na_curva = (x >= 0) & (x <= L) & (L > 0)
+        i1 = perfil['rampas'][j]
+        A = curvas['A'][j] / 100
+        L_seguro = np.where(L > 0, L, 1.0)
+        cota = np.where(na_curva, curvas['cota_PCV'][j] + i1 * x + A * x**2 / (2 * L_seguro), cota)
+        rampa = np.where(na_curva, i1 + A * x / L_seguro, rampa)
+    
+    return {'cota': cota, 'rampa': rampa}
+
+def _integral_positiva(f, h):
+    """Integral da parte positiva de f linear por trechos (valores nos extremos de cada trecho)"""
+    f0, f1 = f[..., :-1], f[..., 1:]
+    p0, p1 = np.maximum(f0, 0.0), np.maximum(f1, 0.0)
+    soma = np.abs(f0) + np.abs(f1)
+    troca = (f0 * f1 < 0)
+    return np.where(troca, h * (p0 + p1)**2 / (2 * np.where(soma > 0, soma, 1.0)), h * (p0 + p1) / 2)
+
+def areas_secoes(cotas_greide, afastamentos, cotas_terreno, semi_largura,
+                 inclinacao_transversal=0.0, talude_corte=1.0, talude_aterro=1.5):
+    """
+    Áreas de corte e aterro das seções transversais
+    
+    A seção de projeto é uma plataforma de semi-largura b com abaulamento
+    (cota = greide - i·|o|), seguida dos taludes a partir das bordas. Na
+    plataforma, corte e aterro são as partes positiva e negativa de
+    terreno - projeto; fora dela, o corte é a parte do terreno acima da
+    linha do talude de corte e o aterro, a parte abaixo da linha do talude
+    de aterro. O terreno é linear entre os afastamentos levantados e as
+    integrais são exatas por trecho, com os cruzamentos interpolados.
+    Todas as estacas são processadas de uma vez.
+    
+    Parameters:
+    -----------
+    cotas_greide : array (n,)
+        Cota do greide no eixo de cada estaca (m)
+    afastamentos : array (m,)
+        Afastamentos das leituras do terreno, comuns a todas as seções
+        (m, negativos à esquerda)
+    cotas_terreno : array (n, m)
+        Cotas do terreno em cada estaca e afastamento (m)
+    semi_largura : float
+        Semi-largura da plataforma b (m)
+    inclinacao_transversal : float
+        Abaulamento da plataforma (m/m)
+    talude_corte, talude_aterro : float
+        Inclinações dos taludes (H:V, horizontal por unidade vertical)
+    
+    Returns:
+    --------
+    dict : {'corte', 'aterro': áreas (m²), 'incompleta': seções em que o
+            talude não encontra o terreno dentro dos afastamentos levantados}
+    """
+    greide = np.asarray(cotas_greide, dtype=float)
+    o = np.asarray(afastamentos, dtype=float)
+    Z = np.atleast_2d(np.asarray(cotas_terreno, dtype=float))
+    if Z.shape != (greide.size, o.size):
+        raise ValueError("cotas_terreno deve ter uma linha por estaca e uma coluna por afastamento")
+    if np.any(np.diff(o) <= 0):
+        raise ValueError("Os afastamentos devem ser crescentes")
+    if semi_largura <= 0 or talude_corte <= 0 or talude_aterro <= 0:
+        raise ValueError("A semi-largura e os taludes devem ser positivos")
+    if o[0] > -semi_largura or o[-1] < semi_largura:
+        raise ValueError("Os afastamentos devem cobrir toda a plataforma")
+    
+    # Inclui o eixo e as bordas da plataforma nos pontos de cálculo
+    o_total = np.union1d(o, [-semi_largura, 0.0, semi_largura])
+    k = np.clip(np.searchsorted(o, o_total, side='right') - 1, 0, o.size - 2)
+    w = (o_total - o[k]) / (o[k + 1] - o[k])
+    Z = Z[:, k] * (1 - w) + Z[:, k + 1] * w
+    
+    distancia = np.abs(o_total)
+    fora = np.maximum(distancia - semi_largura, 0.0)
+    borda = greide[:, None] - inclinacao_transversal * np.minimum(distancia, semi_largura)
+    h = np.diff(o_total)
+    plataforma = 0.5 * (distancia[:-1] + distancia[1:]) <= semi_largura
+    
+    diferenca_plataforma = Z - borda
+    diferenca_corte = Z - (borda + fora / talude_corte)
+    diferenca_aterro = (borda - fora / talude_aterro) - Z
+    
+    corte = np.where(plataforma, _integral_positiva(diferenca_plataforma, h),
+                     _integral_positiva(diferenca_corte, h)).sum(axis=1)
+    aterro = np.where(plataforma, _integral_positiva(-diferenca_plataforma, h),
+                      _integral_positiva(diferenca_aterro, h)).sum(axis=1)
+    
+    extremos = [0, -1]
+    incompleta = np.any((diferenca_corte[:, extremos] > 0) | (diferenca_aterro[:, extremos] > 0), axis=1)
+    
+    return {'corte': corte, 'aterro': aterro, 'incompleta': incompleta}
+
+def _volumes_intervalos(estacas, areas, metodo):
+    """Volume entre estacas consecutivas pela média das áreas ou pela fórmula prismoidal"""
+    h = np.diff(estacas)
+    if metodo == 'media' or estacas.size < 3:
+        return h * (areas[:-1] + areas[1:]) / 2
+    if metodo != 'prismoidal':
+        raise ValueError(f"Método '{metodo}' não suportado")
+    
+    # Parábola pelas seções de cada trio (i, i+1, i+2): integrais exatas
+    # sobre o primeiro e o segundo intervalos (Simpson para espaçamento qualquer)
+    h0, h1 = h[:-1], h[1:]
+    H = h0 + h1
+    A0, A1, A2 = areas[:-2], areas[1:-1], areas[2:]
+    primeiro = (h0 * (3 * H - h0) / (6 * H) * A0 + h0 * (3 * H - 2 * h0) / (6 * h1) * A1
+                - h0**3 / (6 * H * h1) * A2)
+    segundo = (-h1**3 / (6 * H * h0) * A0 + h1 * (3 * H - 2 * h1) / (6 * h0) * A1
+               + h1 * (3 * H - h1) / (6 * H) * A2)
+    
+    volumes = np.empty(h.size)
+    volumes[0:-1:2] = primeiro[0::2]
+    volumes[1::2] = segundo[0::2]
+    if h.size % 2:
+        volumes[-1] = segundo[-1]
+    return volumes
+
+def volumes_terraplenagem(estacas, area_corte, area_aterro, metodo='media', fator_homogeneizacao=1.0):
+    """
+    Volumes de corte e aterro e ordenadas do diagrama de Brückner
+    
+    Os volumes entre seções são obtidos pela média das áreas ou pela
+    fórmula prismoidal (parábola ajustada a cada trio de seções) e
+    acumulados com np.cumsum. A ordenada de Brückner é o volume de corte
+    acumulado menos o de aterro multiplicado pelo fator de
+    homogeneização (aterro convertido em volume de corte equivalente).
+    
+    Parameters:
+    -----------
+    estacas : array (n,)
+        Estacas das seções (m), crescentes
+    area_corte, area_aterro : array (n,)
+        Áreas das seções (m²)
+    metodo : str
+        'media' (média das áreas) ou 'prismoidal'
+    fator_homogeneizacao : float
+        Relação entre o volume de corte e o volume de aterro compactado
+    
+    Returns:
+    --------
+    dict : {'corte', 'aterro': volumes por intervalo (m³), 'corte_acumulado',
+            'aterro_acumulado', 'bruckner': ordenadas nas estacas (m³),
+            'total_corte', 'total_aterro'}
+    """
+    estacas = np.asarray(estacas, dtype=float)
+    area_corte = np.asarray(area_corte, dtype=float)
+    area_aterro = np.asarray(area_aterro, dtype=float)
+    if estacas.size < 2:
+        raise ValueError("São necessárias ao menos duas seções")
+    if np.any(np.diff(estacas) <= 0):
+        raise ValueError("As estacas das seções devem ser crescentes")
+    
+    corte = _volumes_intervalos(estacas, area_corte, metodo)
+    aterro = _volumes_intervalos(estacas, area_aterro, metodo)
+    corte_acumulado = np.concatenate([[0.0], np.cumsum(corte)])
+    aterro_acumulado = np.concatenate([[0.0], np.cumsum(aterro)])
+    
+    return {
+        'corte': corte,
+        'aterro': aterro,
+        'corte_acumulado': corte_acumulado,
+        'aterro_acumulado': aterro_acumulado,
+        'bruckner': corte_acumulado - fator_homogeneizacao * aterro_acumulado,
+        'total_corte': float(corte_acumulado[-1]),
+        'total_aterro': float(aterro_acumulado[-1])
+    }
+
+def _momento_trechos(d, h):
+    """Integral de |d| em cada trecho com d linear"""
+    d0, d1 = d[:-1], d[1:]
+    soma = np.abs(d0) + np.abs(d1)
+    troca = d0 * d1 < 0
+    return np.where(troca, h * (d0**2 + d1**2) / (2 * np.where(soma > 0, soma, 1.0)), h * np.abs(d0 + d1) / 2)
+
+def linha_compensacao(estacas, ordenadas, cota=None):
+    """
+    Linha de compensação do diagrama de Brückner e momentos de transporte
+    
+    O momento de transporte total é a área entre o diagrama e a linha
+    horizontal, ∫|M - c|·ds. Ela é mínima quando c é a mediana do
+    diagrama ao longo das estacas (metade da extensão acima da linha e
+    metade abaixo), obtida por bissecção sobre o comprimento em que M ≤ c.
+    Cada onda entre pontos de passagem é um trecho compensado: o volume
+    transportado é o afastamento máximo da linha e a distância média de
+    transporte é o momento dividido por esse volume.
+    
+    Parameters:
+    -----------
+    estacas : array (n,)
+        Estacas (m)
+    ordenadas : array (n,)
+        Ordenadas do diagrama de Brückner (m³)
+    cota : float, optional
+        Cota da linha de compensação (m³); se omitida, usa a ótima
+    
+    Returns:
+    --------
+    dict : {'cota', 'momento' (m³·m), 'pontos_passagem' (estacas),
+            'ondas': {'inicio', 'fim', 'volume', 'momento', 'dmt',
+            'sentido' (+1 transporte no sentido do estaqueamento)},
+            'inicio', 'fim': volume excedente nas extremidades
+            (positivo: bota-fora; negativo: empréstimo)}
+    """
+    s = np.asarray(estacas, dtype=float)
+    M = np.asarray(ordenadas, dtype=float)
+    h = np.diff(s)
+    
+    if cota is None:
+        M0, M1 = M[:-1], M[1:]
+        baixo, alto = np.minimum(M0, M1), np.maximum(M0, M1)
+        variacao = np.where(alto > baixo, alto - baixo, 1.0)
+        metade = h.sum() / 2
+        c_min, c_max = float(M.min()), float(M.max())
+        for _ in range(200):
+            c = 0.5 * (c_min + c_max)
+            abaixo = np.where(alto > baixo, np.clip((c - baixo) / variacao, 0.0, 1.0), (baixo <= c).astype(float))
+            if (h * abaixo).sum() < metade:
+                c_min = c
+            else:
+                c_max = c
+            if c_max - c_min <= 1e-12 * max(1.0, abs(c_max)):
+                break
+        cota = 0.5 * (c_min + c_max)
+    
+    d = M - cota
+    momento = float(_momento_trechos(d, h).sum())
+    
+    # Pontos de passagem inseridos na poligonal: nenhum trecho muda de sinal
+    troca = np.flatnonzero(d[:-1] * d[1:] < 0)
+    passagem = s[troca] + h[troca] * d[troca] / (d[troca] - d[troca + 1])
+    s_ref = np.insert(s, troca + 1, passagem)
+    d_ref = np.insert(d, troca + 1, 0.0)
+    h_ref = np.diff(s_ref)
+    
+    sinal = np.sign(d_ref[:-1] + d_ref[1:])
+    inicio = np.flatnonzero(np.concatenate([[True], sinal[1:] != sinal[:-1]]))
+    momento_ondas = np.add.reduceat(_momento_trechos(d_ref, h_ref), inicio)
+    volume_ondas = np.maximum.reduceat(np.maximum(np.abs(d_ref[:-1]), np.abs(d_ref[1:])), inicio)
+    fim = np.concatenate([inicio[1:], [sinal.size]])
+    validas = (sinal[inicio] != 0) & (volume_ondas > 1e-9 * max(1.0, np.abs(d).max()))
+    
+    return {
+        'cota': float(cota),
+        'momento': momento,
+        'pontos_passagem': np.sort(np.concatenate([passagem, s[1:-1][d[1:-1] == 0]])),
+        'ondas': {
+            'inicio': s_ref[inicio][validas],
+            'fim': s_ref[fim][validas],
+            'volume': volume_ondas[validas],
+            'momento': momento_ondas[validas],
+            'dmt': momento_ondas[validas] / np.where(volume_ondas[validas] > 0, volume_ondas[validas], 1.0),
+            'sentido': sinal[inicio][validas].astype(int)
+        },
+        'inicio': float(-d[0]),
+        'fim': float(d[-1])
+    }
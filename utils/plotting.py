@@ -278,3 +278,243 @@ def plot_circulo_mohr(sigma_x, sigma_y, tau_xy):
     
     return fig, sigma_1, sigma_2, theta_p
 
+
+def plot_contorno_tensoes(x, z, delta_sigma, titulo="Bulbo de Tensões", eixo_x="x (m)"):
+    """
+    Plota isolinhas de acréscimo de tensão em uma seção vertical
+    
+    Parameters:
+    -----------
+    x : array (n_x,)
+        Coordenadas horizontais da seção (m)
+    z : array (n_z,)
+        Profundidades (m)
+    delta_sigma : array (n_x, n_z)
+        Acréscimo de tensão vertical (kPa)
+    titulo : str
+        Título do gráfico
+    eixo_x : str
+        Rótulo do eixo horizontal
+    """
+    fig = go.Figure()
+    
+    fig.add_trace(go.Contour(
+        x=x,
+        y=z,
+        z=np.asarray(delta_sigma).T,
+        colorscale='Viridis',
+        contours=dict(showlabels=True, labelfont=dict(size=10, color='white')),
+        colorbar=dict(title='Δσz (kPa)'),
+        hovertemplate='x: %{x:.2f} m<br>z: %{y:.2f} m<br>Δσz: %{z:.1f} kPa<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title=titulo,
+        xaxis_title=eixo_x,
+        yaxis_title="Profundidade z (m)",
+        yaxis=dict(autorange="reversed"),
+        height=500,
+        template='plotly_white'
+    )
+    
+    return fig
+
+def plot_curvas_granulometricas(aberturas, passante, nomes=None, max_legenda=20):
+    """
+    Plota curvas granulométricas com traços WebGL
+    
+    Até max_legenda curvas são desenhadas em traços individuais; acima disso
+    todas as curvas são concatenadas (separadas por None) em um único
+    traço Scattergl, o que mantém o gráfico leve com milhares de amostras.
+    
+    Parameters:
+    -----------
+    aberturas : array (n_peneiras,)
+        Abertura das peneiras (mm)
+    passante : array (n_amostras, n_peneiras)
+        Percentual passante acumulado (%)
+    nomes : list, optional
+        Identificação das amostras
+    max_legenda : int
+        Número máximo de curvas com traço próprio
+    """
+    aberturas = np.asarray(aberturas, dtype=float)
+    passante = np.atleast_2d(np.asarray(passante, dtype=float))
+    n = passante.shape[0]
+    nomes = [f"Amostra {i + 1}" for i in range(n)] if nomes is None else [str(nome) for nome in nomes]
+    
+    fig = go.Figure()
+    
+    if n <= max_legenda:
+        for curva, nome in zip(passante, nomes):
+            fig.add_trace(go.Scattergl(
+                x=aberturas,
+                y=curva,
+                mode='lines+markers',
+                name=nome,
+                hovertemplate='Abertura: %{x:.3f} mm<br>Passante: %{y:.1f}%<extra>' + nome + '</extra>'
+            ))
+    else:
+        m = aberturas.size
+        x = np.full((n, m + 1), np.nan)
+        y = np.full((n, m + 1), np.nan)
+        x[:, :m] = aberturas
+        y[:, :m] = passante
+        texto = np.repeat(np.asarray(nomes, dtype=object), m + 1)
+        fig.add_trace(go.Scattergl(
+            x=x.ravel(),
+            y=y.ravel(),
+            text=texto,
+            mode='lines',
+            name=f"{n} amostras",
+            line=dict(color='rgba(31,119,180,0.25)', width=1),
+            connectgaps=False,
+            hovertemplate='%{text}<br>Abertura: %{x:.3f} mm<br>Passante: %{y:.1f}%<extra></extra>'
+        ))
+    
+    fig.update_layout(
+        title="Curvas Granulométricas",
+        xaxis_title="Abertura das Peneiras (mm)",
+        yaxis_title="Porcentagem Passante (%)",
+        xaxis_type="log",
+        yaxis=dict(range=[0, 100]),
+        height=500,
+        template='plotly_white'
+    )
+    
+    return fig
+
+def plot_envoltoria_mohr(sigma3, sigma1, c, phi, n_pontos=60):
+    """
+    Plota os círculos de Mohr de vários ensaios e a envoltória de Mohr-Coulomb
+    
+    Os semicírculos superiores são concatenados (separados por NaN) em um
+    único traço Scattergl, mantendo o gráfico leve com muitos ensaios.
+    
+    Parameters:
+    -----------
+    sigma3, sigma1 : array
+        Tensões principais na ruptura (kPa)
+    c : float
+        Coesão ajustada (kPa)
+    phi : float
+        Ângulo de atrito ajustado (graus)
+    n_pontos : int
+        Pontos por semicírculo
+    """
+    sigma3 = np.asarray(sigma3, dtype=float)
+    sigma1 = np.asarray(sigma1, dtype=float)
+    centro = ((sigma1 + sigma3) / 2)[:, None]
+    raio = ((sigma1 - sigma3) / 2)[:, None]
+    
+    theta = np.append(np.linspace(0, np.pi, n_pontos), np.nan)
+    x = (centro + raio * np.cos(theta)).ravel()
+    y = (raio * np.sin(theta)).ravel()
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scattergl(
+        x=x,
+        y=y,
+        mode='lines',
+        name=f'Círculos de Mohr ({sigma3.size})',
+        line=dict(color='rgba(0,0,255,0.5)', width=1.5),
+        hovertemplate='σ: %{x:.1f} kPa<br>τ: %{y:.1f} kPa<extra></extra>'
+    ))
+    
+    # Envoltória e pontos de tangência
+    phi_rad = np.radians(phi)
+    sigma_max = sigma1.max() * 1.05
+    fig.add_trace(go.Scatter(
+        x=[0, sigma_max],
+        y=[c, c + sigma_max * np.tan(phi_rad)],
+        mode='lines',
+        name=f'Envoltória: c = {c:.1f} kPa, φ = {phi:.1f}°',
+        line=dict(color='red', width=3)
+    ))
+    fig.add_trace(go.Scattergl(
+        x=centro[:, 0] - raio[:, 0] * np.sin(phi_rad),
+        y=raio[:, 0] * np.cos(phi_rad),
+        mode='markers',
+        name='Pontos de Tangência',
+        marker=dict(size=7, color='red', symbol='circle-open')
+    ))
+    
+    fig.update_layout(
+        title="Envoltória de Resistência de Mohr-Coulomb",
+        xaxis_title="Tensão Normal σ (kPa)",
+        yaxis_title="Tensão de Cisalhamento τ (kPa)",
+        hovermode='closest',
+        height=500,
+        xaxis=dict(scaleanchor="y", scaleratio=1),
+        template='plotly_white'
+    )
+    
+    return fig
+
+def plot_rede_fluxo(x, y, carga, psi=None, impermeavel=None, n_linhas=15):
+    """
+    Plota a rede de fluxo: equipotenciais e, opcionalmente, linhas de fluxo
+    
+    Parameters:
+    -----------
+    x : array (nx,)
+        Coordenadas horizontais (m)
+    y : array (ny,)
+        Profundidades (m)
+    carga : array (ny, nx)
+        Carga total (m)
+    psi : array (ny, nx), optional
+        Função de corrente
+    impermeavel : array of bool (ny, nx), optional
+        Nós impermeáveis (cortinas), desenhados em preto
+    n_linhas : int
+        Número aproximado de linhas de cada família
+    """
+    fig = go.Figure()
+    
+    fig.add_trace(go.Contour(
+        x=x,
+        y=y,
+        z=carga,
+        colorscale='Blues',
+        ncontours=n_linhas,
+        contours=dict(showlabels=True, labelfont=dict(size=10)),
+        colorbar=dict(title='h (m)'),
+        name='Equipotenciais',
+        hovertemplate='x: %{x:.2f} m<br>z: %{y:.2f} m<br>h: %{z:.3f} m<extra></extra>'
+    ))
+    
+    if psi is not None:
+        fig.add_trace(go.Contour(
+            x=x,
+            y=y,
+            z=psi,
+            ncontours=n_linhas,
+            contours=dict(coloring='none'),
+            line=dict(color='darkred', width=1.5, dash='dot'),
+            showscale=False,
+            name='Linhas de Fluxo',
+            hoverinfo='skip'
+        ))
+    
+    if impermeavel is not None and np.any(impermeavel):
+        linhas, colunas = np.nonzero(impermeavel)
+        fig.add_trace(go.Scatter(
+            x=np.asarray(x)[colunas],
+            y=np.asarray(y)[linhas],
+            mode='markers',
+            name='Cortina',
+            marker=dict(size=4, color='black', symbol='square')
+        ))
+    
+    fig.update_layout(
+        title="Rede de Fluxo",
+        xaxis_title="x (m)",
+        yaxis_title="Profundidade (m)",
+        yaxis=dict(autorange="reversed", scaleanchor="x", scaleratio=1),
+        height=550,
+        template='plotly_white'
+    )
+    
+    return fig
@@ -0,0 +1,195 @@
+"""
+Projeto geométrico de rodovias - critérios do DNIT
+Raios mínimos, superelevação, transições e distâncias de visibilidade a
+partir de tabelas pré-calculadas por velocidade de projeto e superelevação
+máxima, com consultas vetorizadas e interpoladas para traçados inteiros
+"""
+
+import numpy as np
+
+# Manual de Projeto Geométrico de Rodovias Rurais (DNER/DNIT, 1999)
+TABELA_DNIT = {
+    'velocidade': np.array([30, 40, 50, 60, 70, 80, 90, 100, 110, 120], dtype=float),
+    'atrito_lateral': np.array([0.20, 0.18, 0.16, 0.15, 0.15, 0.14, 0.14, 0.13, 0.12, 0.11]),
+    'atrito_longitudinal': np.array([0.40, 0.37, 0.35, 0.33, 0.31, 0.30, 0.29, 0.28, 0.28, 0.27]),
+    # Raios acima dos quais a superelevação é dispensada (m); 5000 m a partir de 90 km/h
+    'raio_sem_superelevacao': np.array([450, 800, 1250, 1800, 2450, 3200, 5000, 5000, 5000, 5000], dtype=float),
+    # Distância de visibilidade de ultrapassagem (m); tabelada até 100 km/h
+    'ultrapassagem': np.array([180, 270, 350, 420, 490, 560, 620, 680, np.nan, np.nan])
+}
+
+SUPERELEVACOES_MAXIMAS = np.array([0.04, 0.06, 0.08, 0.10, 0.12])
+RAMPAS = np.round(np.arange(-0.10, 0.1001, 0.01), 2)
+
+# Raios mínimos (m) por velocidade (linhas) e superelevação máxima (colunas)
+RAIOS_MINIMOS = TABELA_DNIT['velocidade'][:, None]**2 / (
+    127 * (SUPERELEVACOES_MAXIMAS[None, :] + TABELA_DNIT['atrito_lateral'][:, None]))
+
+# Distância de frenagem (m) por velocidade (linhas) e greide (colunas)
+DISTANCIAS_FRENAGEM = TABELA_DNIT['velocidade'][:, None]**2 / (
+    255 * (TABELA_DNIT['atrito_longitudinal'][:, None] + RAMPAS[None, :]))
+
+def _velocidade(velocidade):
+    V = np.asarray(velocidade, dtype=float)
+    faixa = TABELA_DNIT['velocidade']
+    if np.any((V < faixa[0]) | (V > faixa[-1])):
+        raise ValueError(f"Velocidade de projeto fora das tabelas do DNIT ({faixa[0]:.0f} a {faixa[-1]:.0f} km/h)")
+    return V
+
+def _consultar(coluna, velocidade):
+    """Valor da tabela do DNIT interpolado linearmente na velocidade de projeto"""
+    return np.interp(_velocidade(velocidade), TABELA_DNIT['velocidade'], TABELA_DNIT[coluna])
+
+def _interpolar_tabela(tabela, eixo_linhas, eixo_colunas, linha, coluna):
+    """Interpolação bilinear vetorizada numa tabela pré-calculada (valores dentro dos eixos)"""
+    linha, coluna = np.broadcast_arrays(np.asarray(linha, dtype=float), np.asarray(coluna, dtype=float))
+    i = np.clip(np.searchsorted(eixo_linhas, linha, side='right') - 1, 0, eixo_linhas.size - 2)
+    j = np.clip(np.searchsorted(eixo_colunas, coluna, side='right') - 1, 0, eixo_colunas.size - 2)
+    u = (linha - eixo_linhas[i]) / (eixo_linhas[i + 1] - eixo_linhas[i])
+    v = (coluna - eixo_colunas[j]) / (eixo_colunas[j + 1] - eixo_colunas[j])
+    return ((1 - u) * (1 - v) * tabela[i, j] + u * (1 - v) * tabela[i + 1, j]
+            + (1 - u) * v * tabela[i, j + 1] + u * v * tabela[i + 1, j + 1])
+
+def _superelevacao_maxima(e_max):
+    e_max = np.asarray(e_max, dtype=float)
+    if np.any((e_max < SUPERELEVACOES_MAXIMAS[0]) | (e_max > SUPERELEVACOES_MAXIMAS[-1])):
+        raise ValueError("A superelevação máxima deve estar entre 4% e 12%")
+    return e_max
+
+def raio_minimo(velocidade, e_max=0.08):
+    """
+    Raio mínimo de curva horizontal, R = V²/(127·(e_max + f_max))
+    
+    Consulta a RAIOS_MINIMOS com interpolação bilinear na velocidade e na
+    superelevação máxima (exata nos valores tabelados).
+    
+    Parameters:
+    -----------
+    velocidade : float or array
+        Velocidade de projeto (km/h)
+    e_max : float or array
+        Superelevação máxima (m/m)
+    
+    Returns:
+    --------
+    float or array : Raio mínimo (m)
+    """
+    return _interpolar_tabela(RAIOS_MINIMOS, TABELA_DNIT['velocidade'], SUPERELEVACOES_MAXIMAS,
+                              _velocidade(velocidade), _superelevacao_maxima(e_max))
+
+def raio_sem_superelevacao(velocidade):
+    """Raio acima do qual a superelevação é dispensada (m, tabela do DNIT)"""
+    return _consultar('raio_sem_superelevacao', velocidade)
+
+def superelevacao(raio, velocidade, e_max=0.08, abaulamento=0.02):
+    """
+    Superelevação de projeto pela distribuição do DNIT
+    
+    e = e_max·(2·Rmin/R - Rmin²/R²), limitada inferiormente pelo
+    abaulamento; acima do raio que dispensa superelevação a seção normal é
+    mantida (e = 0) e abaixo do raio mínimo adota-se e_max.
+    
+    Parameters:
+    -----------
+    raio : float or array
+        Raio da curva (m)
+    velocidade : float or array
+        Velocidade de projeto (km/h)
+    e_max : float or array
+        Superelevação máxima (m/m)
+    abaulamento : float
+        Declividade transversal da seção em tangente (m/m)
+    
+    Returns:
+    --------
+    float or array : Superelevação (m/m)
+    """
+    R = np.asarray(raio, dtype=float)
+    if np.any(R <= 0):
+        raise ValueError("O raio deve ser positivo")
+    e_max = _superelevacao_maxima(e_max)
+    R_min = raio_minimo(velocidade, e_max)
+    e = np.maximum(e_max * (2 * R_min / R - (R_min / R)**2), abaulamento)
+    e = np.where(R < R_min, e_max, e)
+    return np.where(R >= raio_sem_superelevacao(velocidade), 0.0, e)
+
+def distancia_visibilidade_parada(velocidade, rampa=0.0, tempo_reacao=2.5):
+    """
+    Distância de visibilidade de parada, D = V·t/3,6 + V²/(255·(f + i))
+    
+    A parcela de frenagem é consultada em DISTANCIAS_FRENAGEM (interpolação
+    bilinear na velocidade e no greide); a de percepção e reação é somada.
+    
+    Parameters:
+    -----------
+    velocidade : float or array
+        Velocidade de projeto (km/h)
+    rampa : float or array
+        Greide (m/m; positivo em aclive), entre -10% e +10%
+    tempo_reacao : float
+        Tempo de percepção e reação (s)
+    
+    Returns:
+    --------
+    float or array : Distância (m)
+    """
+    V = _velocidade(velocidade)
+    rampa = np.asarray(rampa, dtype=float)
+    if np.any((rampa < RAMPAS[0]) | (rampa > RAMPAS[-1])):
+        raise ValueError("Greide fora da tabela de frenagem (-10% a +10%)")
+    return V * tempo_reacao / 3.6 + _interpolar_tabela(DISTANCIAS_FRENAGEM, TABELA_DNIT['velocidade'], RAMPAS, V, rampa)
+
+def distancia_visibilidade_ultrapassagem(velocidade):
+    """Distância de visibilidade de ultrapassagem (m); NaN acima de 100 km/h"""
+    return _consultar('ultrapassagem', velocidade)
+
+def comprimento_minimo_transicao(raio, velocidade):
+    """
+    Comprimento mínimo da espiral de transição (m)
+    
+    Maior valor entre o critério dinâmico (variação da aceleração
+    centrípeta de 0,6 m/s³: L = 0,036·V³/R) e o de tempo (2 s de percurso).
+    """
+    V = np.asarray(velocidade, dtype=float)
+    return np.maximum(0.036 * V**3 / np.asarray(raio, dtype=float), V / 1.8)
+
+def verificar_curvas(raios, velocidade, e_max=0.08, comprimentos_espiral=None, abaulamento=0.02):
+    """
+    Verifica todas as curvas de um traçado em uma única chamada
+    
+    Parameters:
+    -----------
+    raios : array (n,)
+        Raios das curvas (m), por exemplo alinhamento['curvas']['raio']
+    velocidade : float or array (n,)
+        Velocidade de projeto (km/h), única ou por curva
+    e_max : float
+        Superelevação máxima (m/m)
+    comprimentos_espiral : array (n,), optional
+        Comprimento das espirais (m; 0 para curva circular simples)
+    abaulamento : float
+        Declividade transversal da seção em tangente (m/m)
+    
+    Returns:
+    --------
+    dict : {'raio_minimo', 'superelevacao', 'atende_raio',
+            'sem_superelevacao', 'comprimento_minimo_espiral',
+            'atende_espiral', 'distancia_parada'} por curva
+    """
+    R = np.atleast_1d(np.asarray(raios, dtype=float))
+    V = np.broadcast_to(np.asarray(velocidade, dtype=float), R.shape)
+    Ls = np.zeros_like(R) if comprimentos_espiral is None else np.broadcast_to(
+        np.asarray(comprimentos_espiral, dtype=float), R.shape)
+    
+    R_min = raio_minimo(V, e_max)
+    sem_superelevacao = R >= raio_sem_superelevacao(V)
+    L_min = comprimento_minimo_transicao(R, V)
+    return {
+        'raio_minimo': R_min,
+        'superelevacao': superelevacao(R, V, e_max, abaulamento),
+        'atende_raio': R >= R_min,
+        'sem_superelevacao': sem_superelevacao,
+        'comprimento_minimo_espiral': L_min,
+        'atende_espiral': sem_superelevacao | (Ls >= L_min),
+        'distancia_parada': distancia_visibilidade_parada(V)
+    }
@@ -0,0 +1,109 @@
+"""
+Propriedades de fluidos em função da temperatura
+"""
+
+from functools import lru_cache
+
+import numpy as np
+from scipy.interpolate import PchipInterpolator
+
+from utils.calculations import calcular_reynolds_array
+
+# Tabelas a 1 atm: temperatura (°C), densidade (kg/m³), viscosidade dinâmica (Pa.s)
+TABELAS_FLUIDOS = {
+    'agua': {
+        'nome': 'Água',
+        'temperatura': [0, 5, 10, 15, 20, 25, 30, 40, 50, 60, 70, 80, 90, 100],
+        'densidade': [999.8, 1000.0, 999.7, 999.1, 998.2, 997.0, 995.7, 992.2,
+                      988.0, 983.2, 977.8, 971.8, 965.3, 958.4],
+        'viscosidade': [1.792e-3, 1.519e-3, 1.307e-3, 1.138e-3, 1.002e-3, 0.890e-3,
+                        0.798e-3, 0.653e-3, 0.547e-3, 0.466e-3, 0.404e-3, 0.354e-3,
+                        0.315e-3, 0.282e-3]
+    },
+    'ar': {
+        'nome': 'Ar',
+        'temperatura': [-20, 0, 10, 20, 30, 40, 60, 80, 100],
+        'densidade': [1.395, 1.292, 1.246, 1.204, 1.164, 1.127, 1.059, 0.999, 0.946],
+        'viscosidade': [1.630e-5, 1.729e-5, 1.778e-5, 1.825e-5, 1.872e-5, 1.918e-5,
+                        2.008e-5, 2.096e-5, 2.181e-5]
+    },
+    'oleo': {
+        'nome': 'Óleo Lubrificante',
+        'temperatura': [0, 20, 40, 60, 80, 100],
+        'densidade': [899.0, 888.1, 876.0, 863.9, 852.0, 840.0],
+        'viscosidade': [3.814, 0.8374, 0.2177, 0.07399, 0.03232, 0.01718]
+    }
+}
+
+@lru_cache(maxsize=None)
+def _interpoladores(fluido):
+    """
+    Interpoladores (densidade, ln μ) de um fluido, construídos uma vez por processo
+    
+    A viscosidade varia de forma aproximadamente exponencial com a
+    temperatura, por isso é interpolada em escala logarítmica. PCHIP
+    preserva a monotonicidade das tabelas.
+    """
+    if fluido not in TABELAS_FLUIDOS:
+        raise ValueError(f"Fluido '{fluido}' não disponível")
+    
+    tabela = TABELAS_FLUIDOS[fluido]
+    T = np.asarray(tabela['temperatura'], dtype=float)
+    densidade = PchipInterpolator(T, np.asarray(tabela['densidade'], dtype=float), extrapolate=False)
+    log_viscosidade = PchipInterpolator(T, np.log(tabela['viscosidade']), extrapolate=False)
+    return densidade, log_viscosidade, (T[0], T[-1])
+
+def propriedades_fluido(temperatura, fluido='agua'):
+    """
+    Densidade e viscosidades de um fluido à temperatura informada
+    
+    Parameters:
+    -----------
+    temperatura : float or array
+        Temperatura (°C)
+    fluido : str
+        Chave em TABELAS_FLUIDOS ('agua', 'ar', 'oleo')
+    
+    Returns:
+    --------
+    dict : {'densidade': kg/m³, 'viscosidade': Pa.s, 'viscosidade_cinematica': m²/s}
+    """
+    densidade, log_viscosidade, (T_min, T_max) = _interpoladores(fluido)
+    
+    temperatura = np.asarray(temperatura, dtype=float)
+    if np.any((temperatura < T_min) | (temperatura > T_max)):
+        raise ValueError(f"Temperatura fora da faixa tabelada ({T_min:.0f} a {T_max:.0f} °C)")
+    
+    rho = densidade(temperatura)
+    mu = np.exp(log_viscosidade(temperatura))
+    
+    return {
+        'densidade': rho,
+        'viscosidade': mu,
+        'viscosidade_cinematica': mu / rho
+    }
+
+def calcular_reynolds_temperatura(velocidade, diametro, temperatura, fluido='agua'):
+    """
+    Número de Reynolds com propriedades obtidas da temperatura
+    
+    Parameters:
+    -----------
+    velocidade : float or array
+        Velocidade média (m/s)
+    diametro : float or array
+        Diâmetro característico (m)
+    temperatura : float or array
+        Temperatura do fluido (°C)
+    fluido : str
+        Chave em TABELAS_FLUIDOS
+    
+    Returns:
+    --------
+    Re : array
+        Número de Reynolds
+    codigo : array of int8
+        Código de regime (ver calcular_reynolds_array)
+    """
+    prop = propriedades_fluido(temperatura, fluido)
+    return calcular_reynolds_array(prop['densidade'], velocidade, diametro, prop['viscosidade'])
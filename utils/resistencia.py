@@ -0,0 +1,130 @@
+"""
+Resistência ao cisalhamento - ajuste da envoltória de Mohr-Coulomb
+Ensaios triaxiais e de cisalhamento direto, com intervalos de confiança
+por bootstrap
+"""
+
+import numpy as np
+
+def _regressao_bootstrap(x, y, n_bootstrap, semente):
+    """
+    Regressão linear y = a + b·x nos dados e em n_bootstrap reamostragens
+    
+    Todas as reamostragens são sorteadas de uma vez como um array de
+    índices (n_bootstrap × n) e as retas são obtidas pelas fórmulas
+    fechadas de mínimos quadrados ao longo do eixo das amostras.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.size < 2:
+        raise ValueError("São necessários ao menos dois ensaios")
+    
+    def ajustar(xs, ys):
+        x_medio = xs.mean(axis=-1, keepdims=True)
+        y_medio = ys.mean(axis=-1, keepdims=True)
+        sxx = ((xs - x_medio)**2).sum(axis=-1)
+        sxy = ((xs - x_medio) * (ys - y_medio)).sum(axis=-1)
+        b = np.where(sxx > 0, sxy / np.where(sxx > 0, sxx, 1.0), np.nan)
+        a = y_medio[..., 0] - b * x_medio[..., 0]
+        return a, b
+    
+    a, b = ajustar(x, y)
+    if not np.isfinite(b):
+        raise ValueError("Os ensaios devem ter tensões de confinamento diferentes")
+    
+    residuo = y - (a + b * x)
+    total = ((y - y.mean())**2).sum()
+    R2 = 1 - (residuo**2).sum() / total if total > 0 else 1.0
+    
+    rng = np.random.default_rng(semente)
+    indices = rng.integers(0, x.size, size=(n_bootstrap, x.size))
+    a_boot, b_boot = ajustar(x[indices], y[indices])
+    
+    return a, b, R2, a_boot, b_boot
+
+def _intervalo(amostras, nivel_confianca):
+    """Intervalo percentil das reamostragens válidas"""
+    alfa = (1 - nivel_confianca) / 2
+    return tuple(float(v) for v in np.nanquantile(amostras, [alfa, 1 - alfa]))
+
+def ajustar_mohr_coulomb(sigma3, sigma1, n_bootstrap=2000, nivel_confianca=0.95, semente=None):
+    """
+    Ajuste de c e φ a partir de ensaios triaxiais na ruptura
+    
+    A envoltória tangente aos círculos de Mohr corresponde à reta Kf no
+    diagrama p-q (p = (σ1 + σ3)/2, q = (σ1 - σ3)/2): q = a + p·tanα, com
+    sinφ = tanα e c = a/cosφ. A reta é ajustada por mínimos quadrados.
+    
+    Parameters:
+    -----------
+    sigma3, sigma1 : array
+        Tensões principais menor e maior na ruptura (kPa)
+    n_bootstrap : int
+        Número de reamostragens para os intervalos de confiança
+    nivel_confianca : float
+        Nível de confiança dos intervalos (0 a 1)
+    semente : int, optional
+        Semente do gerador aleatório
+    
+    Returns:
+    --------
+    dict : {'c', 'phi' (graus), 'R2', 'ic_c', 'ic_phi', 'c_bootstrap',
+            'phi_bootstrap', 'p', 'q'}
+    """
+    sigma3 = np.asarray(sigma3, dtype=float)
+    sigma1 = np.asarray(sigma1, dtype=float)
+    if np.any(sigma1 < sigma3):
+        raise ValueError("σ1 deve ser maior ou igual a σ3 em todos os ensaios")
+    
+    p = (sigma1 + sigma3) / 2
+    q = (sigma1 - sigma3) / 2
+    a, tan_alfa, R2, a_boot, tan_boot = _regressao_bootstrap(p, q, n_bootstrap, semente)
+    
+    def converter(a, tan_alfa):
+        phi = np.arcsin(np.clip(tan_alfa, 0.0, 0.999))
+        return a / np.cos(phi), np.degrees(phi)
+    
+    c, phi = converter(a, tan_alfa)
+    c_boot, phi_boot = converter(a_boot, tan_boot)
+    
+    return {
+        'c': float(c),
+        'phi': float(phi),
+        'R2': float(R2),
+        'ic_c': _intervalo(c_boot, nivel_confianca),
+        'ic_phi': _intervalo(phi_boot, nivel_confianca),
+        'c_bootstrap': c_boot,
+        'phi_bootstrap': phi_boot,
+        'p': p,
+        'q': q
+    }
+
+def ajustar_cisalhamento_direto(sigma_n, tau, n_bootstrap=2000, nivel_confianca=0.95, semente=None):
+    """
+    Ajuste de c e φ a partir de ensaios de cisalhamento direto (τ = c + σn·tanφ)
+    
+    Parameters:
+    -----------
+    sigma_n : array
+        Tensão normal no plano de ruptura (kPa)
+    tau : array
+        Tensão cisalhante na ruptura (kPa)
+    n_bootstrap, nivel_confianca, semente
+        Ver ajustar_mohr_coulomb
+    
+    Returns:
+    --------
+    dict : {'c', 'phi' (graus), 'R2', 'ic_c', 'ic_phi', 'c_bootstrap', 'phi_bootstrap'}
+    """
+    c, tan_phi, R2, c_boot, tan_boot = _regressao_bootstrap(sigma_n, tau, n_bootstrap, semente)
+    phi_boot = np.degrees(np.arctan(np.maximum(tan_boot, 0.0)))
+    
+    return {
+        'c': float(c),
+        'phi': float(np.degrees(np.arctan(max(tan_phi, 0.0)))),
+        'R2': float(R2),
+        'ic_c': _intervalo(c_boot, nivel_confianca),
+        'ic_phi': _intervalo(phi_boot, nivel_confianca),
+        'c_bootstrap': c_boot,
+        'phi_bootstrap': phi_boot
+    }
@@ -0,0 +1,201 @@
+"""
+Caracterização de solos - Sistema Unificado de Classificação (SUCS)
+Classificação vetorizada para lotes de amostras de laboratório
+"""
+
+import numpy as np
+
+SIMBOLOS_SUCS = np.array([
+    "GW", "GP", "GM", "GC", "GC-GM", "GW-GM", "GW-GC", "GP-GM", "GP-GC",
+    "SW", "SP", "SM", "SC", "SC-SM", "SW-SM", "SW-SC", "SP-SM", "SP-SC",
+    "ML", "CL", "CL-ML", "MH", "CH"
+])
+
+DESCRICOES_SUCS = {
+    "GW": "Pedregulho bem graduado",
+    "GP": "Pedregulho mal graduado",
+    "GM": "Pedregulho com finos siltosos",
+    "GC": "Pedregulho com finos argilosos",
+    "GC-GM": "Pedregulho com finos silto-argilosos",
+    "GW-GM": "Pedregulho bem graduado com silte",
+    "GW-GC": "Pedregulho bem graduado com argila",
+    "GP-GM": "Pedregulho mal graduado com silte",
+    "GP-GC": "Pedregulho mal graduado com argila",
+    "SW": "Areia bem graduada",
+    "SP": "Areia mal graduada",
+    "SM": "Areia com finos siltosos",
+    "SC": "Areia com finos argilosos",
+    "SC-SM": "Areia com finos silto-argilosos",
+    "SW-SM": "Areia bem graduada com silte",
+    "SW-SC": "Areia bem graduada com argila",
+    "SP-SM": "Areia mal graduada com silte",
+    "SP-SC": "Areia mal graduada com argila",
+    "ML": "Silte de baixa plasticidade",
+    "CL": "Argila de baixa plasticidade",
+    "CL-ML": "Argila siltosa de baixa plasticidade",
+    "MH": "Silte de alta plasticidade",
+    "CH": "Argila de alta plasticidade"
+}
+
+# Solos grossos: categoria → posição do símbolo do pedregulho em SIMBOLOS_SUCS
+# (o símbolo da areia correspondente está 9 posições adiante)
+_W, _P, _M, _C, _CM, _WM, _WC, _PM, _PC = range(9)
+_DESLOCAMENTO_AREIA = 9
+_ML, _CL, _CLML, _MH, _CH = range(18, 23)
+
+def classificar_sucs(LL, LP, p200, p4, Cu=None, Cc=None):
+    """
+    Classificação SUCS (ASTM D2487) de várias amostras
+    
+    Solos orgânicos (OL, OH, Pt) não são identificados, pois exigem ensaios
+    adicionais. Limites ausentes (NaN) são tratados como solo não plástico;
+    P200 ou P4 ausentes tornam a classificação indeterminada.
+    
+    Parameters:
+    -----------
+    LL, LP : float or array
+        Limites de liquidez e de plasticidade (%)
+    p200, p4 : float or array
+        Percentual passando nas peneiras #200 e #4 (%)
+    Cu, Cc : float or array, optional
+        Coeficientes de uniformidade e de curvatura. Necessários para solos
+        grossos com menos de 12% de finos
+    
+    Returns:
+    --------
+    dict : {'codigo': índice em SIMBOLOS_SUCS (-1 = graduação ou frações desconhecidas),
+            'simbolo', 'IP', 'linha_A'}
+    """
+    LL = np.nan_to_num(np.asarray(LL, dtype=float))
+    LP = np.nan_to_num(np.asarray(LP, dtype=float))
+    p200 = np.asarray(p200, dtype=float)
+    p4 = np.asarray(p4, dtype=float)
+    Cu = np.full(np.shape(p200), np.nan) if Cu is None else np.asarray(Cu, dtype=float)
+    Cc = np.full(np.shape(p200), np.nan) if Cc is None else np.asarray(Cc, dtype=float)
+    LL, LP, p200, p4, Cu, Cc = np.broadcast_arrays(LL, LP, p200, p4, Cu, Cc)
+    
+    IP = np.maximum(LL - LP, 0.0)
+    linha_A = 0.73 * (LL - 20)
+    acima_A = IP >= linha_A
+    
+    # Fração fina pela carta de plasticidade
+    finos = np.select(
+        [LL >= 50, acima_A & (IP > 7), acima_A & (IP >= 4)],
+        [np.where(acima_A, _CH, _MH), _CL, _CLML],
+        default=_ML
+    )
+    
+    # Fração grossa: pedregulho se a fração retida na #4 supera a de areia
+    pedregulho = (100 - p4) > (p4 - p200)
+    cu_minimo = np.where(pedregulho, 4.0, 6.0)
+    com_graduacao = np.isfinite(Cu) & np.isfinite(Cc)
+    bem_graduado = (Cu >= cu_minimo) & (Cc >= 1) & (Cc <= 3)
+    argiloso = (finos == _CL) | (finos == _CH)
+    
+    categoria = np.select(
+        [p200 < 5, p200 <= 12, finos == _CLML],
+        [np.where(bem_graduado, _W, _P),
+         np.where(bem_graduado, np.where(argiloso | (finos == _CLML), _WC, _WM),
+                  np.where(argiloso | (finos == _CLML), _PC, _PM)),
+         _CM],
+        default=np.where(argiloso, _C, _M)
+    )
+    grosso = categoria + np.where(pedregulho, 0, _DESLOCAMENTO_AREIA)
+    precisa_graduacao = p200 <= 12
+    grosso = np.where(precisa_graduacao & ~com_graduacao, -1, grosso)
+    
+    codigo = np.where(p200 >= 50, finos, grosso)
+    codigo = np.where(np.isfinite(p200) & np.isfinite(p4), codigo, -1).astype(np.int8)
+    
+    return {
+        'codigo': codigo,
+        'simbolo': rotulos_sucs(codigo),
+        'IP': IP,
+        'linha_A': linha_A
+    }
+
+def rotulos_sucs(codigo):
+    """Converte códigos de classificar_sucs em símbolos ('?' para indeterminado)"""
+    codigo = np.asarray(codigo)
+    return np.where(codigo >= 0, SIMBOLOS_SUCS[np.maximum(codigo, 0)], "?")
+
+# Aberturas das peneiras #4 e #200 (mm)
+ABERTURA_P4 = 4.75
+ABERTURA_P200 = 0.075
+
+def _interpolar_log(log_abertura, passante, log_alvo):
+    """
+    Percentual passante em aberturas alvo (interpolação linear em log da abertura)
+    
+    Fora da faixa ensaiada o resultado é NaN, exceto quando ele é conhecido:
+    100% acima de uma peneira com 100% passante e 0% abaixo de uma com 0%.
+    """
+    i = np.clip(np.searchsorted(log_abertura, log_alvo) - 1, 0, log_abertura.size - 2)
+    w = (log_alvo - log_abertura[i]) / (log_abertura[i + 1] - log_abertura[i])
+    valor = passante[:, i] * (1 - w) + passante[:, i + 1] * w
+    valor = np.where(log_alvo > log_abertura[-1], np.where(passante[:, -1:] >= 100, 100.0, np.nan), valor)
+    return np.where(log_alvo < log_abertura[0], np.where(passante[:, :1] <= 0, 0.0, np.nan), valor)
+
+def processar_granulometria(aberturas, passante, percentuais=(10, 30, 60)):
+    """
+    Diâmetros característicos, Cu e Cc de várias curvas granulométricas
+    
+    As curvas são tornadas monótonas (percentual passante não decrescente
+    com a abertura) e interpoladas linearmente em log da abertura, o que
+    preserva a monotonicidade. Diâmetros fora da faixa ensaiada (p. ex.
+    D10 de um solo com mais de 10% passando na menor peneira) resultam NaN,
+    assim como P4 e P200 quando as peneiras não alcançam 4,75 e 0,075 mm.
+    
+    Parameters:
+    -----------
+    aberturas : array (n_peneiras,)
+        Abertura das peneiras (mm), em qualquer ordem
+    passante : array (n_amostras, n_peneiras)
+        Percentual passante acumulado (%)
+    percentuais : tuple
+        Percentuais dos diâmetros característicos; os três primeiros são
+        usados como D10, D30 e D60 no cálculo de Cu e Cc
+    
+    Returns:
+    --------
+    dict : {'D': array (n_amostras, n_percentuais) em mm, 'D10', 'D30', 'D60',
+            'Cu', 'Cc', 'P4', 'P200', 'aberturas', 'passante'}
+        'aberturas' e 'passante' são as curvas ordenadas e monótonas
+    """
+    aberturas = np.asarray(aberturas, dtype=float)
+    passante = np.atleast_2d(np.asarray(passante, dtype=float))
+    if np.any(aberturas <= 0):
+        raise ValueError("As aberturas das peneiras devem ser positivas")
+    if passante.shape[1] != aberturas.size or aberturas.size < 2:
+        raise ValueError("Informe ao menos duas peneiras e um percentual por peneira")
+    
+    ordem = np.argsort(aberturas)
+    aberturas = aberturas[ordem]
+    log_abertura = np.log(aberturas)
+    P = np.maximum.accumulate(np.clip(passante[:, ordem], 0, 100), axis=1)
+    
+    alvo = np.asarray(percentuais, dtype=float)
+    k = (P[:, :, None] < alvo[None, None, :]).sum(axis=1)
+    i0 = np.clip(k - 1, 0, aberturas.size - 2)
+    P0 = np.take_along_axis(P, i0, axis=1)
+    P1 = np.take_along_axis(P, i0 + 1, axis=1)
+    intervalo = P1 - P0
+    w = np.where(intervalo > 0, (alvo - P0) / np.where(intervalo > 0, intervalo, 1.0), 0.0)
+    D = np.exp(log_abertura[i0] + w * (log_abertura[i0 + 1] - log_abertura[i0]))
+    D = np.where((k < aberturas.size) & ((k > 0) | (P[:, :1] == alvo)), D, np.nan)
+    
+    D10, D30, D60 = D[:, 0], D[:, 1], D[:, 2]
+    passante_p4, passante_p200 = _interpolar_log(log_abertura, P, np.log([ABERTURA_P4, ABERTURA_P200])).T
+    
+    return {
+        'D': D,
+        'D10': D10,
+        'D30': D30,
+        'D60': D60,
+        'Cu': D60 / D10,
+        'Cc': D30**2 / (D10 * D60),
+        'P4': passante_p4,
+        'P200': passante_p200,
+        'aberturas': aberturas,
+        'passante': P
+    }
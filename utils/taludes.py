@@ -0,0 +1,231 @@
+"""
+Estabilidade de taludes - Método de Bishop simplificado
+Busca vetorizada de superfícies circulares críticas
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+def geometria_talude(altura, inclinacao, comprimento_crista=None, comprimento_pe=None):
+    """
+    Superfície do terreno de um talude simples (pé à esquerda, crista à direita)
+    
+    Parameters:
+    -----------
+    altura : float
+        Altura do talude (m)
+    inclinacao : float
+        Ângulo do talude com a horizontal (graus)
+    comprimento_crista, comprimento_pe : float, optional
+        Extensão horizontal do terreno além da crista e do pé (m).
+        Padrão: 2 × altura
+    
+    Returns:
+    --------
+    tuple : (x, y) vértices da superfície do terreno
+    """
+    extensao = 2 * altura
+    crista = extensao if comprimento_crista is None else comprimento_crista
+    pe = extensao if comprimento_pe is None else comprimento_pe
+    x_crista = altura / np.tan(np.radians(inclinacao))
+    
+    x = np.array([-pe, 0.0, x_crista, x_crista + crista])
+    y = np.array([0.0, 0.0, altura, altura])
+    return x, y
+
+def fator_seguranca_bishop(xc, yc, R, superficie_x, superficie_y, c, phi, gamma,
+                           ru=0.0, n_fatias=40, tol=1e-4, max_iter=50, m_alpha_min=0.2):
+    """
+    Fator de segurança de Bishop simplificado para vários círculos
+    
+    As fatias de todos os círculos formam um array (círculos × fatias) e a
+    iteração de ponto fixo FS = Σ[c·b + W(1 - ru)·tanφ]/mα / ΣW·sinα é feita
+    para todos os círculos simultaneamente, partindo do FS de Fellenius.
+    
+    Parameters:
+    -----------
+    xc, yc, R : array
+        Centros e raios dos círculos de ruptura (m)
+    superficie_x, superficie_y : array
+        Vértices da superfície do terreno, x crescente (m)
+    c : float
+        Coesão efetiva (kPa)
+    phi : float
+        Ângulo de atrito efetivo (graus)
+    gamma : float
+        Peso específico (kN/m³)
+    ru : float
+        Coeficiente de poropressão u / (γ·h)
+    n_fatias : int
+        Número de fatias por círculo
+    tol : float
+        Tolerância na variação do FS
+    max_iter : int
+        Número máximo de iterações
+    m_alpha_min : float
+        Limite inferior de mα (evita instabilidade numérica em α negativos)
+    
+    Returns:
+    --------
+    dict : {'FS', 'FS_fellenius', 'valido', 'iteracoes'}
+    """
+    xc = np.atleast_1d(np.asarray(xc, dtype=float))[:, None]
+    yc = np.atleast_1d(np.asarray(yc, dtype=float))[:, None]
+    R = np.atleast_1d(np.asarray(R, dtype=float))[:, None]
+    superficie_x = np.asarray(superficie_x, dtype=float)
+    superficie_y = np.asarray(superficie_y, dtype=float)
+    
+    # Trecho do círculo dentro do modelo do terreno
+    xa = np.maximum(xc - R, superficie_x[0])
+    xb = np.minimum(xc + R, superficie_x[-1])
+    
+    def arco_inferior(x):
+        return yc - np.sqrt(np.maximum(R**2 - (x - xc)**2, 0.0))
+    
+    # O círculo deve entrar e sair pela superfície, não pelos limites do modelo
+    folga = 1e-6 * R
+    valido = ((arco_inferior(xa) >= np.interp(xa, superficie_x, superficie_y) - folga)
+              & (arco_inferior(xb) >= np.interp(xb, superficie_x, superficie_y) - folga)
+              & (xb > xa))
+    
+    # Pontos de entrada e saída: amostragem grosseira seguida de bisseção
+    def altura_massa(x):
+        return np.interp(x, superficie_x, superficie_y) - arco_inferior(x)
+    
+    n_amostras = 2 * n_fatias
+    amostras = xa + (xb - xa) * np.linspace(0, 1, n_amostras + 1)[None, :]
+    dentro = altura_massa(amostras) > 0
+    valido &= dentro.any(axis=1, keepdims=True)
+    i_ent = np.argmax(dentro, axis=1)[:, None]
+    i_sai = n_amostras - np.argmax(dentro[:, ::-1], axis=1)[:, None]
+    
+    linhas = np.arange(amostras.shape[0])[:, None]
+    ent_lo = amostras[linhas, np.maximum(i_ent - 1, 0)]
+    ent_hi = amostras[linhas, i_ent]
+    sai_lo = amostras[linhas, i_sai]
+    sai_hi = amostras[linhas, np.minimum(i_sai + 1, n_amostras)]
+    for _ in range(30):
+        meio = 0.5 * (ent_lo + ent_hi)
+        fora = altura_massa(meio) <= 0
+        ent_lo = np.where(fora, meio, ent_lo)
+        ent_hi = np.where(fora, ent_hi, meio)
+        meio = 0.5 * (sai_lo + sai_hi)
+        fora = altura_massa(meio) <= 0
+        sai_hi = np.where(fora, meio, sai_hi)
+        sai_lo = np.where(fora, sai_lo, meio)
+    xa, xb = ent_lo, sai_hi
+    
+    b = (xb - xa) / n_fatias
+    x = xa + b * (np.arange(n_fatias) + 0.5)[None, :]
+    y_base = arco_inferior(x)
+    h = np.maximum(np.interp(x, superficie_x, superficie_y) - y_base, 0.0)
+    
+    sin_a = np.clip((x - xc) / R, -1.0, 1.0)
+    cos_a = np.sqrt(1 - sin_a**2)
+    W = gamma * b * h
+    
+    # Sentido do escorregamento: momento instabilizante sempre positivo
+    momento = (W * sin_a).sum(axis=1, keepdims=True)
+    sentido = np.where(momento < 0, -1.0, 1.0)
+    sin_a = sin_a * sentido
+    momento = np.abs(momento[:, 0])
+    valido &= (momento > 0)[:, None]
+    valido = valido[:, 0]
+    
+    tan_phi = np.tan(np.radians(phi))
+    na_massa = h > 0
+    resistencia = np.where(na_massa, c * b + W * (1 - ru) * tan_phi, 0.0)
+    momento_seguro = np.where(valido, momento, 1.0)
+    
+    # Fellenius (ordinário) como estimativa inicial: N' = W·cosα - u·l, com u·l = ru·W/cosα
+    comprimento_base = b / np.maximum(cos_a, 1e-6)
+    normal_efetiva = np.maximum(W * cos_a - ru * W / np.maximum(cos_a, 1e-6), 0.0)
+    fellenius = np.where(na_massa, c * comprimento_base + normal_efetiva * tan_phi, 0.0)
+    FS_fellenius = fellenius.sum(axis=1) / momento_seguro
+    
+    FS = FS_fellenius.copy()
+    iteracoes = 0
+    for iteracoes in range(1, max_iter + 1):
+        FS_seguro = np.where(valido & (FS > 0), FS, 1.0)
+        m_alpha = np.maximum(cos_a + sin_a * tan_phi / FS_seguro[:, None], m_alpha_min)
+        FS_novo = (resistencia / m_alpha).sum(axis=1) / momento_seguro
+        convergiu = np.max(np.abs(FS_novo - FS)[valido], initial=0.0) < tol
+        FS = FS_novo
+        if convergiu:
+            break
+    
+    FS = np.where(valido, FS, np.inf)
+    FS_fellenius = np.where(valido, FS_fellenius, np.inf)
+    
+    return {
+        'FS': FS,
+        'FS_fellenius': FS_fellenius,
+        'valido': valido,
+        'iteracoes': iteracoes
+    }
+
+def _bloco_bishop(argumentos):
+    """Avalia um bloco de círculos (função de topo para o pool de processos)"""
+    xc, yc, R, superficie_x, superficie_y, c, phi, gamma, ru, n_fatias = argumentos
+    return fator_seguranca_bishop(xc, yc, R, superficie_x, superficie_y, c, phi, gamma,
+                                  ru=ru, n_fatias=n_fatias)['FS']
+
+def buscar_circulo_critico(superficie_x, superficie_y, c, phi, gamma, centros_x, centros_y, raios,
+                           ru=0.0, n_fatias=40, tamanho_bloco=20000, processos=None):
+    """
+    Busca do círculo crítico em uma grade de centros × raios
+    
+    A grade é dividida em blocos de até tamanho_bloco círculos (limitando a
+    memória do array círculos × fatias). Havendo mais de um bloco, eles são
+    distribuídos em um pool de processos.
+    
+    Parameters:
+    -----------
+    superficie_x, superficie_y : array
+        Vértices da superfície do terreno (m)
+    c, phi, gamma, ru : float
+        Parâmetros do solo (ver fator_seguranca_bishop)
+    centros_x, centros_y : array
+        Coordenadas da grade de centros (m)
+    raios : array
+        Raios avaliados para cada centro (m)
+    n_fatias : int
+        Número de fatias por círculo
+    tamanho_bloco : int
+        Máximo de círculos por bloco
+    processos : int, optional
+        Número de processos. Padrão: número de CPUs; 1 desativa o pool
+    
+    Returns:
+    --------
+    dict : {'FS': array (n_cx, n_cy, n_r), 'FS_min', 'xc', 'yc', 'R'}
+    """
+    centros_x = np.asarray(centros_x, dtype=float)
+    centros_y = np.asarray(centros_y, dtype=float)
+    raios = np.asarray(raios, dtype=float)
+    XC, YC, RR = np.meshgrid(centros_x, centros_y, raios, indexing='ij')
+    xc, yc, R = XC.ravel(), YC.ravel(), RR.ravel()
+    
+    inicios = range(0, xc.size, tamanho_bloco)
+    blocos = [(xc[i:i + tamanho_bloco], yc[i:i + tamanho_bloco], R[i:i + tamanho_bloco],
+               superficie_x, superficie_y, c, phi, gamma, ru, n_fatias) for i in inicios]
+    
+    processos = (os.cpu_count() or 1) if processos is None else processos
+    if len(blocos) > 1 and processos > 1:
+        with ProcessPoolExecutor(max_workers=min(processos, len(blocos))) as pool:
+            resultados = list(pool.map(_bloco_bishop, blocos))
+    else:
+        resultados = [_bloco_bishop(bloco) for bloco in blocos]
+    
+    FS = np.concatenate(resultados)
+    i_min = int(np.argmin(FS))
+    
+    return {
+        'FS': FS.reshape(XC.shape),
+        'FS_min': FS[i_min],
+        'xc': xc[i_min],
+        'yc': yc[i_min],
+        'R': R[i_min]
+    }
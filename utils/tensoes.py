@@ -0,0 +1,181 @@
+"""
+Acréscimo de tensão vertical no solo (Boussinesq / Newmark)
+Cargas pontuais, faixas, retângulos e círculos uniformemente carregados
+"""
+
+import numpy as np
+
+# np.trapezoid existe a partir do NumPy 2.0; versões anteriores só têm np.trapz
+_trapezio = getattr(np, 'trapezoid', None) or np.trapz
+
+def tensao_carga_pontual(P, xp, yp, x, y, z):
+    """
+    Δσz sob carga pontual (Boussinesq)
+    
+    Parameters:
+    -----------
+    P : float or array
+        Carga (kN)
+    xp, yp : float or array
+        Posição da carga (m)
+    x, y, z : float or array
+        Pontos de cálculo (m, z > 0 para baixo)
+    
+    Returns:
+    --------
+    array : Δσz (kPa)
+    """
+    r2 = (x - xp)**2 + (y - yp)**2
+    R = np.sqrt(r2 + z**2)
+    return 3 * P * z**3 / (2 * np.pi * R**5)
+
+def tensao_faixa(q, x1, x2, x, z):
+    """
+    Δσz sob carga em faixa infinita de x1 a x2 (estado plano)
+    
+    Δσz = q/π · [β + sinβ·cosβ] entre β(x2) e β(x1), β = arctan((x - xi)/z)
+    """
+    b1 = np.arctan2(x - x1, z)
+    b2 = np.arctan2(x - x2, z)
+    return q / np.pi * ((b1 - b2) + np.sin(b1) * np.cos(b1) - np.sin(b2) * np.cos(b2))
+
+def _fator_newmark(a, b, z2):
+    """Fator de influência sob o canto de um retângulo a × b, com o sinal de a·b"""
+    m2 = a * a / z2
+    n2 = b * b / z2
+    mn = a * b / z2
+    soma = m2 + n2 + 1
+    produto = mn * mn
+    raiz = np.sqrt(soma)
+    termo1 = 2 * mn * raiz / (soma + produto) * (soma + 1) / soma
+    # arctan2 escolhe o ramo correto quando m²n² > m² + n² + 1
+    termo2 = np.sign(mn) * np.arctan2(2 * np.abs(mn) * raiz, soma - produto)
+    return (termo1 + termo2) / (4 * np.pi)
+
+def tensao_retangular(q, x1, x2, y1, y2, x, y, z):
+    """
+    Δσz sob retângulo [x1, x2] × [y1, y2] uniformemente carregado (Newmark)
+    
+    Pontos fora da projeção do retângulo são tratados pela superposição
+    com sinal dos quatro retângulos de canto.
+    
+    Returns:
+    --------
+    array : Δσz (kPa)
+    """
+    z2 = z * z
+    a1, a2 = x1 - x, x2 - x
+    b1, b2 = y1 - y, y2 - y
+    return q * (_fator_newmark(a2, b2, z2) - _fator_newmark(a1, b2, z2)
+                - _fator_newmark(a2, b1, z2) + _fator_newmark(a1, b1, z2))
+
+def _pontos_integracao_circulo(n_radial, n_angular):
+    """Pontos (ρ/a, φ) e pesos de área para um círculo de raio unitário"""
+    gx, gw = np.polynomial.legendre.leggauss(n_radial)
+    rho = 0.5 * (gx + 1)
+    phi = 2 * np.pi * (np.arange(n_angular) + 0.5) / n_angular
+    peso = (0.5 * gw * rho)[:, None] * np.full(n_angular, 2 * np.pi / n_angular)
+    rho = np.broadcast_to(rho[:, None], peso.shape)
+    return (rho * np.cos(phi)).ravel(), (rho * np.sin(phi)).ravel(), peso.ravel()
+
+def _circulos_em_cargas_pontuais(circulos, n_radial=12, n_angular=24):
+    """Converte linhas [q, xc, yc, a] em linhas [P, x, y] de cargas pontuais equivalentes"""
+    circulos = np.atleast_2d(np.asarray(circulos, dtype=float))
+    q, xc, yc, a = (circulos[:, i:i + 1] for i in range(4))
+    u, v, peso = _pontos_integracao_circulo(n_radial, n_angular)
+    P = q * a**2 * peso
+    return np.column_stack([P.ravel(), (xc + a * u).ravel(), (yc + a * v).ravel()])
+
+def tensao_circular(q, xc, yc, raio, x, y, z, n_radial=12, n_angular=24):
+    """
+    Δσz sob área circular uniformemente carregada
+    
+    Integração numérica de Boussinesq em coordenadas polares (Gauss-Legendre
+    no raio, ponto médio no ângulo). Abaixo do centro o resultado coincide
+    com a solução fechada q·[1 - (1 + (a/z)²)^(-3/2)] para z ≳ 0.1·a.
+    
+    Returns:
+    --------
+    array : Δσz (kPa)
+    """
+    cargas = _circulos_em_cargas_pontuais([[q, xc, yc, raio]], n_radial, n_angular)
+    return superpor_tensoes(x, y, z, pontuais=cargas)
+
+def superpor_tensoes(x, y, z, retangulos=None, pontuais=None, circulos=None, faixas=None,
+                     elementos_por_bloco=200_000):
+    """
+    Δσz total de um conjunto de cargas em uma grade de pontos
+    
+    A superposição é feita por broadcast (pontos × cargas) em blocos de
+    pontos, de modo que o array intermediário nunca ultrapassa
+    elementos_por_bloco posições. Círculos são convertidos em cargas
+    pontuais equivalentes (ver tensao_circular).
+    
+    Parameters:
+    -----------
+    x, y, z : array
+        Pontos de cálculo (qualquer forma compatível por broadcast; m)
+    retangulos : array (n, 5), optional
+        Linhas [q, x1, x2, y1, y2]
+    pontuais : array (n, 3), optional
+        Linhas [P, x, y]
+    circulos : array (n, 4), optional
+        Linhas [q, xc, yc, raio]
+    faixas : array (n, 3), optional
+        Linhas [q, x1, x2] de faixas infinitas na direção y
+    elementos_por_bloco : int
+        Limite de tamanho do array intermediário
+    
+    Returns:
+    --------
+    array : Δσz (kPa) com a forma dos pontos
+    """
+    x, y, z = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (x, y, z)))
+    forma = x.shape
+    x, y, z = x.ravel(), y.ravel(), z.ravel()
+    if np.any(z <= 0):
+        raise ValueError("Os pontos de cálculo devem estar abaixo da superfície (z > 0)")
+    
+    if circulos is not None and len(circulos):
+        equivalentes = _circulos_em_cargas_pontuais(circulos)
+        pontuais = equivalentes if pontuais is None or not len(pontuais) else np.vstack(
+            [np.asarray(pontuais, dtype=float), equivalentes])
+    
+    grupos = []
+    if retangulos is not None and len(retangulos):
+        r = np.atleast_2d(np.asarray(retangulos, dtype=float)).T
+        grupos.append((r, lambda r, xs, ys, zs: tensao_retangular(*r, xs, ys, zs)))
+    if pontuais is not None and len(pontuais):
+        p = np.atleast_2d(np.asarray(pontuais, dtype=float)).T
+        grupos.append((p, lambda p, xs, ys, zs: tensao_carga_pontual(*p, xs, ys, zs)))
+    if faixas is not None and len(faixas):
+        f = np.atleast_2d(np.asarray(faixas, dtype=float)).T
+        grupos.append((f, lambda f, xs, ys, zs: tensao_faixa(*f, xs, zs)))
+    
+    total = np.zeros(x.size)
+    for parametros, funcao in grupos:
+        bloco = max(1, elementos_por_bloco // parametros.shape[1])
+        for i in range(0, x.size, bloco):
+            s = slice(i, i + bloco)
+            total[s] += funcao(parametros, x[s, None], y[s, None], z[s, None]).sum(axis=1)
+    
+    return total.reshape(forma)
+
+def recalque_edometrico(delta_sigma, z, mv):
+    """
+    Recalque por integração de mv·Δσz ao longo da profundidade
+    
+    Parameters:
+    -----------
+    delta_sigma : array (..., n_z)
+        Acréscimo de tensão; a profundidade é o último eixo (kPa)
+    z : array (n_z,)
+        Profundidades (m)
+    mv : float or array (n_z,)
+        Coeficiente de variação volumétrica (1/kPa)
+    
+    Returns:
+    --------
+    array : Recalque (m)
+    """
+    return _trapezio(np.asarray(mv) * delta_sigma, z, axis=-1)
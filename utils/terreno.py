@@ -0,0 +1,427 @@
+"""
+Modelo digital do terreno - malha triangular irregular (TIN)
+Leitura de nuvens de pontos XYZ por arquivos mapeados em memória,
+triangulação de Delaunay e volumes de corte e aterro por prismas, com
+processamento em blocos (tiles) para nuvens muito grandes
+"""
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import Delaunay, QhullError
+from scipy.interpolate import LinearNDInterpolator
+
+def converter_xyz(caminho_texto, caminho_npy, separador=None, linhas_cabecalho=0, linhas_por_bloco=1_000_000):
+    """
+    Converte um arquivo texto XYZ em .npy sem carregá-lo inteiro na memória
+    
+    O arquivo é lido em blocos (pandas, chunksize) e gravado num array
+    (n, 3) aberto com np.lib.format.open_memmap. Ler o texto duas vezes
+    (contagem de linhas e conversão) mantém a memória limitada ao bloco.
+    
+    Parameters:
+    -----------
+    caminho_texto : str
+        Arquivo com colunas X, Y, Z (colunas adicionais são ignoradas)
+    caminho_npy : str
+        Arquivo .npy de saída
+    separador : str, optional
+        Separador das colunas (padrão: espaços ou tabulações)
+    linhas_cabecalho : int
+        Linhas a ignorar no início do arquivo
+    linhas_por_bloco : int
+        Linhas lidas por vez
+    
+    Returns:
+    --------
+    np.memmap (n, 3) : Pontos gravados (somente leitura)
+    """
+    opcoes = dict(sep=separador if separador else r'\s+', header=None, skiprows=linhas_cabecalho,
+                  usecols=[0, 1, 2], dtype=float, chunksize=linhas_por_bloco)
+    n = sum(len(bloco) for bloco in pd.read_csv(caminho_texto, **opcoes))
+    if n == 0:
+        raise ValueError("Arquivo sem pontos")
+    
+    saida = np.lib.format.open_memmap(caminho_npy, mode='w+', dtype=np.float64, shape=(n, 3))
+    inicio = 0
+    for bloco in pd.read_csv(caminho_texto, **opcoes):
+        saida[inicio:inicio + len(bloco)] = bloco.to_numpy()
+        inicio += len(bloco)
+    saida.flush()
+    del saida
+    return carregar_pontos(caminho_npy)
+
+def carregar_pontos(caminho):
+    """
+    Abre uma nuvem de pontos mapeada em memória
+    
+    Aceita .npy (n, 3) ou binário bruto de float64 com X, Y, Z intercalados.
+    
+    Returns:
+    --------
+    np.memmap (n, 3) : Pontos (somente leitura)
+    """
+    if str(caminho).lower().endswith('.npy'):
+        pontos = np.load(caminho, mmap_mode='r')
+    else:
+        pontos = np.memmap(caminho, dtype=np.float64, mode='r').reshape(-1, 3)
+    if pontos.ndim != 2 or pontos.shape[1] < 3:
+        raise ValueError("A nuvem de pontos deve ter as colunas X, Y e Z")
+    return pontos
+
+def volumes_prismas(x, y, dz, triangulos):
+    """
+    Volumes de corte e aterro dos prismas triangulares
+    
+    dz (terreno - referência) é linear em cada triângulo; quando muda de
+    sinal dentro do triângulo, a parte positiva é integrada exatamente:
+    com um vértice positivo d1, V+ = Área·d1³/(3·(d1 - d2)·(d1 - d3)); com
+    um único vértice negativo, V+ = volume total + parte negativa.
+    
+    Parameters:
+    -----------
+    x, y, dz : array (n,)
+        Coordenadas dos vértices (m) e diferença de cotas (m)
+    triangulos : array (m, 3)
+        Índices dos vértices de cada triângulo
+    
+    Returns:
+    --------
+    dict : {'corte', 'aterro': volumes por triângulo (m³), 'area' (m²)}
+    """
+    i, j, k = triangulos.T
+    area = 0.5 * np.abs((x[j] - x[i]) * (y[k] - y[i]) - (x[k] - x[i]) * (y[j] - y[i]))
+    d = np.sort(np.stack([dz[i], dz[j], dz[k]], axis=1), axis=1)
+    d1, d2, d3 = d[:, 2], d[:, 1], d[:, 0]
+    
+    def positivo(d1, d2, d3):
+        """Parte positiva de dz com d1 ≥ d2 ≥ d3"""
+        total = area * (d1 + d2 + d3) / 3
+        # Denominadores protegidos pelos mesmos predicados dos ramos (não nulos neles)
+        ramo_positivo = (d1 > 0) & (d2 <= 0)
+        ramo_negativo = (d2 > 0) & (d3 < 0)
+        um_positivo = area * d1**3 / (3 * np.where(ramo_positivo, (d1 - d2) * (d1 - d3), 1.0))
+        um_negativo = total + area * (-d3)**3 / (3 * np.where(ramo_negativo, (d1 - d3) * (d2 - d3), 1.0))
+        return np.select([d3 >= 0, d1 <= 0, ramo_positivo], [total, 0.0, um_positivo], um_negativo)
+    
+    corte = positivo(d1, d2, d3)
+    aterro = positivo(-d3, -d2, -d1)
+    return {'corte': corte, 'aterro': aterro, 'area': area}
+
+def _grade_tiles(pontos, pontos_por_tile, linhas_por_bloco):
+    """Extensão da nuvem e divisão em tiles com cerca de pontos_por_tile pontos"""
+    minimo = np.full(2, np.inf)
+    maximo = np.full(2, -np.inf)
+    for inicio in range(0, pontos.shape[0], linhas_por_bloco):
+        bloco = np.asarray(pontos[inicio:inicio + linhas_por_bloco, :2])
+        minimo = np.minimum(minimo, bloco.min(axis=0))
+        maximo = np.maximum(maximo, bloco.max(axis=0))
+    
+    extensao = np.maximum(maximo - minimo, 1e-9)
+    n_tiles = max(1, int(np.ceil(pontos.shape[0] / pontos_por_tile)))
+    nx = max(1, int(round(np.sqrt(n_tiles * extensao[0] / extensao[1]))))
+    ny = max(1, int(np.ceil(n_tiles / nx)))
+    espacamento = np.sqrt(extensao[0] * extensao[1] / pontos.shape[0])
+    return minimo, extensao / np.array([nx, ny]), nx, ny, espacamento
+
+def _pontos_tile(pontos, minimo, tamanho, ix, iy, margem, linhas_por_bloco):
+    """Pontos do tile (ix, iy) ampliado pela margem, lidos em blocos"""
+    inferior = minimo + tamanho * np.array([ix, iy]) - margem
+    superior = minimo + tamanho * np.array([ix + 1, iy + 1]) + margem
+    partes = []
+    for inicio in range(0, pontos.shape[0], linhas_por_bloco):
+        bloco = np.asarray(pontos[inicio:inicio + linhas_por_bloco, :3])
+        dentro = np.all((bloco[:, :2] >= inferior) & (bloco[:, :2] <= superior), axis=1)
+        partes.append(bloco[dentro])
+    return np.concatenate(partes) if partes else np.zeros((0, 3))
+
+def _triangulos_nucleo(x, y, triangulos, minimo, tamanho, ix, iy, nx, ny, aresta_maxima):
+    """Triângulos com centroide no núcleo do tile (cada triângulo contado uma vez)"""
+    cx = x[triangulos].mean(axis=1)
+    cy = y[triangulos].mean(axis=1)
+    tx = np.clip(np.floor((cx - minimo[0]) / tamanho[0]).astype(int), 0, nx - 1)
+    ty = np.clip(np.floor((cy - minimo[1]) / tamanho[1]).astype(int), 0, ny - 1)
+    manter = (tx == ix) & (ty == iy)
+    if aresta_maxima is not None:
+        xt, yt = x[triangulos], y[triangulos]
+        arestas = np.hypot(xt - np.roll(xt, 1, axis=1), yt - np.roll(yt, 1, axis=1))
+        manter &= arestas.max(axis=1) <= aresta_maxima
+    return triangulos[manter]
+
+def volumes_terreno(pontos, cota=0.0, inclinacao_x=0.0, inclinacao_y=0.0, origem=(0.0, 0.0),
+                    superficie=None, aresta_maxima=None, pontos_por_tile=2_000_000,
+                    margem=None, linhas_por_bloco=1_000_000):
+    """
+    Volumes de corte e aterro do terreno em relação a um plano ou a outra superfície
+    
+    A nuvem é dividida em tiles com cerca de pontos_por_tile pontos; cada
+    tile é triangulado (scipy.spatial.Delaunay) com uma margem de pontos
+    vizinhos e só os triângulos com centroide no seu núcleo são somados.
+    Com margem de algumas vezes o espaçamento médio, a malha no núcleo
+    coincide com a triangulação global e a memória fica limitada ao tile.
+    Os pontos são lidos em blocos, podendo vir de um np.memmap.
+    
+    Com uma segunda superfície, cada tile é triangulado com os pontos das
+    duas nuvens e ambas são interpoladas linearmente (em suas próprias
+    triangulações) nos vértices; só entram triângulos na área comum.
+    
+    Parameters:
+    -----------
+    pontos : array (n, 3)
+        Pontos X, Y, Z do terreno (m)
+    cota : float
+        Cota do plano de projeto na origem (m)
+    inclinacao_x, inclinacao_y : float
+        Inclinações do plano nas direções X e Y (m/m)
+    origem : tuple
+        Ponto (x, y) de referência do plano
+    superficie : array (m, 3), optional
+        Pontos da superfície de projeto (substitui o plano)
+    aresta_maxima : float, optional
+        Descarta triângulos com aresta maior que este valor (m), evitando
+        triângulos longos no contorno convexo
+    pontos_por_tile : int
+        Número aproximado de pontos por tile
+    margem : float, optional
+        Largura da margem dos tiles (m). Padrão: 10 espaçamentos médios
+    linhas_por_bloco : int
+        Linhas lidas por vez da nuvem
+    
+    Returns:
+    --------
+    dict : {'corte', 'aterro' (m³), 'area' (m²), 'triangulos', 'tiles'}
+        Positivo em corte: terreno acima da referência
+    """
+    if pontos.shape[0] < 3:
+        raise ValueError("São necessários ao menos três pontos")
+    minimo, tamanho, nx, ny, espacamento = _grade_tiles(pontos, pontos_por_tile, linhas_por_bloco)
+    margem = 10 * espacamento if margem is None else margem
+    
+    total = {'corte': 0.0, 'aterro': 0.0, 'area': 0.0, 'triangulos': 0, 'tiles': nx * ny}
+    for ix in range(nx):
+        for iy in range(ny):
+            tile = _pontos_tile(pontos, minimo, tamanho, ix, iy, margem, linhas_por_bloco)
+            if superficie is not None:
+                projeto = _pontos_tile(superficie, minimo, tamanho, ix, iy, margem, linhas_por_bloco)
+                if tile.shape[0] < 3 or projeto.shape[0] < 3:
+                    continue
+                vertices = np.unique(np.concatenate([tile[:, :2], projeto[:, :2]]), axis=0)
+                x, y = vertices.T
+            else:
+                if tile.shape[0] < 3:
+                    continue
+                x, y = tile[:, 0], tile[:, 1]
+                dz = tile[:, 2] - (cota + inclinacao_x * (x - origem[0]) + inclinacao_y * (y - origem[1]))
+            
+            # Tiles com pontos colineares não têm área a triangular
+            try:
+                if superficie is not None:
+                    dz = (LinearNDInterpolator(tile[:, :2], tile[:, 2])(vertices)
+                          - LinearNDInterpolator(projeto[:, :2], projeto[:, 2])(vertices))
+                triangulos = Delaunay(np.column_stack([x, y])).simplices
+            except QhullError:
+                continue
+            triangulos = _triangulos_nucleo(x, y, triangulos, minimo, tamanho, ix, iy, nx, ny, aresta_maxima)
+            triangulos = triangulos[np.all(np.isfinite(dz[triangulos]), axis=1)]
+            v = volumes_prismas(x, y, dz, triangulos)
+            total['corte'] += float(v['corte'].sum())
+            total['aterro'] += float(v['aterro'].sum())
+            total['area'] += float(v['area'].sum())
+            total['triangulos'] += int(triangulos.shape[0])
+    
+    if total['triangulos'] == 0:
+        raise ValueError("Pontos colineares ou insuficientes para triangular")
+    return total
+
+def criar_tin(x, y, z, celulas_por_triangulo=1.0):
+    """
+    Triangulação do levantamento com índice espacial em grade
+    
+    Cada triângulo é registrado nas células de uma grade regular cobertas
+    pelo seu retângulo envolvente (estrutura CSR: células ordenadas e
+    início de cada uma). A localização de um ponto consulta apenas os
+    triângulos da sua célula - custo esperado constante por consulta, em
+    vez da busca sequencial.
+    
+    Parameters:
+    -----------
+    x, y, z : array (n,)
+        Coordenadas dos pontos levantados (m)
+    celulas_por_triangulo : float
+        Número aproximado de células da grade por triângulo
+    
+    Returns:
+    --------
+    dict : {'x', 'y', 'z', 'triangulos', 'transformacao': afim baricêntrica
+            (scipy Delaunay.transform), 'origem', 'celula', 'nx', 'ny',
+            'inicio', 'indice': índice espacial}
+    """
+    x, y, z = (np.asarray(v, dtype=float) for v in (x, y, z))
+    if x.size < 3:
+        raise ValueError("São necessários ao menos três pontos")
+    try:
+        triangulacao = Delaunay(np.column_stack([x, y]))
+    except QhullError:
+        raise ValueError("Pontos colineares ou insuficientes para triangular")
+    triangulos = triangulacao.simplices
+    
+    origem = np.array([x.min(), y.min()])
+    extensao = np.maximum(np.array([x.max(), y.max()]) - origem, 1e-9)
+    celula = np.sqrt(extensao[0] * extensao[1] / (triangulos.shape[0] * celulas_por_triangulo))
+    nx, ny = (np.floor(extensao / celula).astype(int) + 1)
+    
+    # Faixa de células coberta por cada triângulo e expansão em pares (célula, triângulo)
+    xt, yt = x[triangulos], y[triangulos]
+    ix0 = np.floor((xt.min(axis=1) - origem[0]) / celula).astype(np.int64)
+    ix1 = np.floor((xt.max(axis=1) - origem[0]) / celula).astype(np.int64)
+    iy0 = np.floor((yt.min(axis=1) - origem[1]) / celula).astype(np.int64)
+    iy1 = np.floor((yt.max(axis=1) - origem[1]) / celula).astype(np.int64)
+    largura = ix1 - ix0 + 1
+    contagem = largura * (iy1 - iy0 + 1)
+    triangulo = np.repeat(np.arange(triangulos.shape[0]), contagem)
+    local = np.arange(contagem.sum()) - np.repeat(np.cumsum(contagem) - contagem, contagem)
+    celulas = (iy0[triangulo] + local // largura[triangulo]) * nx + ix0[triangulo] + local % largura[triangulo]
+    
+    ordem = np.argsort(celulas, kind='stable')
+    inicio = np.searchsorted(celulas[ordem], np.arange(nx * ny + 1))
+    
+    return {
+        'x': x,
+        'y': y,
+        'z': z,
+        'triangulos': triangulos,
+        'transformacao': triangulacao.transform,
+        'origem': origem,
+        'celula': celula,
+        'nx': int(nx),
+        'ny': int(ny),
+        'inicio': inicio,
+        'indice': triangulo[ordem]
+    }
+
+def localizar_pontos(tin, xq, yq, pontos_por_bloco=500_000):
+    """
+    Triângulo do TIN que contém cada ponto consultado
+    
+    Returns:
+    --------
+    tuple : (triângulo (-1 fora da malha), coordenadas baricêntricas (m, 3))
+    """
+    xq = np.atleast_1d(np.asarray(xq, dtype=float))
+    yq = np.atleast_1d(np.asarray(yq, dtype=float))
+    triangulo = np.full(xq.size, -1, dtype=np.int64)
+    baricentricas = np.full((xq.size, 3), np.nan)
+    T = tin['transformacao']
+    
+    for bloco in range(0, xq.size, pontos_por_bloco):
+        px = xq[bloco:bloco + pontos_por_bloco]
+        py = yq[bloco:bloco + pontos_por_bloco]
+        ix = np.floor((px - tin['origem'][0]) / tin['celula'])
+        iy = np.floor((py - tin['origem'][1]) / tin['celula'])
+        dentro = (ix >= 0) & (ix < tin['nx']) & (iy >= 0) & (iy < tin['ny'])
+        celula = np.where(dentro, iy * tin['nx'] + ix, 0).astype(np.int64)
+        inicio = tin['inicio'][celula]
+        contagem = np.where(dentro, tin['inicio'][celula + 1] - inicio, 0)
+        
+        # Candidatos: todos os triângulos da célula de cada ponto
+        consulta = np.repeat(np.arange(px.size), contagem)
+        candidato = tin['indice'][np.repeat(inicio - np.cumsum(contagem) + contagem, contagem)
+                                  + np.arange(contagem.sum())]
+        b = np.einsum('kij,kj->ki', T[candidato, :2], np.column_stack([px[consulta], py[consulta]])
+                      - T[candidato, 2])
+        b = np.column_stack([b, 1 - b.sum(axis=1)])
+        contem = np.all(b >= -1e-12, axis=1)
+        
+        primeiro, posicao = np.unique(consulta[contem], return_index=True)
+        escolhidos = np.flatnonzero(contem)[posicao]
+        triangulo[bloco + primeiro] = candidato[escolhidos]
+        baricentricas[bloco + primeiro] = b[escolhidos]
+    
+    return triangulo, baricentricas
+
+def cotas_tin(tin, xq, yq):
+    """
+    Cotas interpoladas no TIN (plano de cada triângulo)
+    
+    Returns:
+    --------
+    array : Cota em cada ponto (m); NaN fora da malha
+    """
+    triangulo, b = localizar_pontos(tin, xq, yq)
+    zt = tin['z'][tin['triangulos'][np.maximum(triangulo, 0)]]
+    return np.where(triangulo >= 0, np.sum(b * zt, axis=1), np.nan)
+
+def perfil_tin(tin, x_vertices, y_vertices, intervalo):
+    """
+    Perfil do terreno ao longo de uma polilinha
+    
+    A polilinha é amostrada a cada 'intervalo' metros (incluindo os
+    vértices). Para eixos com curvas, amostre antes a geometria (por
+    exemplo com avaliar_alinhamento) e passe os pontos como vértices.
+    
+    Returns:
+    --------
+    dict : {'distancia', 'x', 'y', 'cota': arrays ao longo da polilinha}
+    """
+    xv = np.asarray(x_vertices, dtype=float)
+    yv = np.asarray(y_vertices, dtype=float)
+    if xv.size < 2:
+        raise ValueError("A polilinha deve ter ao menos dois vértices")
+    if intervalo <= 0:
+        raise ValueError("O intervalo deve ser positivo")
+    acumulada = np.concatenate([[0.0], np.cumsum(np.hypot(np.diff(xv), np.diff(yv)))])
+    distancia = np.union1d(np.arange(0.0, acumulada[-1], intervalo), acumulada)
+    x = np.interp(distancia, acumulada, xv)
+    y = np.interp(distancia, acumulada, yv)
+    return {'distancia': distancia, 'x': x, 'y': y, 'cota': cotas_tin(tin, x, y)}
+
+def curvas_nivel(tin, equidistancia, intervalo_mestra=5):
+    """
+    Curvas de nível do TIN por interseção dos planos horizontais com os triângulos
+    
+    Para cada triângulo, as cotas entre o mínimo e o máximo dos vértices
+    são expandidas (np.repeat) e as duas arestas cortadas por cada nível
+    dão um segmento. Vértices exatamente na cota do nível são tratados
+    como acima dele.
+    
+    Parameters:
+    -----------
+    tin : dict
+        Resultado de criar_tin
+    equidistancia : float
+        Distância vertical entre curvas (m)
+    intervalo_mestra : int
+        Uma curva mestra a cada intervalo_mestra curvas
+    
+    Returns:
+    --------
+    dict : {'x', 'y': extremos dos segmentos (k, 2), 'cota', 'mestra'}
+    """
+    if equidistancia <= 0:
+        raise ValueError("A equidistância deve ser positiva")
+    t = tin['triangulos']
+    xt, yt, zt = tin['x'][t], tin['y'][t], tin['z'][t]
+    # Níveis com zmin < c ≤ zmax: ao menos um vértice abaixo e um acima (z ≥ c)
+    primeiro = np.floor(zt.min(axis=1) / equidistancia).astype(np.int64) + 1
+    ultimo = np.floor(zt.max(axis=1) / equidistancia).astype(np.int64)
+    contagem = np.maximum(ultimo - primeiro + 1, 0)
+    
+    triangulo = np.repeat(np.arange(t.shape[0]), contagem)
+    nivel = primeiro[triangulo] + np.arange(contagem.sum()) - np.repeat(np.cumsum(contagem) - contagem, contagem)
+    cota = nivel * equidistancia
+    
+    # Arestas (0-1, 1-2, 2-0) com vértices em lados opostos do nível
+    xa, ya, za = xt[triangulo], yt[triangulo], zt[triangulo]
+    xb, yb, zb = (np.roll(v, -1, axis=1) for v in (xa, ya, za))
+    acima = za >= cota[:, None]
+    cruza = acima != np.roll(acima, -1, axis=1)
+    s = (cota[:, None] - za) / np.where(cruza, zb - za, 1.0)
+    px = xa + s * (xb - xa)
+    py = ya + s * (yb - ya)
+    arestas = np.argsort(~cruza, axis=1, kind='stable')[:, :2]
+    
+    return {
+        'x': np.take_along_axis(px, arestas, axis=1),
+        'y': np.take_along_axis(py, arestas, axis=1),
+        'cota': cota,
+        'mestra': nivel % intervalo_mestra == 0
+    }
@@ -0,0 +1,416 @@
+"""
+Topografia - poligonais e redes planimétricas
+Coordenadas, erro de fechamento e compensação linear (Bowditch e Transit)
+calculadas com somas cumulativas; ajustamento de redes por mínimos
+quadrados com equações normais esparsas; áreas, perímetros e centroides
+de lotes em lote
+"""
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import splu
+
+def ajustar_poligonal(distancias, azimutes, x0, y0, x_final=None, y_final=None, metodo='bowditch'):
+    """
+    Calcula e compensa uma poligonal a partir das distâncias e azimutes
+    
+    O erro de fechamento é a diferença entre o ponto final calculado e o
+    ponto de chegada conhecido (o próprio ponto inicial em poligonais
+    fechadas). Ele é distribuído entre os lados proporcionalmente às
+    distâncias (Bowditch, regra da bússola) ou aos valores absolutos das
+    projeções ΔX e ΔY (Transit), e as coordenadas compensadas são obtidas
+    por np.cumsum dos incrementos corrigidos.
+    
+    Parameters:
+    -----------
+    distancias : array (n,)
+        Distâncias horizontais dos lados (m)
+    azimutes : array (n,)
+        Azimutes dos lados (graus, a partir do Norte, sentido horário)
+    x0, y0 : float
+        Coordenadas do ponto de partida (m)
+    x_final, y_final : float, optional
+        Coordenadas do ponto de chegada conhecido (poligonal aberta
+        amarrada). Padrão: ponto de partida (poligonal fechada)
+    metodo : str
+        'bowditch' ou 'transit'
+    
+    Returns:
+    --------
+    dict : {'dx', 'dy': projeções (m), 'x', 'y': coordenadas sem
+            compensação (n + 1 pontos), 'erro_x', 'erro_y', 'erro_linear'
+            (m), 'perimetro' (m), 'precisao' (denominador de 1:M),
+            'correcao_x', 'correcao_y' (m), 'x_ajustado', 'y_ajustado',
+            'distancia_ajustada', 'azimute_ajustado' (graus)}
+    """
+    D = np.asarray(distancias, dtype=float)
+    Az = np.radians(np.asarray(azimutes, dtype=float))
+    if D.ndim != 1 or D.size != Az.size or D.size == 0:
+        raise ValueError("Informe uma distância e um azimute para cada lado")
+    if np.any(~np.isfinite(D)) or np.any(~np.isfinite(Az)):
+        raise ValueError("As distâncias e os azimutes devem ser valores numéricos")
+    if np.any(D <= 0):
+        raise ValueError("As distâncias devem ser positivas")
+    x_final = x0 if x_final is None else x_final
+    y_final = y0 if y_final is None else y_final
+    
+    dx = D * np.sin(Az)
+    dy = D * np.cos(Az)
+    x = x0 + np.concatenate([[0.0], np.cumsum(dx)])
+    y = y0 + np.concatenate([[0.0], np.cumsum(dy)])
+    
+    erro_x = x[-1] - x_final
+    erro_y = y[-1] - y_final
+    erro_linear = float(np.hypot(erro_x, erro_y))
+    perimetro = float(D.sum())
+    
+    if metodo == 'bowditch':
+        peso_x = peso_y = D / perimetro
+    elif metodo == 'transit':
+        soma_x, soma_y = np.abs(dx).sum(), np.abs(dy).sum()
+        peso_x = np.abs(dx) / soma_x if soma_x > 0 else np.full(D.size, 1 / D.size)
+        peso_y = np.abs(dy) / soma_y if soma_y > 0 else np.full(D.size, 1 / D.size)
+    else:
+        raise ValueError(f"Método '{metodo}' não suportado")
+    
+    correcao_x = -erro_x * peso_x
+    correcao_y = -erro_y * peso_y
+    dx_ajustado = dx + correcao_x
+    dy_ajustado = dy + correcao_y
+    
+    return {
+        'dx': dx,
+        'dy': dy,
+        'x': x,
+        'y': y,
+        'erro_x': float(erro_x),
+        'erro_y': float(erro_y),
+        'erro_linear': erro_linear,
+        'perimetro': perimetro,
+        'precisao': perimetro / erro_linear if erro_linear > 0 else float('inf'),
+        'correcao_x': correcao_x,
+        'correcao_y': correcao_y,
+        'x_ajustado': x0 + np.concatenate([[0.0], np.cumsum(dx_ajustado)]),
+        'y_ajustado': y0 + np.concatenate([[0.0], np.cumsum(dy_ajustado)]),
+        'distancia_ajustada': np.hypot(dx_ajustado, dy_ajustado),
+        'azimute_ajustado': np.degrees(np.mod(np.arctan2(dx_ajustado, dy_ajustado), 2 * np.pi))
+    }
+
+def propriedades_poligonos(x, y, inicio):
+    """
+    Área, perímetro e centroide de muitos polígonos fechados de uma vez
+    
+    Os vértices de todos os polígonos ficam em arrays únicos e 'inicio'
+    indica onde começa cada polígono. As somas por polígono (fórmula de
+    Gauss/shoelace, lados e momentos) são feitas com np.add.reduceat, sem
+    laço em Python. As coordenadas são reduzidas ao primeiro vértice de
+    cada polígono para preservar a precisão com coordenadas UTM.
+    
+    Parameters:
+    -----------
+    x, y : array (n,)
+        Vértices de todos os polígonos, em ordem (m). Repetir o primeiro
+        vértice no fim é opcional
+    inicio : array (k,)
+        Índice do primeiro vértice de cada polígono (crescente)
+    
+    Returns:
+    --------
+    dict : {'area' (m²), 'perimetro' (m), 'centroide_x', 'centroide_y' (m),
+            'horario': sentido dos vértices}
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    inicio = np.asarray(inicio, dtype=np.int64)
+    if x.size != y.size:
+        raise ValueError("As listas de X e Y devem ter o mesmo tamanho")
+    if inicio.size == 0 or inicio[0] != 0:
+        raise ValueError("O primeiro polígono deve começar no índice 0")
+    fim = np.append(inicio[1:], x.size)
+    vertices = fim - inicio
+    if np.any(vertices < 3):
+        raise ValueError("Cada polígono deve ter ao menos três vértices")
+    
+    # Vértice seguinte, fechando cada polígono no seu primeiro vértice
+    seguinte = np.arange(1, x.size + 1)
+    seguinte[fim - 1] = inicio
+    xr = x - np.repeat(x[inicio], vertices)
+    yr = y - np.repeat(y[inicio], vertices)
+    xs, ys = xr[seguinte], yr[seguinte]
+    
+    produto = xr * ys - xs * yr
+    area_dupla = np.add.reduceat(produto, inicio)
+    perimetro = np.add.reduceat(np.hypot(xs - xr, ys - yr), inicio)
+    if np.any(area_dupla == 0):
+        raise ValueError("Há polígonos com área nula")
+    centroide_x = np.add.reduceat((xr + xs) * produto, inicio) / (3 * area_dupla)
+    centroide_y = np.add.reduceat((yr + ys) * produto, inicio) / (3 * area_dupla)
+    
+    return {
+        'area': np.abs(area_dupla) / 2,
+        'perimetro': perimetro,
+        'centroide_x': x[inicio] + centroide_x,
+        'centroide_y': y[inicio] + centroide_y,
+        'horario': area_dupla < 0
+    }
+
+def _dados_observacoes(observacoes, campos):
+    """Arrays de um grupo de observações (vazios se o grupo não foi informado)"""
+    if observacoes is None:
+        return {campo: np.zeros(0, dtype=int if campo in ('de', 'para') else float) for campo in campos}
+    dados = {campo: np.asarray(observacoes[campo], dtype=int if campo in ('de', 'para') else float)
+             for campo in campos}
+    if len({v.size for v in dados.values()}) > 1:
+        raise ValueError("Todos os campos de um grupo de observações devem ter o mesmo tamanho")
+    return dados
+
+def _inversa_seletiva(fatoracao):
+    """
+    Elementos de N⁻¹ no padrão de esparsidade do fator (inversão seletiva de Takahashi)
+    
+    Com N simétrica positiva definida e pivôs na diagonal, a fatoração LU
+    é N' = L·D·Lᵀ (N' permutada). Percorrendo as colunas de trás para
+    frente, Z = N'⁻¹ satisfaz Z[s, j] = -Z[s, s]·L[s, j] e
+    Z[j, j] = 1/dⱼ - L[s, j]ᵀ·Z[s, j], em que s é o padrão da coluna j de
+    L abaixo da diagonal; todos os termos necessários já pertencem ao
+    padrão. Isso inclui os blocos de cada ponto e os pares de incógnitas
+    de uma mesma observação, sem formar N⁻¹ completa.
+    
+    Returns:
+    --------
+    function : inversa(linhas, colunas) -> elementos de N⁻¹ (índices originais)
+    """
+    L = fatoracao.L.tocsc()
+    L.sort_indices()
+    n = L.shape[0]
+    d = fatoracao.U.diagonal()
+    indptr, indices, dados = L.indptr, L.indices, L.data
+    chaves = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr)) * n + indices
+    z = np.zeros(indices.size)
+    
+    # Z[s, s] da coluna anterior: dentro de um supernó (s = {j + 1} ∪ padrão
+    # da coluna j + 1) o bloco é reaproveitado, sem novas buscas
+    s_anterior, Z_anterior = None, None
+    for j in range(n - 1, -1, -1):
+        inicio, fim = indptr[j], indptr[j + 1]
+        s = indices[inicio + 1:fim]
+        l = dados[inicio + 1:fim]
+        if s.size and s_anterior is not None and s[0] == j + 1 and np.array_equal(s[1:], s_anterior):
+            z_p = z[indptr[j + 1]:indptr[j + 2]]
+            Z_ss = np.empty((s.size, s.size))
+            Z_ss[0] = z_p
+            Z_ss[1:, 0] = z_p[1:]
+            Z_ss[1:, 1:] = Z_anterior
+        else:
+            chave = np.minimum.outer(s, s).astype(np.int64) * n + np.maximum.outer(s, s)
+            Z_ss = z[np.searchsorted(chaves, chave)]
+        z_s = -Z_ss @ l
+        z[inicio + 1:fim] = z_s
+        z[inicio] = 1 / d[j] - l @ z_s
+        s_anterior, Z_anterior = s, Z_ss
+    
+    def inversa(linhas, colunas):
+        r, c = fatoracao.perm_c[linhas], fatoracao.perm_c[colunas]
+        chave = np.minimum(r, c).astype(np.int64) * n + np.maximum(r, c)
+        pos = np.minimum(np.searchsorted(chaves, chave), chaves.size - 1)
+        return np.where(chaves[pos] == chave, z[pos], np.nan)
+    
+    return inversa
+
+def ajustar_rede(x, y, fixos, distancias=None, direcoes=None, gnss=None,
+                 max_iteracoes=10, tolerancia=1e-6, limite_w=3.29, calcular_precisao=True):
+    """
+    Ajustamento de rede planimétrica pelo método dos mínimos quadrados (paramétrico)
+    
+    Incógnitas: correções às coordenadas dos pontos livres e uma orientação
+    por estação com direções. A matriz A é montada em formato esparso a
+    partir dos vetores de derivadas de todas as observações; as equações
+    normais N = AᵀPA são resolvidas por fatoração LU esparsa em modo
+    simétrico (ordenação de grau mínimo) a cada iteração de Gauss-Newton.
+    Ao final, a variância a posteriori, as elipses de erro dos pontos e os
+    resíduos padronizados (teste w de Baarda, com σ0 = 1 a priori) são
+    obtidos dos elementos necessários de N⁻¹ por inversão seletiva.
+    
+    Parameters:
+    -----------
+    x, y : array (n,)
+        Coordenadas aproximadas de todos os pontos (m)
+    fixos : array of bool (n,)
+        Pontos de coordenadas conhecidas
+    distancias : dict, optional
+        {'de', 'para': índices dos pontos, 'valor': distância (m),
+         'desvio': desvio-padrão (m)}
+    direcoes : dict, optional
+        {'de' (estação), 'para' (ponto visado), 'valor': leitura (graus),
+         'desvio': desvio-padrão (segundos de arco)}
+    gnss : dict, optional
+        Vetores GNSS {'de', 'para', 'dx', 'dy' (m), 'desvio_x', 'desvio_y' (m)}
+    max_iteracoes : int
+        Número máximo de iterações
+    tolerancia : float
+        Maior correção de coordenada para convergência (m)
+    limite_w : float
+        Valor crítico do teste w (3,29 para α = 0,1%)
+    calcular_precisao : bool
+        Se False, omite as elipses e os resíduos padronizados (mais rápido)
+    
+    Returns:
+    --------
+    dict : {'x', 'y': coordenadas ajustadas, 'orientacao': por estação com
+            direções (graus), 'estacoes', 'iteracoes', 'graus_liberdade',
+            'sigma0_2': variância a posteriori, 'observacoes': {'tipo'
+            (0 distância, 1 direção, 2 GNSS X, 3 GNSS Y), 'residuo' (m; segundos
+            nas direções), 'w', 'redundancia', 'suspeita'}, 'sigma_x',
+            'sigma_y', 'elipse_a', 'elipse_b', 'elipse_azimute' (graus)}
+        Os pontos fixos têm desvios e elipses nulos.
+    """
+    x = np.asarray(x, dtype=float).copy()
+    y = np.asarray(y, dtype=float).copy()
+    fixos = np.asarray(fixos, dtype=bool)
+    n = x.size
+    dist = _dados_observacoes(distancias, ('de', 'para', 'valor', 'desvio'))
+    dire = _dados_observacoes(direcoes, ('de', 'para', 'valor', 'desvio'))
+    vet = _dados_observacoes(gnss, ('de', 'para', 'dx', 'dy', 'desvio_x', 'desvio_y'))
+    
+    for grupo in (dist, dire, vet):
+        if np.any((grupo['de'] < 0) | (grupo['de'] >= n) | (grupo['para'] < 0) | (grupo['para'] >= n)):
+            raise ValueError("Observação referenciando ponto inexistente")
+        if np.any(grupo['de'] == grupo['para']):
+            raise ValueError("Observação com pontos inicial e final iguais")
+    if np.any(dist['desvio'] <= 0) or np.any(dire['desvio'] <= 0) or \
+            np.any(vet['desvio_x'] <= 0) or np.any(vet['desvio_y'] <= 0):
+        raise ValueError("Os desvios-padrão devem ser positivos")
+    
+    # Incógnitas: (dx, dy) de cada ponto livre, seguidas das orientações das estações
+    n_livres = int((~fixos).sum())
+    primeira_coluna = np.full(n, -1)
+    primeira_coluna[~fixos] = 2 * np.arange(n_livres)
+    estacoes, estacao = np.unique(dire['de'], return_inverse=True)
+    u = 2 * n_livres + estacoes.size
+    
+    def coluna(pontos, componente):
+        """Coluna da incógnita (componente 0 = x, 1 = y); -1 para pontos fixos"""
+        return np.where(fixos[pontos], -1, primeira_coluna[pontos] + componente)
+    
+    n_dist, n_dire, n_vet = dist['valor'].size, dire['valor'].size, vet['dx'].size
+    n_obs = n_dist + n_dire + 2 * n_vet
+    if u == 0 or n_obs <= u:
+        raise ValueError(f"Rede sem redundância: {n_obs} observações para {u} incógnitas")
+    
+    tipo = np.repeat(np.arange(4), [n_dist, n_dire, n_vet, n_vet])
+    observado = np.concatenate([dist['valor'], np.radians(dire['valor']), vet['dx'], vet['dy']])
+    desvio = np.concatenate([dist['desvio'], np.radians(dire['desvio'] / 3600), vet['desvio_x'], vet['desvio_y']])
+    P = 1 / desvio**2
+    
+    # Índices e colunas fixos ao longo das iterações
+    de = np.concatenate([dist['de'], dire['de'], vet['de'], vet['de']])
+    para = np.concatenate([dist['para'], dire['para'], vet['para'], vet['para']])
+    linhas = np.arange(n_obs)
+    colunas = np.stack([coluna(para, 0), coluna(para, 1), coluna(de, 0), coluna(de, 1),
+                        np.concatenate([np.full(n_dist, -1), 2 * n_livres + estacao, np.full(2 * n_vet, -1)])])
+    usado = colunas >= 0
+    
+    e_dist, e_dire = tipo == 0, tipo == 1
+    e_gx, e_gy = tipo == 2, tipo == 3
+    
+    # Orientação inicial: média circular de (azimute - leitura) em cada estação
+    z = np.zeros(estacoes.size)
+    if estacoes.size:
+        diferenca = np.arctan2(x[dire['para']] - x[dire['de']], y[dire['para']] - y[dire['de']]) - np.radians(dire['valor'])
+        z = np.arctan2(np.bincount(estacao, np.sin(diferenca)), np.bincount(estacao, np.cos(diferenca)))
+    z_obs = np.concatenate([np.zeros(n_dist), z[estacao], np.zeros(2 * n_vet)])
+    
+    def linearizar():
+        """Valores calculados e derivadas (colunas de A) de todas as observações"""
+        dx, dy = x[para] - x[de], y[para] - y[de]
+        d2 = dx**2 + dy**2
+        d = np.sqrt(d2)
+        calculado = np.select([e_dist, e_dire, e_gx], [d, np.arctan2(dx, dy) - z_obs, dx], dy)
+        
+        dxj = np.select([e_dist, e_dire, e_gx], [dx / d, dy / d2, np.ones(n_obs)], 0.0)
+        dyj = np.select([e_dist, e_dire, e_gy], [dy / d, -dx / d2, np.ones(n_obs)], 0.0)
+        derivadas = np.stack([dxj, dyj, -dxj, -dyj, np.where(e_dire, -1.0, 0.0)])
+        return calculado, derivadas
+    
+    def residuo_angular(v):
+        return np.where(e_dire, np.mod(v + np.pi, 2 * np.pi) - np.pi, v)
+    
+    for iteracao in range(1, max_iteracoes + 1):
+        calculado, derivadas = linearizar()
+        l = residuo_angular(observado - calculado)
+        A = sparse.csr_matrix((derivadas[usado], (np.broadcast_to(linhas, colunas.shape)[usado], colunas[usado])),
+                              shape=(n_obs, u))
+        N = (A.T @ sparse.diags(P) @ A).tocsc()
+        try:
+            fatoracao = splu(N, permc_spec='MMD_AT_PLUS_A', diag_pivot_thresh=0.0,
+                             options=dict(SymmetricMode=True))
+        except RuntimeError:
+            raise ValueError("Equações normais singulares: verifique os pontos fixos e a geometria da rede")
+        delta = fatoracao.solve(A.T @ (P * l))
+        
+        x[~fixos] += delta[0:2 * n_livres:2]
+        y[~fixos] += delta[1:2 * n_livres:2]
+        z += delta[2 * n_livres:]
+        z_obs[e_dire] = z[estacao]
+        if np.abs(delta[:2 * n_livres]).max(initial=0.0) < tolerancia:
+            break
+    
+    calculado, _ = linearizar()
+    v = residuo_angular(calculado - observado)
+    graus_liberdade = n_obs - u
+    sigma0_2 = float((P * v**2).sum() / graus_liberdade)
+    
+    resultado = {
+        'x': x,
+        'y': y,
+        'orientacao': np.degrees(np.mod(z, 2 * np.pi)),
+        'estacoes': estacoes,
+        'iteracoes': iteracao,
+        'graus_liberdade': graus_liberdade,
+        'sigma0_2': sigma0_2,
+        'observacoes': {
+            'tipo': tipo,
+            'residuo': np.where(e_dire, np.degrees(v) * 3600, v)
+        }
+    }
+    if not calcular_precisao:
+        return resultado
+    
+    inversa = _inversa_seletiva(fatoracao)
+    
+    # aₖ·N⁻¹·aₖᵀ somando os pares de incógnitas de cada observação
+    q_obs = np.zeros(n_obs)
+    for a in range(colunas.shape[0]):
+        for b in range(a, colunas.shape[0]):
+            par = usado[a] & usado[b]
+            termo = derivadas[a, par] * derivadas[b, par] * inversa(colunas[a, par], colunas[b, par])
+            q_obs[par] += termo if a == b else 2 * termo
+    
+    # Resíduos padronizados: Qvv = P⁻¹ - A·N⁻¹·Aᵀ (diagonal)
+    q_vv = np.maximum(1 / P - q_obs, 0.0)
+    redundancia = P * q_vv
+    w = np.where(q_vv > 1e-12 / P, v / np.sqrt(np.where(q_vv > 0, q_vv, 1.0)), 0.0)
+    resultado['observacoes'].update({
+        'w': w,
+        'redundancia': redundancia,
+        'suspeita': np.abs(w) > limite_w
+    })
+    
+    # Elipses de erro a partir dos blocos 2×2 de σ0²·N⁻¹
+    qxx = np.zeros(n)
+    qyy = np.zeros(n)
+    qxy = np.zeros(n)
+    cx = primeira_coluna[~fixos]
+    qxx[~fixos] = inversa(cx, cx)
+    qyy[~fixos] = inversa(cx + 1, cx + 1)
+    qxy[~fixos] = inversa(cx, cx + 1)
+    media = (qxx + qyy) / 2
+    raio = np.sqrt(((qxx - qyy) / 2)**2 + qxy**2)
+    resultado.update({
+        'sigma_x': np.sqrt(sigma0_2 * qxx),
+        'sigma_y': np.sqrt(sigma0_2 * qyy),
+        'elipse_a': np.sqrt(sigma0_2 * (media + raio)),
+        'elipse_b': np.sqrt(sigma0_2 * np.maximum(media - raio, 0.0)),
+        'elipse_azimute': np.degrees(np.mod(0.5 * np.arctan2(2 * qxy, qyy - qxx), np.pi))
+    })
+    return resultado